@@ -0,0 +1,86 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: benchmark_pricing
+# Usage: python benchmark_pricing.py [ORDER COUNT ...]       (default: 10000 100000 1000000)
+#
+# Purpose: Times compute_custom_algorithm.run() (one order at a time) against compute_custom_algorithm.run_vectorized() (whole
+#   columns at a time) on order lists of different sizes, and checks that both produce byte-identical payloads (their pickles are
+#   compared) before reporting the times.
+#
+# Description: The sample order list only has a few hundred orders, so larger order lists are made from it: each synthetic order is
+#   a copy of a random sample order (so its territory and Job Type are always in the fee schedule) with a new Reference ID and random
+#   Site Size, GLA, Appraised Value, Rush and Fee Charged cells written the same way the export writes them ("16117 sf", "2,261",
+#   "N/A", ...). Half of the orders keep their sample notes and the other half get a unique note, since real notes are mostly unique.
+#   The random seed is fixed, so every run prices the same orders. Building the data structures isn't timed, only the pricing.
+#
+# NOTE: run() at 1,000,000 orders takes a while (and a few GB of memory for the linked list), pass smaller counts for a quick check.
+#
+#########################################################################################################
+import pickle # import pickle module, used to compare the payloads byte for byte
+import random # import random module, used to make synthetic orders
+import sys    # import sys module, used for the command line order counts
+import time   # import time module, used for timing
+import read_data_from_excel
+import create_hashMap
+import create_linkedList
+import compute_custom_algorithm
+
+DEFAULT_ORDER_COUNTS = [ 10000, 100000, 1000000 ]
+RANDOM_SEED = 2018
+
+# This function returns the cells of a random Site Size, in acres or square feet, or "N/A"
+def _randomSiteSize(generator):
+    choice = generator.randint(0, 9)
+    if(choice == 0):
+        return "N/A"
+    if(choice <= 3):
+        return str(round(generator.uniform(0.1, 12), 2)) + " ac"
+    return "{:,}".format(generator.randint(2000, 400000)) + generator.choice([ " sf", " sq. ft" ])
+
+# This function returns an array of arrays holding a title row and 'orderCount' synthetic orders made from the sample orders
+def make_orders(sampleOrders, orderCount, seed=RANDOM_SEED):
+    generator = random.Random(seed)
+    titleRow = sampleOrders[0]
+    samples = sampleOrders[1:]
+    orders = [ titleRow ]
+    for orderNumber in range(orderCount):
+        rowArray = list(generator.choice(samples))
+        rowArray[0] = str(100000000 + orderNumber)                                                        # Reference ID
+        rowArray[11] = generator.choice([ "No", "No", "No", "Yes" ])                                      # Rush
+        rowArray[12] = _randomSiteSize(generator)                                                         # Site Size
+        rowArray[13] = generator.choice([ "N/A", str(generator.randint(600, 6000)), "{:,}".format(generator.randint(600, 6000)) ]) # GLA
+        rowArray[14] = str(generator.randint(90000, 4500000))                                             # Appraised Value
+        rowArray[16] = str(generator.randint(300, 2500))                                                  # Fee Charged
+        if(generator.randint(0, 1) == 1):                                                                 # a unique note
+            rowArray[19] = rowArray[19] + " order " + str(orderNumber)
+        orders.append(rowArray)
+    return orders
+
+# This function times one pricing function on a fresh linked list package and returns (payload, seconds)
+def _timeRun(runFunction, hash_map_package, orders):
+    linked_list_package = create_linkedList.prepare_data_structure(orders)
+    start = time.perf_counter()
+    payload = runFunction(hash_map_package, linked_list_package)
+    return payload, time.perf_counter() - start
+
+def main(argv=None):
+    if(argv == None):
+        argv = sys.argv[1:]
+    orderCounts = [ int(argument) for argument in argv ] or DEFAULT_ORDER_COUNTS
+
+    hash_map_package = create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+    sampleOrders = read_data_from_excel.get_excel_data("orderList.xlsx")
+
+    print("{:>10} {:>12} {:>16} {:>9} {:>10} {:>8}".format("orders", "run() s", "run_vectorized() s", "speedup", "increases", "rushes"))
+    for orderCount in orderCounts:
+        orders = make_orders(sampleOrders, orderCount)
+        scalarPayload, scalarSeconds = _timeRun(compute_custom_algorithm.run, hash_map_package, orders)
+        vectorPayload, vectorSeconds = _timeRun(compute_custom_algorithm.run_vectorized, hash_map_package, orders)
+        if(pickle.dumps(scalarPayload) != pickle.dumps(vectorPayload)):
+            print("Error: run() and run_vectorized() payloads differ for", orderCount, "orders")
+            exit(1)
+        print("{:>10} {:>12.3f} {:>18.3f} {:>8.1f}x {:>10} {:>8}".format(orderCount, scalarSeconds, vectorSeconds, scalarSeconds / vectorSeconds,
+                                                                        len(vectorPayload[0]) - 1, len(vectorPayload[1]) - 1))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: columnSchema
+#
+# Overview: A column schema says what type of value each column of a spreadsheet holds, so cells can be converted
+#   once, while the file is being read, instead of being read as text and re-parsed every time they are used. Without
+#   a schema every cell comes back as text ("608950", "2,261", "No") and the algorithm has to strip commas and call
+#   int()/float() on the same cells for every order it prices. With a schema the numeric columns arrive as native
+#   numbers, dates arrive as datetimes and Yes/No columns arrive as True/False.
+#
+# Description: A schema is a dictionary of column -> type. The column can be the column's index (0 is the left most
+#   column) or its title (trailing spaces are ignored, 'Client ' and 'Client' are the same title). The type is one of
+#   the names below, or any function that accepts a raw cell value and returns the converted value:
+#       "int"   - a whole number. Commas are removed from text ("2,261" -> 2261)
+#       "float" - a decimal number. Commas are removed from text
+#       "str"   - text. Whole numbers read from excel are returned without the decimal (98065.0 -> "98065")
+#       "date"  - a datetime.datetime. Excel serial numbers, datetimes and "YYYY-MM-DD" or "MM/DD/YYYY" text are accepted
+#       "bool"  - True/False. "Yes"/"No", "Y"/"N", "True"/"False" and 1/0 are accepted (upper or lower case)
+#   Blank cells and "N/A" cells are missing values and are converted to None for every type except "str" (which returns
+#   ""). Any other cell that can't be converted raises a ValueError naming the column, so bad data is found at read time.
+#   Columns that aren't in the schema are converted the way the readers always have (see read_data_from_excel.py).
+#
+#   A schema is compiled against a sheet's title row once (compile()), which returns one converter function per
+#   column. The readers then call convertRow() for every row, which only calls the converters (no type lookups per cell).
+#
+# Example Usage:
+#   schema = columnSchema({ "GLA" : "int", 14 : "int", "Rush" : "bool", "Order Date" : "date" })
+#   spreadsheetArray = read_data_from_excel.get_excel_data("orderList.xlsx", schema=schema)
+#
+#########################################################################################################
+import datetime # import datetime module, used for "date" columns
+
+MISSING_VALUES = ("", "N/A") # cell text that means "no value"
+
+# Base dates for excel serial numbers (datemode 0 is the 1900 date system used by windows excel, datemode 1 is the 1904 system)
+_EXCEL_EPOCHS = { 0 : datetime.datetime(1899, 12, 30), 1 : datetime.datetime(1904, 1, 1) }
+
+# Helper function: return the text of a raw cell, without surrounding spaces (None for a missing value)
+def _cellText(value):
+    if(value == None):
+        return None
+    text = str(value).strip()
+    if(text in MISSING_VALUES):
+        return None
+    return text
+
+# Converter for "int" columns
+def _toInt(value):
+    if(isinstance(value, bool)):
+        return int(value)
+    if(isinstance(value, int)):
+        return value
+    if(isinstance(value, float)):
+        return int(value)
+    text = _cellText(value)
+    if(text == None):
+        return None
+    return int(float(text.replace(",", "")))
+
+# Converter for "float" columns
+def _toFloat(value):
+    if(isinstance(value, (int, float))):
+        return float(value)
+    text = _cellText(value)
+    if(text == None):
+        return None
+    return float(text.replace(",", ""))
+
+# Converter for "str" columns
+def _toStr(value):
+    if(value == None):
+        return ""
+    if(isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    return str(value)
+
+# Converter for "bool" columns
+_BOOL_TEXT = { "yes" : True, "y" : True, "true" : True, "1" : True, "no" : False, "n" : False, "false" : False, "0" : False }
+def _toBool(value):
+    if(isinstance(value, (bool, int, float))):
+        return value != 0
+    text = _cellText(value)
+    if(text == None):
+        return None
+    result = _BOOL_TEXT.get(text.lower())
+    if(result == None):
+        raise ValueError("'" + text + "' is not a Yes/No value")
+    return result
+
+# Converter factory for "date" columns (the datemode is the excel workbook's date system, see _EXCEL_EPOCHS)
+def _makeToDate(datemode):
+    epoch = _EXCEL_EPOCHS[datemode]
+    def _toDate(value):
+        if(isinstance(value, datetime.datetime)):
+            return value
+        if(isinstance(value, datetime.date)):
+            return datetime.datetime(value.year, value.month, value.day)
+        if(isinstance(value, (int, float))):
+            return epoch + datetime.timedelta(milliseconds=round(value * 86400000))  # rounded to the millisecond (excel's precision), the same as openpyxl
+        text = _cellText(value)
+        if(text == None):
+            return None
+        try : return epoch + datetime.timedelta(milliseconds=round(float(text) * 86400000))  # a serial number read as text (the readers return "43346")
+        except ValueError : pass
+        try : return datetime.datetime.fromisoformat(text)            # "2018-09-04"
+        except ValueError : pass
+        return datetime.datetime.strptime(text, "%m/%d/%Y")          # "09/04/2018"
+    return _toDate
+
+_CONVERTERS = { "int" : _toInt, "float" : _toFloat, "str" : _toStr, "bool" : _toBool }
+TYPE_NAMES = ("int", "float", "str", "date", "bool")
+
+#########################################################################################################
+# columnSchema class: This class holds the column -> type schema and compiles it against a title row
+#########################################################################################################
+class columnSchema:
+    # Constructor to initialize class' local variables (an unknown type name raises a ValueError)
+    def __init__(self, schema):
+        self.schema = dict(schema)
+        for column in self.schema:
+            columnType = self.schema[column]
+            if(not callable(columnType) and columnType not in TYPE_NAMES):
+                raise ValueError("Unknown column type '" + str(columnType) + "' for column '" + str(column) + "', expected one of: " + ", ".join(TYPE_NAMES))
+
+    # -> getColumnType Function: return the type for a column (by index and title), or None if the column isn't in the schema
+    def getColumnType(self, columnIndex, title):
+        columnType = self.schema.get(columnIndex)
+        if(columnType == None):
+            for column in self.schema:
+                if(isinstance(column, str) and column.strip() == str(title).strip()):
+                    return self.schema[column]
+        return columnType
+
+    # -> getCacheKey Function: return text that identifies the schema (used to tell cached reads with different schemas apart, see parsed_input_cache.py)
+    def getCacheKey(self):
+        items = []
+        for column in self.schema:
+            columnType = self.schema[column]
+            if(callable(columnType)):
+                columnType = getattr(columnType, "__module__", "") + "." + getattr(columnType, "__qualname__", repr(columnType))
+            items.append(repr(column) + ":" + str(columnType))
+        return ",".join(sorted(items))
+
+    # -> compile Function:
+    # - return one converter per column of the title row. Untyped columns get 'defaultConverter'. A schema column that isn't in the title row raises a KeyError.
+    def compile(self, titleRow, defaultConverter, datemode=0):
+        titles = [ str(title).strip() for title in titleRow ]
+        for column in self.schema:
+            if(isinstance(column, int) and not (0 <= column < len(titles))):
+                raise KeyError("Schema column " + str(column) + " is out of range, the sheet has " + str(len(titles)) + " columns")
+            if(isinstance(column, str) and column.strip() not in titles):
+                raise KeyError("Schema column '" + column + "' is not in the title row")
+        converters = []
+        for columnIndex in range(len(titleRow)):
+            columnType = self.getColumnType(columnIndex, titleRow[columnIndex])
+            if(columnType == None):
+                converter = defaultConverter
+            elif(callable(columnType)):
+                converter = columnType
+            elif(columnType == "date"):
+                converter = _makeToDate(datemode)
+            else:
+                converter = _CONVERTERS[columnType]
+            converters.append(converter)
+        return converters
+
+# -> convertRow Function: apply compiled converters to a row of raw cell values. Short rows are padded with missing values.
+# - a conversion error is re-raised as a ValueError naming the column (titleRow is only used for the error message)
+def convertRow(converters, rowArray, titleRow=None):
+    if(len(rowArray) < len(converters)):
+        rowArray = list(rowArray) + [ None ] * (len(converters) - len(rowArray))
+    try:
+        return [ converter(value) for converter, value in zip(converters, rowArray) ]
+    except (ValueError, TypeError):
+        for columnIndex in range(len(converters)):         # find the cell that failed so the error can say which column it is in
+            try : converters[columnIndex](rowArray[columnIndex])
+            except (ValueError, TypeError) as error:
+                column = str(columnIndex)
+                if(titleRow != None):
+                    column = "'" + str(titleRow[columnIndex]).strip() + "'"
+                raise ValueError("Column " + column + ": can't convert " + repr(rowArray[columnIndex]) + " (" + str(error) + ")")
+        raise
+
+# Test Code - uncomment lines below & run for testing
+# schema = columnSchema({ "GLA" : "int", "Rush" : "bool", "Order Date" : "date" })
+# converters = schema.compile(["GLA", "Rush ", "Order Date", "Notes"], str)
+# print(convertRow(converters, ["2,261", "No", 43346.0, "rural"]))   # [2261, False, datetime.datetime(2018, 9, 4, 0, 0), 'rural']
@@ -0,0 +1,201 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: columnarOrderTable
+#
+# Overview: A columnar table stores spreadsheet data one column at a time instead of one row at a time. The linked
+#   list built by 'create_linkedList.py' holds one dictionary per row, keyed by the full column title string, which
+#   means every order carries its own dictionary plus a reference to every cell. This table instead keeps:
+#     - one dictionary-encoded array per column: every distinct cell value in the column is stored once in the
+#       column's 'dictionary' list, and the column itself is a compact array of integer codes that index into it.
+#       Columns such as State, Job Type, Rush or Client only have a handful of distinct values, so they cost a few
+#       bytes per order.
+#     - one typed numeric array (array.array of doubles) per numeric column, holding the cleaned number for every
+#       row (for example Site Size in acres, GLA, Appraised Value, Xsite Fee). Cells that can't be cleaned hold NaN.
+#       These arrays allow whole-column (batch) computation without re-parsing any text.
+#   Visualization (Rush column):
+#
+#       dictionary: [ "No", "Yes" ]
+#       codes:      [  0,    0,    1,    0,    1, ... ]    <- one small integer per order
+#
+# Description: Rows are accessed through orderRowView objects. A row view is a tiny object (just the table and a row
+#   number) that decodes cells on demand, so it still satisfies 'node[keys_dictionary[i]]' access exactly like the
+#   dictionaries stored in the linked list. The table also provides the linked list traversal API (getNext(), getPrevious(),
+#   getFront(), getBack(), getLength(), len(), iteration), so it can be returned inside a 'data_structure_package.ds_package'
+#   and handed to compute_custom_algorithm.run() in place of a linked list. Unlike the linked list, the title row is not
+#   stored as a data row.
+#
+# Example Usage:
+#   table = columnarOrderTable(titleRow, { 13 : cleanGla })   # column 13 also gets a typed numeric array
+#   table.appendRow(rowArray)
+#   row = table.getRow(0)
+#   print(row["GLA"])                                         # the original cell text
+#   print(table.getNumericColumn(13))                         # array('d', [...]) of cleaned numbers
+#
+#########################################################################################################
+import array # import array module, used for the column code arrays and typed numeric arrays
+import sys   # import sys module, used to measure memory footprint
+
+##########################################################################################################
+# orderRowView class: A lightweight, read-only view of one row of a columnarOrderTable. Indexing it with a
+#   column title returns that row's cell, just like the row dictionaries stored in the linked list.
+##########################################################################################################
+class orderRowView:
+    __slots__ = ("table", "rowIndex")
+
+    # Constructor function to hold & set the class' local variables
+    def __init__(self, table, rowIndex):
+        self.table = table         # the table the row belongs to
+        self.rowIndex = rowIndex   # the row number within the table
+
+    # Return the cell for a column title (raises KeyError for an unknown title, the same as a dictionary)
+    def __getitem__(self, title):
+        return self.table.getCell(self.rowIndex, self.table.columnIndexes[title])
+
+    # Return the cell for a column title, or 'default' if the title is not a column
+    def get(self, title, default=None):
+        columnIndex = self.table.columnIndexes.get(title)
+        if(columnIndex == None):
+            return default
+        return self.table.getCell(self.rowIndex, columnIndex)
+
+    # Return the row as an array of cells, from the left most column to the right most column
+    def toArray(self):
+        return [ self.table.getCell(self.rowIndex, columnIndex) for columnIndex in range(self.table.columnCount) ]
+
+    # Return the row as a dictionary of column title -> cell (the same dictionary create_linkedList.py would have built)
+    def toDict(self):
+        return dict(zip(self.table.titleRow, self.toArray()))
+
+    # Python equality: two views are equal when they view the same row of the same table
+    def __eq__(self, other):
+        return isinstance(other, orderRowView) and other.table is self.table and other.rowIndex == self.rowIndex
+
+    def __hash__(self):
+        return hash((id(self.table), self.rowIndex))
+
+#########################################################################################################
+# columnarOrderTable class: This class is the container for the column arrays
+#########################################################################################################
+class columnarOrderTable:
+    # Constructor to initialize class' local variables
+    # - titleRow: the column titles (the first array in the array of arrays read from a spreadsheet)
+    # - numericColumns (optional): { column index : function that cleans a cell into a number } for every column that should also be stored as a typed array
+    def __init__(self, titleRow, numericColumns=None):
+        self.titleRow = list(titleRow)
+        self.columnCount = len(self.titleRow)
+        self.columnIndexes = {}                                        # column title -> column index
+        for columnIndex in range(self.columnCount):
+            self.columnIndexes[self.titleRow[columnIndex]] = columnIndex
+        self.codes = [ array.array('I') for title in self.titleRow ]   # per column: the integer code of every row's cell
+        self.dictionaries = [ [] for title in self.titleRow ]          # per column: code -> distinct cell value
+        self._encoders = [ {} for title in self.titleRow ]             # per column: (cell type, distinct cell value) -> code (used while appending)
+        self.numericParsers = {}                                       # column index -> cleaning function
+        self.numericColumns = {}                                       # column index -> array('d') of cleaned numbers
+        if(numericColumns != None):
+            for columnIndex in numericColumns:
+                self.numericParsers[columnIndex] = numericColumns[columnIndex]
+                self.numericColumns[columnIndex] = array.array('d')
+        self.length = 0                                                # number of rows in the table
+        self.currentRow = -1                                           # current row for getNext()/getPrevious(), -1 means "before" the first row
+
+    # -> appendRow Function:
+    # - Add a row (an array of cells from left to right) to the back of the table. Short rows are padded with empty cells.
+    def appendRow(self, rowArray):
+        for columnIndex in range(self.columnCount):
+            if(columnIndex < len(rowArray)):
+                cell = rowArray[columnIndex]
+            else:
+                cell = ""
+            encoder = self._encoders[columnIndex]
+            encoderKey = (type(cell), cell)                 # keyed on the type too, since 0 == 0.0 == False (and 1 == 1.0 == True) would otherwise share a code and lose the cell's type
+            code = encoder.get(encoderKey)
+            if(code == None):                               # first time this value is seen in the column, add it to the column's dictionary
+                code = len(self.dictionaries[columnIndex])
+                encoder[encoderKey] = code
+                self.dictionaries[columnIndex].append(cell)
+            self.codes[columnIndex].append(code)
+            parser = self.numericParsers.get(columnIndex)
+            if(parser != None):
+                try : number = float(parser(cell))
+                except (ValueError, TypeError, AttributeError) : number = float("nan") # the cell couldn't be cleaned into a number
+                self.numericColumns[columnIndex].append(number)
+        self.length = self.length + 1
+
+    # -> getCell Function: return the original cell value at a row and column index
+    def getCell(self, rowIndex, columnIndex):
+        return self.dictionaries[columnIndex][self.codes[columnIndex][rowIndex]]
+
+    # -> getRow Function: return an orderRowView for a row index
+    def getRow(self, rowIndex):
+        return orderRowView(self, rowIndex)
+
+    # -> getColumn Function: return every cell of a column (by index) as a list, decoded to the original values
+    def getColumn(self, columnIndex):
+        dictionary = self.dictionaries[columnIndex]
+        return [ dictionary[code] for code in self.codes[columnIndex] ]
+
+    # -> getColumnCodes Function: return a column's (codes array, dictionary list) so callers can work on the integer codes directly
+    def getColumnCodes(self, columnIndex):
+        return self.codes[columnIndex], self.dictionaries[columnIndex]
+
+    # -> getNumericColumn Function: return the typed array('d') of a numeric column (None if the column was not declared numeric)
+    def getNumericColumn(self, columnIndex):
+        return self.numericColumns.get(columnIndex)
+
+    # -> getNext Function: return the next row's view, or None at the back of the table (the current row stays on the back row)
+    def getNext(self):
+        if(self.currentRow + 1 >= self.length):
+            return None
+        self.currentRow = self.currentRow + 1
+        return orderRowView(self, self.currentRow)
+
+    # -> getPrevious Function: return the previous row's view, or None at the front of the table
+    def getPrevious(self):
+        if(self.currentRow <= 0):
+            return None
+        self.currentRow = self.currentRow - 1
+        return orderRowView(self, self.currentRow)
+
+    # -> getFront Function: return the front row's view (** NOTE: THIS RESETS THE CURRENT ROW TO THE FRONT **)
+    def getFront(self):
+        if(self.length == 0):
+            return None
+        self.currentRow = 0
+        return orderRowView(self, 0)
+
+    # -> getBack Function: return the back row's view (** NOTE: THIS RESETS THE CURRENT ROW TO THE BACK **)
+    def getBack(self):
+        if(self.length == 0):
+            return None
+        self.currentRow = self.length - 1
+        return orderRowView(self, self.currentRow)
+
+    # -> getLength Function: return the number of rows in the table
+    def getLength(self):
+        return self.length
+
+    # -> Python length protocol: len(table) is the same as getLength()
+    def __len__(self):
+        return self.length
+
+    # -> Python iteration protocol: 'for row in table:' returns every row's view, front to back, without moving the current row
+    def __iter__(self):
+        for rowIndex in range(self.length):
+            yield orderRowView(self, rowIndex)
+
+    # -> Python reverse iteration protocol: 'for row in reversed(table):' returns every row's view, back to front
+    def __reversed__(self):
+        for rowIndex in range(self.length - 1, -1, -1):
+            yield orderRowView(self, rowIndex)
+
+    # -> getMemoryFootprint Function:
+    # Return the number of bytes used by the table: the code arrays, typed arrays and column dictionaries (including the distinct cell values)
+    def getMemoryFootprint(self):
+        total = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        for columnIndex in range(self.columnCount):
+            total = total + sys.getsizeof(self.codes[columnIndex]) + sys.getsizeof(self.dictionaries[columnIndex]) + sys.getsizeof(self._encoders[columnIndex])
+            for value in self.dictionaries[columnIndex]:
+                total = total + sys.getsizeof(value)
+        for columnIndex in self.numericColumns:
+            total = total + sys.getsizeof(self.numericColumns[columnIndex])
+        return total
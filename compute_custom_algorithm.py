@@ -1,354 +1,754 @@
-#########################################################################################################
-# Author: Timothy Fye
-# Title: compute_custom_algorithm
-#
-# Description: The contents of 'compute_custom_algorithm' will be re-written per project. This is the file that
-#   runs algorithm on data. Since the data/column structure of the input file is known this file can access
-#   that data through datastructures accordingly, make computations/additions/deletions on file as necessary, 
-#   then constuct an array of arrays that can be passed back to main (which can be then passed to write_data_to_excel.py or
-#   writ_)
-#
-# Instead of passing back an array of arrays this funcition acutallly passes back two array of arrays with in another 
-#   array. I want two reports generated from this single run. Typically it would just pass back an array of arrays
-# 
-#########################################################################################################
-
-# Helper function called by run(). It defines a title row.
-def _initializeTitleRowValuesSpeadsheetOne(spreadsheetArray):
-    # Define an array of column titles to be injected as the first array (aka row) in our spreasheetArray
-    columnTitles = [ "Reference ID #",
-                     "City",
-                     "State",
-                     "County",
-                     "Zip",
-                     "Product Type",
-                     "Completed Date",
-                     "Rush",
-                     "Site Size",
-                     "GLA",
-                     "Appraised Value",
-                     "Original Client Fee",
-                     "Increase Amount",
-                     "New Client Fee",
-                     "Increase %",
-                     "Complexity Reasons",
-                     "Comments" ]
-
-    spreadsheetArray.append(columnTitles)
-    return spreadsheetArray
-
-# Helper function called by run(). It defines a title row.
-def _initializeTitleRowValuesSpeadsheetTwo(spreadsheetArray):
-    # Define an array of column titles to be injected as the first array (aka row) in our spreasheetArray
-    columnTitles = [ "Reference ID #",
-                     "City",
-                     "State",
-                     "County",
-                     "Zip" ]
-
-    spreadsheetArray.append(columnTitles)
-    return spreadsheetArray
-
-# Helper function called by run(). It finds a valid key for current node and returns it.
-def _buildKey(node,hash_map_package,linked_list_package):
-    # construct a key to input to hashmap function that is comprised of the data elements in the linked list node of state, county, and city
-    # it is good to note, the create_hashMap.py file is concatenating state + county + city, but the latter two may be blank since not all
-    # counties & cities have special fees in the fee schedule (open the productFeesByState.csv file for more details). Most fees are just state-level fees.
-    # We need to check to see if the key we built is in the hashmap before we try to get the product list of fees for that territory
-    # first build a key from the linked list node's data variable's state, county, and city (using dictionary column index)
-    key = node[linked_list_package.keys_dictionary[4]] + node[linked_list_package.keys_dictionary[6]] + node[linked_list_package.keys_dictionary[3]]
-    result = hash_map_package.data_structure.hashMapContains(key)        # check to see if the key is in the hashmap with the hashMapContains() function
-    if(result == 0):                                                     # if the function returned zero then the key was not found
-        key = node[linked_list_package.keys_dictionary[4]] + node[linked_list_package.keys_dictionary[6]] # next, build a key from the linked list node's data variable's state and county
-        result = hash_map_package.data_structure.hashMapContains(key)    # check to see if the key is in the hashmap with the hashMapContains() function
-        if(result == 0):                                                 # if the function returned zero then the key was not found
-            key = node[linked_list_package.keys_dictionary[4]]      # next, build a key from the linked list node's data variable's state variable
-            result = hash_map_package.data_structure.hashMapContains(key)# check to see if the key is in the hashmap with the hashMapContains() function
-            if(result == 0):                                             # if the function returned zero then the key was not found
-                print("Error: key '", key,"' was not found in hash map. Exiting program.") # print error
-                exit()                                                   # stop execution and kill program. We can't proceed until input is fixed to include key
-    # If we reach this line then a valid key was found, return it to calling run()
-    return key
-
-# Helper function called by run(). It receives a node's site size, gla, and value and then calculates the step/tier. The function returns a "1" for "Tier 1", "2" for "Tier 2", "3" for "Tier 4", or "Q" for "Quote".
-def _calculateTier(siteSize,gla,appraisedValue):
-
-    # Start out by cleaning data. Some columns may be "N/A", which means that we can't perform mathmatical operations on them. We will push in objects into dictionary
-    #   if they are not equal to 'N/A'. We will clean up the data before pushing as well, which means removing things like "ac" or "sq. ft" from "site size" and converting
-    #   siteSize to ac if given in sq ft.
-    availablePropertyCriteria = {} # create an empty dictionary
-
-    # 1. Evaluate siteSize, see if it exists for this node (aka - value is not "N/A" or empty), convert to sq. ft if necessary, then clean so it is only integers. Push to dictionary if it exists
-    if(siteSize.find("N/A") == -1 and siteSize != "" and siteSize != None): # Find substring instead of trying to find exact match (there may be hanging spaces or newline characters that would mess up comparison otherwise)
-        if(siteSize.find("s") == -1 and siteSize.find("S") == -1): # Find substring to verify that the value is in acrage and not sq. ft.
-            # Now we need to strip everything after the space in data. We know input file sends info in as '1234 sf' or '3143 sq. ft'
-            index = siteSize.find(" ")             # Find index where the space exists
-            numString = siteSize[:0 + index]       # Store the substring of numbers, which is all the data to the left of the space. Note: This may include a comma
-            numString = numString.replace(",", "") # Remove any commas from string as we will not be able to convert from string to float with commas included.
-            value = float(numString)               # Cast string to float data type
-            dict_entry = { "site_size" : value }   # Create a dictionary entry
-            availablePropertyCriteria.update(dict_entry) # Push entry to dictionary for later evaluation
-        else: # The value is in square feet
-            # Now we need to strip everything after the space in data. We know input file sends info in as '1234 ac' or '3143 acerage'
-            index = siteSize.find(" ")             # Find index where the space exists
-            numString = siteSize[:0 + index]       # Store the substring of numbers, which is all the data to the left of the space. Note: This may include a comma
-            numString = numString.replace(",", "") # Remove any commas from string as we will not be able to convert from string to float with commas included.
-            value = float(numString)               # Cast string to float data type
-            value = value / 43560                  # Convert to acreage
-            dict_entry = { "site_size" : value }   # Create a dictionary entry
-            availablePropertyCriteria.update(dict_entry) # Push entry to dictionary for later evaluation
-    else: # Push a value of zero for site_size since it doesnt exist. This will enable us to perform mathmatical operations in the section below.
-        dict_entry = { "site_size" : 0 }             # Create a dictionary entry
-        availablePropertyCriteria.update(dict_entry) # Push entry to dictionary for later evaluation
-
-    # 2. Evaluate GLA, see if it exists for this node (aka - value is not "N/A" or empty). Data should already be sq ft as this data point is pulled into the input spreasheet from a database that stores uniform appraisal xml data
-    if(gla.find("N/A") == -1 and gla != "" and gla != None): # Find substring instead of trying to find exact match (there may be hanging spaces or newline characters that would mess up comparison otherwise)
-        numString = gla.replace(",", "")                # Remove any commas from string as we will not be able to convert from string to float with commas included.
-        value = int(numString)                          # Cast string to int data type
-        dict_entry = { "gla" : value }                  # Create a dictionary entry
-        availablePropertyCriteria.update(dict_entry)    # Push entry to dictionary for later evaluation
-    else: # Push a value of zero for gla since it doesnt exist. This will enable us to perform mathmatical operations in the section below.
-        dict_entry = { "gla" : 0 }               # Create a dictionary entry
-        availablePropertyCriteria.update(dict_entry) # Push entry to dictionary for later evaluation
-
-    # 3. Evaluate Appraised Value, see if it exists for this node (aka - value is not "N/A" or empty). Data should already be okay as this data point is pulled into the input spreasheet from a database that stores uniform appraisal xml data
-    if(appraisedValue.find("N/A") == -1 and appraisedValue != "" and appraisedValue != None): # Find substring instead of trying to find exact match (there may be hanging spaces or newline characters that would mess up comparison otherwise)
-        numString = appraisedValue.replace(",", "")     # Remove any commas from string as we will not be able to convert from string to float with commas included.
-        value = int(numString)                          # Cast string to int data type
-        dict_entry = { "appraised_value" : value }      # Create a dictionary entry
-        availablePropertyCriteria.update(dict_entry)    # Push entry to dictionary for later evaluation
-    else: # Push a value of zero for appraised_value since it doesnt exist. This will enable us to perform mathmatical operations in the section below.
-        dict_entry = { "appraised_value" : 0 }       # Create a dictionary entry
-        availablePropertyCriteria.update(dict_entry) # Push entry to dictionary for later evaluation
-
-    # Determine what the tier should be (hardwiring dummy figures & criterion, actual threshold criterion & values would be defined by a company to match proprietary complexity structure depending on property factors)
-    if((availablePropertyCriteria["site_size"] > 8) or (availablePropertyCriteria["gla"] > 4999) or (availablePropertyCriteria["appraised_value"] > 4005000)):
-        return "Q" # Return Q; if this block fires then the property is considered "Quote
-    elif((availablePropertyCriteria["site_size"] > 3.9) or (availablePropertyCriteria["gla"] > 2999) or (availablePropertyCriteria["appraised_value"] > 2005000)):
-        return 3 # Return 3; If this block fires then the property falls within our fee schedule's "Tier 3" range
-    elif((availablePropertyCriteria["site_size"] > 1.9) or (availablePropertyCriteria["gla"] > 1999) or (availablePropertyCriteria["appraised_value"] > 1005000)):
-        return 2 # Return 2; If this block fires then the property falls within our fee schedule's "Tier 2" range
-    else:
-        return 1 # Return 1; If this block fires then the property falls within our fee schedule's "Tier 1" range
-
-# Helper function called by run(). It returns complexity details array.
-def _textMineComplexityNotesforincreases(notes):
-    # Define an empty array that will hold complexity reasons
-    complexityDetails = []
-
-    # Check to see if the text 'rural' or 'remote' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("rural") != -1 or notes.find("remote") != -1):
-        complexityDetails.append("rural/remote")
-    # Check to see if the text 'waterfront', 'riverfront', 'oceanfront' exists in AE notes. If so, push value to complexityReasons array
-    if(notes.find("waterfront") != -1 or notes.find("riverfront") != -1 or notes.find("oceanfront") != -1 or
-       notes.find("water front") != -1 or notes.find("river front") != -1 or notes.find("ocean front") != -1 ):
-        complexityDetails.append("waterfront")
-    # Check to see if the text 'solar' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("solar") != -1):
-        complexityDetails.append("solar energy home")
-    # Check to see if the text 'golf' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("golf") != -1):
-        complexityDetails.append("golf course")
-    # Check to see if the text 'gated' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("gated") != -1):
-        complexityDetails.append("gated community")
-    # Check to see if the text 'condotel' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("condotel") != -1):
-        complexityDetails.append("condotel")
-    # Check to see if the text 'mixed use' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("mixed use") != -1):
-        complexityDetails.append("mixed use")
-
-    return complexityDetails
-
-# Helper function called by run(). It returns quote if a quote factor was tripped. Returns 0 if none and 1 if some.  
-def _textMineComplexityNotesforquotefactors(notes):
-    # Define a variable we will return to calling function
-    quoteFactors = 0
-
-    # Check to see if the text 'rural' or 'remote' exists in notes. If so, push value to complexityReasons array
-    if(notes.find("outbuildings") != -1 or notes.find("mountain") != -1):
-        quoteFactors = 1
-
-    return quoteFactors    
-
-# Helper function called by run(). It calculates the fee of the assignment per fee list, factoring in and adding the appropriate complexities
-def _calculateFee(baseFee, tier, rush, complexityDetailsArray):
-
-    # Ensure the baseFee is note quote ('Quote' can be passed in from 'productFeesByState.xlsx' in certain states). If it is, return 'Q'
-    if(baseFee.find("Quote") != -1):
-        return 'Q'
-
-    # Define an empty array that will hold complexity reasons
-    fee = int(baseFee)
-
-    # Add the tier add-on cost if appropriate
-    if(tier == 2):
-        fee = fee + 300 # Dummy Add-on fee for tier 2 
-    # Add the tier add-on cost if appropriate
-    if(tier == 3):
-        fee = fee + 400 # Dummy Add-on fee for tier 3 
-    # Return 'Q' if quote, we cannot calculate the fee if the property was within quote criteria
-    if(tier == "Q"):
-        return 'Q'
-
-    # Add the rush fee to the fee if a rush was requested
-    if(rush.find("Yes") != -1):
-        fee = fee + 150
-
-    # Note: Thoertically say company defines all possible additions for each addon in the complexityDetailsArray to be $105 add
-    #   This means we can just find the length of complexityDetailsArray, multiply it by $105 since each one would be $105 add,
-    #   then add that number to our base fee
-    addon = len(complexityDetailsArray) * 105 # find addon for remaining complexity possibilities
-    fee = fee + addon                         # addon the final amount
-
-    return fee                                # return commensurate fee back to calling function
-
-
-def run(hash_map_package, linked_list_package):
-
-    # We will want to return an array of arrays that represents a spreadsheet. The outerarray is equal to the worksheet, while the inner arrays represent each row in the worksheet. The inner array elements represents
-    # the cell value for the row from the left-most column to the right most column. This is the format we need to be able to use functions such as 'write_data_to_excel.py' and 'write_data_to_csv.py'
-    # The first array in the array represents the first row, which conventionally should be column titles/headers.
-    spreadsheetArrayOne = []                                                           # create an empty array
-    spreadsheetArrayOne = _initializeTitleRowValuesSpeadsheetOne(spreadsheetArrayOne)  # calls a helper function that will initialize column titles to my desired output, returns the array with a new-sub array containing these column headers
-
-    spreadsheetArrayTwo = []                                                           # create an empty array
-    spreadsheetArrayTwo = _initializeTitleRowValuesSpeadsheetTwo(spreadsheetArrayTwo)  # calls a helper function that will initialize column titles to my desired output, returns the array with a new-sub array containing these column headers
-
-    # Initialize node variable as we prepare to step through linkedList
-    node = linked_list_package.data_structure.getNext() # This obtains the first node, whose data values are just the title columns of spreadsheet we read into program. Don't perform any operations on the first node.
-    counter = 0                                         # Initialize a counter
-
-    # Keep iterating until we reached the end of the list (linked lists's getNext() function returns 'None' - aka 'Null')
-    while(node != None):
-
-        # The first node contains column titles since data was read in from spreadsheet. Don't perform any operations on first row, only subsiquent rows.
-        if(counter != 0):
-            # Call a helper function that will find the proper key for the node in question & return it
-            key = _buildKey(node, hash_map_package, linked_list_package)
-
-            # at this point we have found a valid key. The next step is to return the product price dictionary for the key in question.
-            productPriceList = hash_map_package.data_structure.hashMapGet(key)
-
-            # the productPriceList now holds the returned value from the key/value pair in the hashmap. This is a dictionary of prices. We can use the
-            # linkedList's node's data varaible's job_type variable as an index. The product list dictionary's keys are job types and values are base fees.
-            # using the job type as the index will return the base fee. We are basically just doing this: productPriceList["Condo Appraisal (FNMA 1073)"],
-            # but allowing ourselves to find the applicable product to the linked list node in question by feeding in its job type (or job type of order).
-            # Get the base fee for the job type of the current node. Below is equivalent to saying:
-            #   baseFee = productPriceList[node["Job Type"]]) or more simply:  baseFee = productPriceList["1004"] - can't hardcode form in though since it is different per node
-            baseFee = productPriceList[node[linked_list_package.keys_dictionary[15]]]
-
-            # Next, save the Site Size (aka acreage), GLA, and Appraised Value in local variable
-            # Below is looking at node returned by the linked list (or current node). This node has a 'data' variable that holds a dictionary. The 'value' we want from the dictionary
-            #   is site size, GLA, and appraised value. In order to access this we need to enter they 'key' as the array index. We don't need to hardcode the key, we have the keys_dictionary
-            #   that is a part of our linked list package. This is the name of the columns from our input spreadhseet. Opening the spreadsheet I can see the columns I am looking for are 12,
-            #   13, and 14 (with the rightmost column being '0' as arrays are zero indexed). The dictionary value holds the exact title of the column, which I can use as my index value to get
-            #   the key value residing in my node's data dictionary.
-            siteSize = node[linked_list_package.keys_dictionary[12]]
-            gla = node[linked_list_package.keys_dictionary[13]]
-            appraisedValue = node[linked_list_package.keys_dictionary[14]]
-            tier = _calculateTier(siteSize,gla,appraisedValue) # Call a helper function that calculates the tier for the property. Function returns 1,2,3, or Q (for 'quote')
-
-            # Next, we will leverage text mining to parse notes for the order/node in question and capture key words. The key words
-            #   will help us identify non-rush, non gla, value, lot size complexity adds. An array of reasons will be returned by the
-            #   function below
-            notes = node[linked_list_package.keys_dictionary[19]] # Grab the "Notes" column from input spreadsheet
-            complexityDetails = _textMineComplexityNotesforincreases(notes)
-
-            # Grab the "Rush" column from input spreadsheet
-            rush = node[linked_list_package.keys_dictionary[11]]
-
-            # Calculate the commensurate price by passing in the tier varaible (which evaulatued lot size, gla, appraised value), the complexity details (which is a list of all other
-            #   complexity possbilities), and the base fee (which will be used as a starting point)
-            commensurateFee = _calculateFee(baseFee, tier, rush, complexityDetails)
-
-            # Mark orders that are elible to be passed along to TIAA (all orders that have a fee of 'Q' or where Xsite Fee > commensurateFee)
-            # Calculate the difference between the fee charged and the fee that should have been reflected per the fee schedule
-            # Calculate the percentage change between the fee charged and the fee that should have been reflected per the fee schedule
-            overExpectedCharge = ""
-            increaseAmount = ""
-            increasePercentage = ""
-            xSiteFee = int(node[linked_list_package.keys_dictionary[16]]) # get xsite fee and cast it to an int
-            if(commensurateFee == "Q"):
-                increaseAmount = "N/A"
-                increasePercentage = "N/A"
-                overExpectedCharge = "X"
-                commensurateFee = "Quote" # This will output 'Quote' to file instead of 'Q', make things more clear for readers
-            elif(xSiteFee > commensurateFee):
-                increaseAmount = int(node[linked_list_package.keys_dictionary[16]]) - commensurateFee # Find difference between Xsite fee and the fee we should have charged per fee schedule
-                increasePercentage = increaseAmount / commensurateFee
-                overExpectedCharge = "X"
-                # Check to see if we should actually be setting things to quote 
-                if(_textMineComplexityNotesforquotefactors(notes) == 1): # we found something that should push this to quote    
-                    increaseAmount = "N/A"
-                    increasePercentage = "N/A"
-                    overExpectedCharge = "X"
-                    commensurateFee = "Quote" # This will output 'Quote' to file instead of 'Q', make things more clear for readers                    
-
-            # Prepare a string version of complexityDetails array so when it is written to excel it has commas 
-            complexityDetailsString = ""      # Declare a variable
-            length = len(complexityDetails)   # Find length of complexityDetails array
-            index = 1                         # Declare an index 
-            for reason in complexityDetails:  # Loop through each element in array                    
-                if(length != (index)):        # Check to make sure we aren't on the last element
-                    complexityDetailsString = complexityDetailsString + reason # contactenate the string
-                    complexityDetailsString = complexityDetailsString + ", "  # concatenate a comma since we aren't on last element
-                else:                         # We are on last element
-                    complexityDetailsString = complexityDetailsString + reason # contactenate the string, but don't add a comma
-                index = index + 1 # increment the index
-
-            # Only print out the orders where the xSiteFee > commensurateFee
-            if(overExpectedCharge == "X" and commensurateFee != "Quote"): # Could use (overExpectedCharge == "X" or overExpectedCharge == "Q") if you wanted both quote orders and overcharges
-                # Add the row data we would to eventually like to write to a new spreadsheet for this iteration after evaluating this node's data and making additional computations/evaluations
-                # on it. 
-                # Note: 'node[linked_list_package.keys_dictionary[n]' is taking the data in the node's data variable (the values from the dictionary) and storing it in the new array. Basically
-                # I am going to write out most of the same data that was initially read in. I will add a few new columns/pieces of data, which adds to
-                # the original report and is the purpose of this whole exercise (evaluating current data and building a new report with some like
-                # data and some new data)
-                rowArray = [ node[linked_list_package.keys_dictionary[0]], # Ref Number
-                            node[linked_list_package.keys_dictionary[3]], # City 
-                            node[linked_list_package.keys_dictionary[4]], # State
-                            node[linked_list_package.keys_dictionary[6]], # County 
-                            node[linked_list_package.keys_dictionary[5]], # Zip
-                            node[linked_list_package.keys_dictionary[15]],# Job Type                      
-                            node[linked_list_package.keys_dictionary[8]], # First Completed
-                            node[linked_list_package.keys_dictionary[11]],# Rush 
-                            node[linked_list_package.keys_dictionary[12]],# Site Size
-                            node[linked_list_package.keys_dictionary[13]],# GLA
-                            node[linked_list_package.keys_dictionary[14]],# Appraised Value 
-                            commensurateFee, # Add what the fee should be
-                            increaseAmount, # Difference between Xsite Fee and what fee should have been per schedule
-                            node[linked_list_package.keys_dictionary[16]], # Xsite Fee
-                            increasePercentage, # Percent change (always positive)
-                            complexityDetailsString, # Print out the complexity details
-                            node[linked_list_package.keys_dictionary[19]] # Notes
-                        ]
-
-                # Append the new row to the spreadsheetArray
-                spreadsheetArrayOne.append(rowArray)
-
-            # Only print out the order if it is a rush
-            if(node[linked_list_package.keys_dictionary[11]].find("Yes") != -1):
-                # Add the row data we would to eventually like to write to a new spreadsheet for this iteration after evaluating this node's data and making additional computations/evaluations
-                # on it. 
-                # Note: 'node[linked_list_package.keys_dictionary[n]' is taking the data in the node's data variable (the values from the dictionary) and storing it in the new array. Basically
-                # I am going to write out most of the same data that was initially read in.
-                rowArray = [ node[linked_list_package.keys_dictionary[0]], # Ref Number
-                            node[linked_list_package.keys_dictionary[3]], # City 
-                            node[linked_list_package.keys_dictionary[4]], # State
-                            node[linked_list_package.keys_dictionary[6]], # County 
-                            node[linked_list_package.keys_dictionary[5]], # Zip
-                        ]
-
-                # Append the new row to the spreadsheetArray
-                spreadsheetArrayTwo.append(rowArray)
-
-        node = linked_list_package.data_structure.getNext() # Iterate to the next node
-        counter = counter + 1                               # Increment the counter by one
-
-    # combine spreadsheetArrayOne & spreadsheetArrayTwo into the same payload
-    payload = []                        # Initialize empty payload array
-    payload.append(spreadsheetArrayOne) # Append spreadsheet one to payload array
-    payload.append(spreadsheetArrayTwo) # Append spreadsheet two to payload array 
-    return payload                      # Return payload
\ No newline at end of file
+#########################################################################################################
+# Author: Timothy Fye
+# Title: compute_custom_algorithm
+#
+# Description: The contents of 'compute_custom_algorithm' will be re-written per project. This is the file that
+#   runs algorithm on data. Since the data/column structure of the input file is known this file can access
+#   that data through datastructures accordingly, make computations/additions/deletions on file as necessary, 
+#   then constuct an array of arrays that can be passed back to main (which can be then passed to write_data_to_excel.py or
+#   writ_)
+#
+# Instead of passing back an array of arrays this funcition acutallly passes back two array of arrays with in another 
+#   array. I want two reports generated from this single run. Typically it would just pass back an array of arrays
+# 
+#########################################################################################################
+import feeIndex               # import fee index library module (for its QUOTE_FEE sentinel)
+import feeMemo                # import fee memo (LRU memo of commensurate fees, shared by orders with the same pricing inputs)
+import keywordMatcher         # import single pass keyword matcher (used to text mine notes)
+import data_structure_package # import object container class (run_batch() wraps each batch of orders in one)
+import operator               # import operator module (run_vectorized() reads whole columns with itemgetter)
+
+# NumPy is optional. It is only used by the batch (whole column) functions below, which fall back to plain Python loops without it.
+#   [ *** Note: install with 'pip install numpy' to use the vectorized code paths *** ]
+try : import numpy
+except ImportError : numpy = None
+
+# Helper function called by run(). It defines a title row.
+def _initializeTitleRowValuesSpeadsheetOne(spreadsheetArray):
+    # Define an array of column titles to be injected as the first array (aka row) in our spreasheetArray
+    columnTitles = [ "Reference ID #",
+                     "City",
+                     "State",
+                     "County",
+                     "Zip",
+                     "Product Type",
+                     "Completed Date",
+                     "Rush",
+                     "Site Size",
+                     "GLA",
+                     "Appraised Value",
+                     "Original Client Fee",
+                     "Increase Amount",
+                     "New Client Fee",
+                     "Increase %",
+                     "Complexity Reasons",
+                     "Comments" ]
+
+    spreadsheetArray.append(columnTitles)
+    return spreadsheetArray
+
+# Helper function called by run(). It defines a title row.
+def _initializeTitleRowValuesSpeadsheetTwo(spreadsheetArray):
+    # Define an array of column titles to be injected as the first array (aka row) in our spreasheetArray
+    columnTitles = [ "Reference ID #",
+                     "City",
+                     "State",
+                     "County",
+                     "Zip" ]
+
+    spreadsheetArray.append(columnTitles)
+    return spreadsheetArray
+
+# Helper function called by _resolveTerritory(). It returns the ordered list of candidate hashmap keys for a node: state + county + city first,
+# then state + county, then state. The create_hashMap.py file is concatenating state + county + city, but the latter two may be blank since not all
+# counties & cities have special fees in the fee schedule (open the productFeesByState.csv file for more details). Most fees are just state-level fees.
+def _buildCandidateKeys(node,linked_list_package):
+    state = node[linked_list_package.keys_dictionary[4]]   # linked list node's data variable's state (using dictionary column index)
+    county = node[linked_list_package.keys_dictionary[6]]  # linked list node's data variable's county
+    city = node[linked_list_package.keys_dictionary[3]]    # linked list node's data variable's city
+    return (state + county + city, state + county, state)
+
+# Helper function called by run(). It finds the most specific territory in the fee schedule for the current node and returns both its key and
+# its product price dictionary. All three candidate keys are resolved by a single hashMapGetFirst() call, so each candidate is hashed once and
+# no separate hashMapGet() is needed on the winner.
+def _resolveTerritory(node,hash_map_package,linked_list_package):
+    candidateKeys = _buildCandidateKeys(node, linked_list_package)
+    key, productPriceList = hash_map_package.data_structure.hashMapGetFirst(candidateKeys)
+    if(key == None):                                                     # none of the candidates were found
+        print("Error: key '", candidateKeys[2],"' was not found in hash map. Exiting program.") # print error
+        exit()                                                           # stop execution and kill program. We can't proceed until input is fixed to include key
+    # If we reach this line then a valid key was found, return it and its price list to calling run()
+    return key, productPriceList
+
+# Helper function called by run(). It is the fast path used when the fee schedule package carries a precompiled feeIndex. It resolves the
+# node's territory to an integer id and its Job Type to an integer product id, then returns the parsed base fee from the index's fee matrix
+# (feeIndex.QUOTE_FEE for 'Quote'). No dictionaries are built and no fee text is parsed per order.
+def _lookupBaseFee(node,fee_index,linked_list_package):
+    territoryId, productId = _lookupFeeIds(_buildCandidateKeys(node, linked_list_package), node[linked_list_package.keys_dictionary[15]], fee_index)
+    return fee_index.getBaseFee(territoryId, productId)
+
+# Helper function called by _priceOrder(), _lookupBaseFee() and run_vectorized(). It resolves an order's candidate territory keys and Job Type to the feeIndex's
+# (territory id, product id), exiting/raising the same way the hashmap path does when either is missing.
+def _lookupFeeIds(candidateKeys,jobType,fee_index):
+    territoryId = fee_index.resolveTerritoryId(candidateKeys)
+    if(territoryId == -1):                                               # none of the candidates were found
+        print("Error: key '", candidateKeys[2],"' was not found in hash map. Exiting program.") # print error
+        exit()                                                           # stop execution and kill program. We can't proceed until input is fixed to include key
+    productId = fee_index.getProductId(jobType)
+    if(productId == -1):                                                 # same failure the price list dictionary would raise for an unknown Job Type
+        raise KeyError(jobType)
+    return territoryId, productId
+
+# Helper function. It finds a valid key for current node and returns it.
+def _buildKey(node,hash_map_package,linked_list_package):
+    return _resolveTerritory(node, hash_map_package, linked_list_package)[0]
+
+# Helper function called by _calculateTier(). It cleans a node's site size and returns it in acres. Some columns may be "N/A", which means that we can't perform
+#   mathmatical operations on them, so a value of zero is returned when the site size doesn't exist. Cleaning means removing things like "ac" or "sq. ft" from
+#   "site size" and converting siteSize to ac if given in sq ft. If the cell was already converted to a number when it was read (see ORDER_SCHEMA) it is returned as is.
+def _normalizeSiteSize(siteSize):
+    if(isinstance(siteSize, (int, float))): # Already a number in acres, nothing to clean
+        return siteSize
+    if(siteSize == None):                   # Missing value from a typed read
+        return 0
+    # Evaluate siteSize, see if it exists for this node (aka - value is not "N/A" or empty), convert to acreage if necessary, then clean so it is only numbers
+    if(siteSize.find("N/A") == -1 and siteSize != "" and siteSize != None): # Find substring instead of trying to find exact match (there may be hanging spaces or newline characters that would mess up comparison otherwise)
+        if(siteSize.find("s") == -1 and siteSize.find("S") == -1): # Find substring to verify that the value is in acrage and not sq. ft.
+            # Now we need to strip everything after the space in data. We know input file sends info in as '1234 sf' or '3143 sq. ft'
+            index = siteSize.find(" ")             # Find index where the space exists
+            numString = siteSize[:0 + index]       # Store the substring of numbers, which is all the data to the left of the space. Note: This may include a comma
+            numString = numString.replace(",", "") # Remove any commas from string as we will not be able to convert from string to float with commas included.
+            return float(numString)                # Cast string to float data type
+        else: # The value is in square feet
+            # Now we need to strip everything after the space in data. We know input file sends info in as '1234 ac' or '3143 acerage'
+            index = siteSize.find(" ")             # Find index where the space exists
+            numString = siteSize[:0 + index]       # Store the substring of numbers, which is all the data to the left of the space. Note: This may include a comma
+            numString = numString.replace(",", "") # Remove any commas from string as we will not be able to convert from string to float with commas included.
+            value = float(numString)               # Cast string to float data type
+            return value / 43560                   # Convert to acreage
+    else: # Return a value of zero for site_size since it doesnt exist. This will enable us to perform mathmatical operations on it.
+        return 0
+
+# Helper function called by _calculateTier(). It cleans a whole number column (GLA or Appraised Value) and returns it as an int. A value of zero is returned when
+#   the value doesn't exist (aka - value is "N/A" or empty). Data should already be okay as these data points are pulled into the input spreasheet from a database
+#   that stores uniform appraisal xml data. If the cell was already converted to a number when it was read (see ORDER_SCHEMA) there is nothing to parse.
+def _normalizeWholeNumber(numberText):
+    if(isinstance(numberText, (int, float))): # Already a number
+        return int(numberText)
+    if(numberText == None):                   # Missing value from a typed read
+        return 0
+    if(numberText.find("N/A") == -1 and numberText != "" and numberText != None): # Find substring instead of trying to find exact match (there may be hanging spaces or newline characters that would mess up comparison otherwise)
+        numString = numberText.replace(",", "")         # Remove any commas from string as we will not be able to convert from string to int with commas included.
+        return int(numString)                           # Cast string to int data type
+    else: # Return a value of zero since it doesnt exist. This will enable us to perform mathmatical operations on it.
+        return 0
+
+# Helper function called by _calculateTier(). It receives already cleaned site size (in acres), gla and appraised value numbers and returns the step/tier.
+def _tierFromCriteria(siteSize,gla,appraisedValue):
+    # Determine what the tier should be (hardwiring dummy figures & criterion, actual threshold criterion & values would be defined by a company to match proprietary complexity structure depending on property factors)
+    if((siteSize > 8) or (gla > 4999) or (appraisedValue > 4005000)):
+        return "Q" # Return Q; if this block fires then the property is considered "Quote
+    elif((siteSize > 3.9) or (gla > 2999) or (appraisedValue > 2005000)):
+        return 3 # Return 3; If this block fires then the property falls within our fee schedule's "Tier 3" range
+    elif((siteSize > 1.9) or (gla > 1999) or (appraisedValue > 1005000)):
+        return 2 # Return 2; If this block fires then the property falls within our fee schedule's "Tier 2" range
+    else:
+        return 1 # Return 1; If this block fires then the property falls within our fee schedule's "Tier 1" range
+
+# Helper function called by run(). It receives a node's site size, gla, and value and then calculates the step/tier. The function returns a "1" for "Tier 1", "2" for "Tier 2", "3" for "Tier 4", or "Q" for "Quote".
+def _calculateTier(siteSize,gla,appraisedValue):
+    # Start out by cleaning data (see helper functions above), then determine the tier from the cleaned numbers
+    return _tierFromCriteria(_normalizeSiteSize(siteSize), _normalizeWholeNumber(gla), _normalizeWholeNumber(appraisedValue))
+
+# Tier codes used by the batch function below. Tiers 1, 2 and 3 keep their number and "Q" (quote) is coded as 0, so a whole column of tiers can be held in a
+# small integer array (and used directly as an index into a table of per-tier add-on fees).
+TIER_CODE_QUOTE = 0
+
+# Helper function: convert a tier as returned by _calculateTier() (1, 2, 3 or "Q") to its tier code, and back
+def _tierToCode(tier):
+    if(tier == "Q"):
+        return TIER_CODE_QUOTE
+    return tier
+
+def _codeToTier(tierCode):
+    if(tierCode == TIER_CODE_QUOTE):
+        return "Q"
+    return int(tierCode)
+
+# Batch version of _calculateTier(). It receives whole columns (arrays/lists) of already cleaned site size (in acres, see _normalizeSiteSize()), gla and
+#   appraised value (see _normalizeWholeNumber()) and returns an array of tier codes (1, 2, 3, or TIER_CODE_QUOTE). With NumPy installed the tiers are found
+#   with a handful of whole-array comparisons instead of a Python loop: every order starts at tier 1 and is then raised by each threshold test in turn, from
+#   the lowest tier to the highest, which gives exactly the same answer as the if/elif chain in _tierFromCriteria(). Without NumPy a list is returned.
+#   Note: the inputs must already be cleaned numbers (NaN, e.g. from a cell a columnar table could not clean, compares as false and lands in tier 1).
+def _calculateTierBatch(siteSizes,glas,appraisedValues):
+    if(numpy == None): # NumPy isn't installed, fall back to the scalar function
+        return [ _tierToCode(_tierFromCriteria(siteSizes[i], glas[i], appraisedValues[i])) for i in range(len(siteSizes)) ]
+
+    siteSizes = numpy.asarray(siteSizes)             # no copy is made if the input is already an array (array.array/NumPy)
+    glas = numpy.asarray(glas)
+    appraisedValues = numpy.asarray(appraisedValues)
+
+    tierCodes = numpy.ones(len(siteSizes), dtype=numpy.int8)                                     # every property starts in "Tier 1"
+    tierCodes[(siteSizes > 1.9) | (glas > 1999) | (appraisedValues > 1005000)] = 2                # "Tier 2" range
+    tierCodes[(siteSizes > 3.9) | (glas > 2999) | (appraisedValues > 2005000)] = 3                # "Tier 3" range
+    tierCodes[(siteSizes > 8) | (glas > 4999) | (appraisedValues > 4005000)] = TIER_CODE_QUOTE    # "Quote"
+    return tierCodes
+
+# Columns of the order list spreadsheet (by column index) that have a numeric meaning, and the helper that cleans each one into a number. This is used by
+# typed/columnar order stores (see create_columnarTable.py) so whole columns can be computed on at once.
+ORDER_NUMERIC_COLUMNS = { 12 : _normalizeSiteSize,     # Site Size (in acres)
+                          13 : _normalizeWholeNumber,  # GLA
+                          14 : _normalizeWholeNumber,  # Appraised Value
+                          16 : _normalizeWholeNumber } # Xsite Fee (Fee Charged)
+
+# Column schema for reading the order list spreadsheet with typed cells (see columnSchema.py and read_data_from_excel.get_excel_data(..., schema=)). With this
+#   schema the numeric columns arrive as numbers, so the helpers above don't re-parse text for every order, and "Rush" arrives as True/False. Note that the
+#   reports echo these columns back out, so they will hold numbers instead of the original text.
+ORDER_SCHEMA = { 11 : "bool",                # Rush
+                 12 : _normalizeSiteSize,    # Site Size (in acres)
+                 13 : "int",                 # GLA
+                 14 : "int",                 # Appraised Value
+                 16 : "int" }                # Xsite Fee (Fee Charged)
+
+# Helper function: return 1 if an order's "Rush" cell says it was a rush, otherwise 0. The cell is "Yes"/"No" text, or True/False when read with ORDER_SCHEMA.
+def _isRush(rush):
+    if(isinstance(rush, bool)):
+        return int(rush)
+    if(rush == None):
+        return 0
+    if(rush.find("Yes") != -1):
+        return 1
+    return 0
+
+# Keyword -> category table used to text mine the order notes. Each [keyword, category] pair says "if the keyword is found in the notes, the order has this
+#   complexity". Several keywords can share a category. The categories are reported in the order they first appear in this table. Keywords mapped to
+#   QUOTE_FACTOR are not complexities, finding one means the order should be pushed to quote. Matching is case sensitive. To change the keywords, edit this
+#   table (or call configureNotesKeywords() with a new one).
+QUOTE_FACTOR = "quote factor"
+NOTES_KEYWORD_TABLE = [ ["rural", "rural/remote"],
+                        ["remote", "rural/remote"],
+                        ["waterfront", "waterfront"],
+                        ["riverfront", "waterfront"],
+                        ["oceanfront", "waterfront"],
+                        ["water front", "waterfront"],
+                        ["river front", "waterfront"],
+                        ["ocean front", "waterfront"],
+                        ["solar", "solar energy home"],
+                        ["golf", "golf course"],
+                        ["gated", "gated community"],
+                        ["condotel", "condotel"],
+                        ["mixed use", "mixed use"],
+                        ["outbuildings", QUOTE_FACTOR],
+                        ["mountain", QUOTE_FACTOR] ]
+
+# The compiled matcher for NOTES_KEYWORD_TABLE. It is built once, here, rather than per order.
+_notesMatcher = keywordMatcher.keywordMatcher(NOTES_KEYWORD_TABLE)
+
+# Rebuild the notes matcher from a new keyword -> category table (same format as NOTES_KEYWORD_TABLE)
+def configureNotesKeywords(keywordTable):
+    global _notesMatcher
+    _notesMatcher = keywordMatcher.keywordMatcher(keywordTable)
+
+# Helper function called by run(). It scans the notes for an order once and returns both results of text mining them: the complexity details array (the
+#   complexity categories found) and the quote factor flag (1 if a quote factor was found, otherwise 0).
+def _textMineNotes(notes):
+    complexityDetails = _notesMatcher.match(notes)
+    quoteFactors = 0
+    if(QUOTE_FACTOR in complexityDetails):
+        complexityDetails.remove(QUOTE_FACTOR)
+        quoteFactors = 1
+    return complexityDetails, quoteFactors
+
+# Helper function. It returns complexity details array (see _textMineNotes()).
+def _textMineComplexityNotesforincreases(notes):
+    return _textMineNotes(notes)[0]
+
+# Helper function. It returns quote if a quote factor was tripped. Returns 0 if none and 1 if some (see _textMineNotes()).
+def _textMineComplexityNotesforquotefactors(notes):
+    return _textMineNotes(notes)[1]
+
+# The memo of commensurate fees used by _priceOrder(), keyed on ( territory key, Job Type, tier, rush, complexity count ) (see feeMemo.py)
+_feeMemo = feeMemo.feeMemo()
+
+# Turn the fee memo on or off (turn it off to compare fees with and without it) and/or change the most fees it holds
+def configureFeeMemo(enabled=1, maxSize=None):
+    if(maxSize != None):
+        _feeMemo.setMaxSize(maxSize)
+    _feeMemo.setEnabled(enabled)
+
+# Return the fee memo's counters and settings: { "hits", "misses", "evictions", "size", "maxSize", "hitRate", "enabled" }
+def getFeeMemoStats():
+    return _feeMemo.getStats()
+
+# Helper function called by run(). It calculates the fee of the assignment per fee list, factoring in and adding the appropriate complexities
+def _calculateFee(baseFee, tier, rush, complexityDetailsArray):
+
+    # The base fee is already a number when it came from a feeIndex (feeIndex.QUOTE_FEE marks 'Quote'), so there is nothing to parse
+    if(isinstance(baseFee, int)):
+        if(baseFee == feeIndex.QUOTE_FEE):
+            return 'Q'
+        fee = baseFee
+    else:
+        # Ensure the baseFee is note quote ('Quote' can be passed in from 'productFeesByState.xlsx' in certain states). If it is, return 'Q'
+        if(baseFee.find("Quote") != -1):
+            return 'Q'
+
+        # Define an empty array that will hold complexity reasons
+        fee = int(baseFee)
+
+    # Add the tier add-on cost if appropriate
+    if(tier == 2):
+        fee = fee + 300 # Dummy Add-on fee for tier 2 
+    # Add the tier add-on cost if appropriate
+    if(tier == 3):
+        fee = fee + 400 # Dummy Add-on fee for tier 3 
+    # Return 'Q' if quote, we cannot calculate the fee if the property was within quote criteria
+    if(tier == "Q"):
+        return 'Q'
+
+    # Add the rush fee to the fee if a rush was requested
+    if(_isRush(rush) == 1):
+        fee = fee + 150
+
+    # Note: Thoertically say company defines all possible additions for each addon in the complexityDetailsArray to be $105 add
+    #   This means we can just find the length of complexityDetailsArray, multiply it by $105 since each one would be $105 add,
+    #   then add that number to our base fee
+    addon = len(complexityDetailsArray) * 105 # find addon for remaining complexity possibilities
+    fee = fee + addon                         # addon the final amount
+
+    return fee                                # return commensurate fee back to calling function
+
+
+def run(hash_map_package, linked_list_package):
+
+    # We will want to return an array of arrays that represents a spreadsheet. The outerarray is equal to the worksheet, while the inner arrays represent each row in the worksheet. The inner array elements represents
+    # the cell value for the row from the left-most column to the right most column. This is the format we need to be able to use functions such as 'write_data_to_excel.py' and 'write_data_to_csv.py'
+    # The first array in the array represents the first row, which conventionally should be column titles/headers.
+    spreadsheetArrayOne = []                                                           # create an empty array
+    spreadsheetArrayOne = _initializeTitleRowValuesSpeadsheetOne(spreadsheetArrayOne)  # calls a helper function that will initialize column titles to my desired output, returns the array with a new-sub array containing these column headers
+
+    spreadsheetArrayTwo = []                                                           # create an empty array
+    spreadsheetArrayTwo = _initializeTitleRowValuesSpeadsheetTwo(spreadsheetArrayTwo)  # calls a helper function that will initialize column titles to my desired output, returns the array with a new-sub array containing these column headers
+
+    # Price every order in the data structure, appending report rows to the two spreadsheet arrays
+    _priceOrders(hash_map_package, linked_list_package, spreadsheetArrayOne, spreadsheetArrayTwo)
+
+    # combine spreadsheetArrayOne & spreadsheetArrayTwo into the same payload
+    payload = []                        # Initialize empty payload array
+    payload.append(spreadsheetArrayOne) # Append spreadsheet one to payload array
+    payload.append(spreadsheetArrayTwo) # Append spreadsheet two to payload array 
+    return payload                      # Return payload
+
+# Helper function called by run() and run_batch(). It steps through every order in the data structure, computes its commensurate fee, and appends the rows for
+#   both reports to spreadsheetArrayOne (increases) and spreadsheetArrayTwo (rushes).
+def _priceOrders(hash_map_package, linked_list_package, spreadsheetArrayOne, spreadsheetArrayTwo):
+
+    # Use the fee schedule's precompiled feeIndex if one was built (see create_hashMap.prepare_data_structure)
+    fee_index = hash_map_package.fee_index
+
+    # Initialize a counter as we prepare to step through linkedList. The first node's data values are just the title columns of spreadsheet we read into program. Don't perform any operations on the first node.
+    # (If the data structure was built without the title row, such as a columnar table, the counter starts at one so every node is processed.)
+    counter = 0
+    if(linked_list_package.includes_title_row == 0):
+        counter = 1
+
+    # Step through every node in the list, front to back. The list's iteration protocol is used rather than getNext(), so the list's shared current pointer is left untouched
+    for node in linked_list_package.data_structure:
+
+        # The first node contains column titles since data was read in from spreadsheet. Don't perform any operations on first row, only subsiquent rows.
+        if(counter != 0):
+            increaseRow, rushRow = _priceOrder(node, hash_map_package, linked_list_package, fee_index)
+            if(increaseRow != None):
+                spreadsheetArrayOne.append(increaseRow)   # Append the new row to the spreadsheetArray
+            if(rushRow != None):
+                spreadsheetArrayTwo.append(rushRow)       # Append the new row to the spreadsheetArray
+
+        counter = counter + 1                               # Increment the counter by one
+
+# Helper function called by _priceOrders(). It prices a single order (node) and returns its report rows as (increases row, rushes row). Either row is None when the
+#   order doesn't belong in that report.
+def _priceOrder(node, hash_map_package, linked_list_package, fee_index):
+    increaseRow = None
+    rushRow = None
+
+    # Fast path: the fee schedule package carries a precompiled feeIndex, the base fee comes straight out of its integer fee matrix (its territory id stands in for the territory key)
+    jobType = node[linked_list_package.keys_dictionary[15]]
+    if(fee_index != None):
+        key, productId = _lookupFeeIds(_buildCandidateKeys(node, linked_list_package), jobType, fee_index)
+        baseFee = fee_index.getBaseFee(key, productId)
+    else:
+        # Call a helper function that will find the proper key for the node in question & return it, along with the product price dictionary for the key in question
+        key, productPriceList = _resolveTerritory(node, hash_map_package, linked_list_package)
+
+        # the productPriceList now holds the returned value from the key/value pair in the hashmap. This is a dictionary of prices. We can use the
+        # linkedList's node's data varaible's job_type variable as an index. The product list dictionary's keys are job types and values are base fees.
+        # using the job type as the index will return the base fee. We are basically just doing this: productPriceList["Condo Appraisal (FNMA 1073)"],
+        # but allowing ourselves to find the applicable product to the linked list node in question by feeding in its job type (or job type of order).
+        # Get the base fee for the job type of the current node. Below is equivalent to saying:
+        #   baseFee = productPriceList[node["Job Type"]]) or more simply:  baseFee = productPriceList["1004"] - can't hardcode form in though since it is different per node
+        baseFee = productPriceList[jobType]
+
+    # Next, save the Site Size (aka acreage), GLA, and Appraised Value in local variable
+    # Below is looking at node returned by the linked list (or current node). This node has a 'data' variable that holds a dictionary. The 'value' we want from the dictionary
+    #   is site size, GLA, and appraised value. In order to access this we need to enter they 'key' as the array index. We don't need to hardcode the key, we have the keys_dictionary
+    #   that is a part of our linked list package. This is the name of the columns from our input spreadhseet. Opening the spreadsheet I can see the columns I am looking for are 12,
+    #   13, and 14 (with the rightmost column being '0' as arrays are zero indexed). The dictionary value holds the exact title of the column, which I can use as my index value to get
+    #   the key value residing in my node's data dictionary.
+    siteSize = node[linked_list_package.keys_dictionary[12]]
+    gla = node[linked_list_package.keys_dictionary[13]]
+    appraisedValue = node[linked_list_package.keys_dictionary[14]]
+    tier = _calculateTier(siteSize,gla,appraisedValue) # Call a helper function that calculates the tier for the property. Function returns 1,2,3, or Q (for 'quote')
+
+    # Next, we will leverage text mining to parse notes for the order/node in question and capture key words. The key words
+    #   will help us identify non-rush, non gla, value, lot size complexity adds. An array of reasons will be returned by the
+    #   function below, along with a flag for whether a quote factor was found (the notes are only scanned once for both)
+    notes = node[linked_list_package.keys_dictionary[19]] # Grab the "Notes" column from input spreadsheet
+    complexityDetails, quoteFactors = _textMineNotes(notes)
+
+    # Grab the "Rush" column from input spreadsheet
+    rush = node[linked_list_package.keys_dictionary[11]]
+
+    # Calculate the commensurate price by passing in the tier varaible (which evaulatued lot size, gla, appraised value), the complexity details (which is a list of all other
+    #   complexity possbilities), and the base fee (which will be used as a starting point). Orders with the same territory, Job Type, tier, rush and number of complexities
+    #   have the same fee, so it is only calculated the first time and then taken from the fee memo.
+    memoKey = (key, jobType, tier, _isRush(rush), len(complexityDetails))
+    commensurateFee = _feeMemo.get(hash_map_package, memoKey)
+    if(commensurateFee is feeMemo.MISSING):
+        commensurateFee = _calculateFee(baseFee, tier, rush, complexityDetails)
+        _feeMemo.put(memoKey, commensurateFee)
+
+    # Mark orders that are elible to be passed along to TIAA (all orders that have a fee of 'Q' or where Xsite Fee > commensurateFee)
+    # Calculate the difference between the fee charged and the fee that should have been reflected per the fee schedule
+    # Calculate the percentage change between the fee charged and the fee that should have been reflected per the fee schedule
+    overExpectedCharge = ""
+    increaseAmount = ""
+    increasePercentage = ""
+    xSiteFee = int(node[linked_list_package.keys_dictionary[16]]) # get xsite fee and cast it to an int
+    if(commensurateFee == "Q"):
+        increaseAmount = "N/A"
+        increasePercentage = "N/A"
+        overExpectedCharge = "X"
+        commensurateFee = "Quote" # This will output 'Quote' to file instead of 'Q', make things more clear for readers
+    elif(xSiteFee > commensurateFee):
+        increaseAmount = int(node[linked_list_package.keys_dictionary[16]]) - commensurateFee # Find difference between Xsite fee and the fee we should have charged per fee schedule
+        increasePercentage = increaseAmount / commensurateFee
+        overExpectedCharge = "X"
+        # Check to see if we should actually be setting things to quote 
+        if(quoteFactors == 1): # we found something that should push this to quote    
+            increaseAmount = "N/A"
+            increasePercentage = "N/A"
+            overExpectedCharge = "X"
+            commensurateFee = "Quote" # This will output 'Quote' to file instead of 'Q', make things more clear for readers                    
+
+    # Prepare a string version of complexityDetails array so when it is written to excel it has commas 
+    complexityDetailsString = ""      # Declare a variable
+    length = len(complexityDetails)   # Find length of complexityDetails array
+    index = 1                         # Declare an index 
+    for reason in complexityDetails:  # Loop through each element in array                    
+        if(length != (index)):        # Check to make sure we aren't on the last element
+            complexityDetailsString = complexityDetailsString + reason # contactenate the string
+            complexityDetailsString = complexityDetailsString + ", "  # concatenate a comma since we aren't on last element
+        else:                         # We are on last element
+            complexityDetailsString = complexityDetailsString + reason # contactenate the string, but don't add a comma
+        index = index + 1 # increment the index
+
+    # Only print out the orders where the xSiteFee > commensurateFee
+    if(overExpectedCharge == "X" and commensurateFee != "Quote"): # Could use (overExpectedCharge == "X" or overExpectedCharge == "Q") if you wanted both quote orders and overcharges
+        # Add the row data we would to eventually like to write to a new spreadsheet for this iteration after evaluating this node's data and making additional computations/evaluations
+        # on it. 
+        # Note: 'node[linked_list_package.keys_dictionary[n]' is taking the data in the node's data variable (the values from the dictionary) and storing it in the new array. Basically
+        # I am going to write out most of the same data that was initially read in. I will add a few new columns/pieces of data, which adds to
+        # the original report and is the purpose of this whole exercise (evaluating current data and building a new report with some like
+        # data and some new data)
+        rowArray = [ node[linked_list_package.keys_dictionary[0]], # Ref Number
+                    node[linked_list_package.keys_dictionary[3]], # City 
+                    node[linked_list_package.keys_dictionary[4]], # State
+                    node[linked_list_package.keys_dictionary[6]], # County 
+                    node[linked_list_package.keys_dictionary[5]], # Zip
+                    node[linked_list_package.keys_dictionary[15]],# Job Type                      
+                    node[linked_list_package.keys_dictionary[8]], # First Completed
+                    node[linked_list_package.keys_dictionary[11]],# Rush 
+                    node[linked_list_package.keys_dictionary[12]],# Site Size
+                    node[linked_list_package.keys_dictionary[13]],# GLA
+                    node[linked_list_package.keys_dictionary[14]],# Appraised Value 
+                    commensurateFee, # Add what the fee should be
+                    increaseAmount, # Difference between Xsite Fee and what fee should have been per schedule
+                    node[linked_list_package.keys_dictionary[16]], # Xsite Fee
+                    increasePercentage, # Percent change (always positive)
+                    complexityDetailsString, # Print out the complexity details
+                    node[linked_list_package.keys_dictionary[19]] # Notes
+                ]
+
+        # This row goes to the first spreadsheet (increases)
+        increaseRow = rowArray
+
+    # Only print out the order if it is a rush
+    if(_isRush(node[linked_list_package.keys_dictionary[11]]) == 1):
+        # Add the row data we would to eventually like to write to a new spreadsheet for this iteration after evaluating this node's data and making additional computations/evaluations
+        # on it. 
+        # Note: 'node[linked_list_package.keys_dictionary[n]' is taking the data in the node's data variable (the values from the dictionary) and storing it in the new array. Basically
+        # I am going to write out most of the same data that was initially read in.
+        rowArray = [ node[linked_list_package.keys_dictionary[0]], # Ref Number
+                    node[linked_list_package.keys_dictionary[3]], # City 
+                    node[linked_list_package.keys_dictionary[4]], # State
+                    node[linked_list_package.keys_dictionary[6]], # County 
+                    node[linked_list_package.keys_dictionary[5]], # Zip
+                ]
+
+        # This row goes to the second spreadsheet (rushes)
+        rushRow = rowArray
+
+    return increaseRow, rushRow
+
+# This function prices a single order (a node of the order list package) and returns its report rows as (increases row, rushes row), either of which is None when
+#   the order doesn't belong in that report. run() is the same as calling this for every order and appending the rows that aren't None.
+def price_order(hash_map_package, linked_list_package, node):
+    return _priceOrder(node, hash_map_package, linked_list_package, hash_map_package.fee_index)
+
+# Return the title rows of the two reports run() produces, [increases title row, rushes title row] (used when the report rows are produced a batch at a time)
+def reportTitleRows():
+    return [ _initializeTitleRowValuesSpeadsheetOne([])[0], _initializeTitleRowValuesSpeadsheetTwo([])[0] ]
+
+# Batch version of run(). It prices one batch of orders, given as the order list's title row and an array of row arrays (no title row), such as the
+#   batches yielded by read_data_from_csv.iter_csv_batches(). It returns a payload like run()'s, [increases rows, rushes rows], but without the title rows,
+#   so the payloads of consecutive batches can simply be appended to each other (or written out) in order.
+def run_batch(hash_map_package, titleRow, rows):
+    # Pair every row with the title row, the same as create_linkedList.py does, so the orders can be accessed through keys_dictionary as usual
+    nodes = [ dict(zip(titleRow, rowArray)) for rowArray in rows ]
+    linked_list_package = data_structure_package.ds_package(nodes, titleRow, includes_title_row=0)
+
+    spreadsheetArrayOne = []
+    spreadsheetArrayTwo = []
+    _priceOrders(hash_map_package, linked_list_package, spreadsheetArrayOne, spreadsheetArrayTwo)
+    return [ spreadsheetArrayOne, spreadsheetArrayTwo ]
+
+# This function prices a stream of order batches, each a (titleRow, rows) pair as yielded by read_data_from_csv.iter_csv_batches(). Only one batch is held in
+#   memory at a time, so order exports of any size can be processed.
+#   - Without a callback, the report rows of every batch are collected and the same payload run() would return is returned (title rows included).
+#   - With a callback, callback(batchPayload) is called after each batch with that batch's [increases rows, rushes rows] (see run_batch()) and nothing is
+#     collected. The number of orders priced is returned. Use reportTitleRows() for the title rows.
+def run_batches(hash_map_package, batches, callback=None):
+    payload = None
+    if(callback == None):
+        titleRows = reportTitleRows()
+        payload = [ [ titleRows[0] ], [ titleRows[1] ] ]
+    orderCount = 0
+    for titleRow, rows in batches:
+        batchPayload = run_batch(hash_map_package, titleRow, rows)
+        orderCount = orderCount + len(rows)
+        if(callback != None):
+            callback(batchPayload)
+        else:
+            payload[0].extend(batchPayload[0])
+            payload[1].extend(batchPayload[1])
+    if(callback != None):
+        return orderCount
+    return payload
+
+# Helper function called by run_vectorized(). It dictionary-encodes a column: it returns (distinct values, codes), where distinct values is a list of every
+#   distinct cell in order of first appearance and codes is an int64 array holding each order's index into it. A function then only has to be applied once
+#   per distinct value (the order list repeats the same few states, job types and notes over and over), and because the distinct values are in order of
+#   first appearance an error is raised for the same order the scalar code would raise it for.
+def _encodeColumn(cells):
+    keys = cells
+    if(len(set(map(type, cells))) > 1):                        # mixed types: 1, 1.0 and True are the same dictionary key, so key on the type too to keep every cell as it was
+        keys = list(zip(map(type, cells), cells))
+    distinctKeys = list(dict.fromkeys(keys))
+    codeOf = { distinctKeys[code] : code for code in range(len(distinctKeys)) }
+    codes = numpy.fromiter(map(codeOf.__getitem__, keys), dtype=numpy.int64, count=len(keys))
+    if(keys is not cells):
+        return [ key[1] for key in distinctKeys ], codes
+    return distinctKeys, codes
+
+# Helper function called by run_vectorized(). It returns an array holding function(cell) for every cell of a column, calling the function once per distinct cell
+def _mapCells(function, cells, dtype):
+    distinctValues, codes = _encodeColumn(cells)
+    return numpy.array([ function(value) for value in distinctValues ], dtype=dtype).take(codes)
+
+# Helper function called by run_vectorized(). It returns a dictionary of column index -> list of the column's cells (one per order, title row skipped). A columnar
+#   table already stores whole columns, any other order store is read in a single pass.
+def _orderColumns(linked_list_package, columnIndexes):
+    data_structure = linked_list_package.data_structure
+    if(hasattr(data_structure, "getColumn") and linked_list_package.includes_title_row == 0):   # columnar table (see columnarOrderTable.py)
+        return { columnIndex : data_structure.getColumn(columnIndex) for columnIndex in columnIndexes }
+    nodes = list(data_structure)
+    if(linked_list_package.includes_title_row == 1):           # the first node holds the title row, skip it (the same as run())
+        nodes = nodes[1:]
+    return { columnIndex : list(map(operator.itemgetter(linked_list_package.keys_dictionary[columnIndex]), nodes)) for columnIndex in columnIndexes }
+
+# Helper function called by run_vectorized(). It returns a column as a NumPy text array when every cell is text and NumPy has its string functions (NumPy 2),
+#   otherwise None (the column is then handled one distinct value at a time by the scalar helper functions).
+def _textColumn(cells):
+    if(not hasattr(numpy, "strings") or len(cells) == 0 or set(map(type, cells)) != { str }):
+        return None
+    return numpy.array(cells, dtype=str)
+
+# Helper function called by run_vectorized(). Whole column version of _normalizeWholeNumber() (GLA, Appraised Value): "N/A" and blank cells are 0, commas are
+#   removed and the text is converted in one step. Text the fast path can't vouch for (spaces, signs, numbers too large for int64, typed cells) goes through
+#   _normalizeWholeNumber() instead, so results and errors are always the scalar function's.
+def _normalizeWholeNumberColumn(cells):
+    text = _textColumn(cells)
+    if(text is not None):
+        missing = (numpy.strings.find(text, "N/A") != -1) | (text == "")
+        digits = numpy.strings.replace(text, ",", "")
+        if(bool((missing | numpy.strings.isdecimal(digits)).all())):
+            try : return numpy.where(missing, "0", digits).astype(numpy.int64)
+            except (ValueError, OverflowError) : pass
+    return _mapCells(_normalizeWholeNumber, cells, numpy.int64)
+
+# Helper function called by run_vectorized(). Whole column version of _normalizeSiteSize(): the number is the text before the first space (commas removed),
+#   in acres unless the cell mentions square feet ("s"/"S"), "N/A" and blank cells are 0. Text the fast path can't vouch for goes through _normalizeSiteSize().
+def _normalizeSiteSizeColumn(cells):
+    text = _textColumn(cells)
+    if(text is not None):
+        missing = (numpy.strings.find(text, "N/A") != -1) | (text == "")
+        spaces = numpy.strings.find(text, " ")
+        numbers = numpy.strings.slice(text, 0, numpy.where(spaces == -1, numpy.strings.str_len(text) - 1, spaces))   # the same as siteSize[:index] (index -1 drops the last character)
+        numbers = numpy.strings.replace(numbers, ",", "")
+        if(bool((missing | numpy.strings.isdecimal(numpy.strings.replace(numbers, ".", "", count=1))).all())):   # plain decimal numbers only
+            siteSizes = numpy.where(missing, "0", numbers).astype(numpy.float64)
+            squareFeet = ~missing & ((numpy.strings.find(text, "s") != -1) | (numpy.strings.find(text, "S") != -1))
+            return numpy.where(squareFeet, siteSizes / 43560, siteSizes)                                         # convert square feet to acreage
+    return _mapCells(_normalizeSiteSize, cells, numpy.float64)
+
+# Helper function called by run_vectorized(). Whole column version of int() (Xsite Fee). Text other than plain digits goes through int() one distinct value at a time.
+def _intColumn(cells):
+    text = _textColumn(cells)
+    if(text is not None and bool(numpy.strings.isdecimal(text).all())):
+        try : return text.astype(numpy.int64)
+        except OverflowError : pass
+    return _mapCells(int, cells, numpy.int64)
+
+# Helper function called by run_vectorized(). Whole column version of _isRush().
+def _isRushColumn(cells):
+    text = _textColumn(cells)
+    if(text is not None):
+        return (numpy.strings.find(text, "Yes") != -1).astype(numpy.int64)
+    return _mapCells(_isRush, cells, numpy.int64)
+
+# Helper function called by run_vectorized(). It returns the cells of a column for the given orders (an array of order indexes) as a list. The cells are the same
+#   objects the order store holds, the same as the rows run() builds.
+def _takeCells(cells, orderIndexes):
+    if(len(orderIndexes) == 0):
+        return []
+    if(len(orderIndexes) == 1):
+        return [ cells[int(orderIndexes[0])] ]
+    return list(operator.itemgetter(*orderIndexes.tolist())(cells))
+
+# Helper function called by run_vectorized(). It returns the base fee of every order as an int64 array (feeIndex.QUOTE_FEE for 'Quote'). Every distinct
+#   State + County + City + Job Type combination is resolved once, the same way _priceOrder() resolves a single order (with the same errors). With a feeIndex
+#   (or a mapped snapshot) each combination's territory and product ids give the flat position of its cell in the fee matrix, and the whole base fee column
+#   is gathered from the matrix in one step. Without one, each combination's fee is read from the hashmap's price dictionary.
+def _baseFeeColumn(hash_map_package, states, counties, cities, jobTypes):
+    fee_index = hash_map_package.fee_index
+    combinations, orderCombinations = _encodeColumn(list(zip(states, counties, cities, jobTypes)))
+
+    combinationFees = []
+    for state, county, city, jobType in combinations:
+        candidateKeys = (state + county + city, state + county, state)
+        if(fee_index != None):
+            territoryId, productId = _lookupFeeIds(candidateKeys, jobType, fee_index)
+            combinationFees.append(territoryId * fee_index.productCount + productId)   # the cell's position in the fee matrix
+            continue
+        key, productPriceList = hash_map_package.data_structure.hashMapGetFirst(candidateKeys)
+        if(key == None):
+            print("Error: key '", candidateKeys[2],"' was not found in hash map. Exiting program.")
+            exit()
+        baseFee = productPriceList[jobType]
+        if(baseFee.find("Quote") != -1):                       # 'Quote' is coded the same way the feeIndex codes it
+            combinationFees.append(feeIndex.QUOTE_FEE)
+        else:
+            combinationFees.append(int(baseFee))
+    combinationFees = numpy.array(combinationFees, dtype=numpy.int64)
+
+    if(fee_index != None):                                     # gather every combination's base fee from the fee matrix
+        positions = combinationFees
+        combinationFees = numpy.asarray(fee_index.fees).take(positions).astype(numpy.int64)
+        missing = numpy.flatnonzero(combinationFees == feeIndex.MISSING_FEE)
+        if(len(missing) > 0):                                  # let the index raise its usual error for the first order without a base fee
+            territoryId, productId = divmod(int(positions[missing[0]]), fee_index.productCount)
+            fee_index.getBaseFee(territoryId, productId)
+    return combinationFees.take(orderCombinations)
+
+# Whole column (vectorized) version of run(). It returns exactly the same payload as run(), but instead of pricing one order at a time it works on whole
+#   columns of the order list at once (NumPy arrays):
+#     - base fee array: territory/product ids gathered from the fee matrix (see _baseFeeColumn())
+#     - site size, GLA, Appraised Value and Xsite Fee arrays, parsed a whole column at a time
+#     - tier array (see _calculateTierBatch()), the tier add-on array is looked up from it (TIER_ADD_ON_FEES)
+#     - rush add-on and complexity add-on arrays (each distinct note is text mined once, all in one pass, see keywordMatcher.matchMany())
+#     - commensurate fee, increase amount and increase percentage arrays
+#     - the quote mask, the over-charge mask (Xsite Fee > commensurate fee) and the rush mask
+#   The report rows are then assembled a column at a time, only for the orders selected by the increases mask and the rush mask. Cells, numbers and their
+#   Python types are the same as run()'s, so the payloads are identical. Without NumPy installed this simply calls run().
+TIER_ADD_ON_FEES = [ 0, 0, 300, 400 ] # add-on fee by tier code (TIER_CODE_QUOTE, Tier 1, Tier 2, Tier 3), the same dummy add-ons as _calculateFee()
+RUSH_FEE = 150                        # the same dummy rush fee as _calculateFee()
+COMPLEXITY_FEE = 105                  # the same dummy add-on per complexity as _calculateFee()
+def run_vectorized(hash_map_package, linked_list_package):
+    if(numpy == None): # NumPy isn't installed, fall back to pricing one order at a time
+        return run(hash_map_package, linked_list_package)
+
+    titleRows = reportTitleRows()
+
+    # Columns used by the reports and the pricing (Ref Number, City, State, Zip, County, First Completed, Rush, Site Size, GLA, Appraised Value, Job Type, Xsite Fee, Notes)
+    columns = _orderColumns(linked_list_package, [ 0, 3, 4, 5, 6, 8, 11, 12, 13, 14, 15, 16, 19 ])
+
+    # Base fee, tier and add-on columns
+    baseFees = _baseFeeColumn(hash_map_package, columns[4], columns[6], columns[3], columns[15])
+    tierCodes = _calculateTierBatch(_normalizeSiteSizeColumn(columns[12]), _normalizeWholeNumberColumn(columns[13]), _normalizeWholeNumberColumn(columns[14]))
+    tierAddOns = numpy.array(TIER_ADD_ON_FEES, dtype=numpy.int64).take(tierCodes)
+    rushes = _isRushColumn(columns[11])
+    distinctNotes, noteCodes = _encodeColumn(columns[19])
+    complexityDetails = []                                                 # per distinct note: the complexity categories found
+    quoteFactors = []                                                      # per distinct note: 1 if a quote factor was found
+    for categories in _notesMatcher.matchMany(distinctNotes):
+        quoteFactor = 0
+        if(QUOTE_FACTOR in categories):                                    # the same as _textMineNotes()
+            categories.remove(QUOTE_FACTOR)
+            quoteFactor = 1
+        complexityDetails.append(categories)
+        quoteFactors.append(quoteFactor)
+    complexityCounts = numpy.array([ len(categories) for categories in complexityDetails ], dtype=numpy.int64).take(noteCodes)
+    quoteFactors = numpy.array(quoteFactors, dtype=numpy.int64).take(noteCodes)
+    xSiteFees = _intColumn(columns[16])
+
+    # Fee math and masks (quote orders get no fee, they are never reported as increases)
+    commensurateFees = baseFees + tierAddOns + rushes * RUSH_FEE + complexityCounts * COMPLEXITY_FEE
+    quoteMask = (baseFees == feeIndex.QUOTE_FEE) | (tierCodes == TIER_CODE_QUOTE)
+    overChargeMask = ~quoteMask & (xSiteFees > commensurateFees)
+    increasesMask = overChargeMask & (quoteFactors == 0)                   # a quote factor in the notes pushes an over-charge to quote instead
+    increaseAmounts = xSiteFees - commensurateFees
+
+    # Increases report: the selected orders' rows are assembled a column at a time (percentages are only divided out for them)
+    selected = numpy.flatnonzero(increasesMask)
+    selectedFees = commensurateFees.take(selected)
+    if(numpy.any(selectedFees == 0)):                                      # the same error the scalar division would raise
+        raise ZeroDivisionError("division by zero")
+    selectedAmounts = increaseAmounts.take(selected)
+    reportColumns = [ _takeCells(columns[0], selected),                   # Ref Number
+                      _takeCells(columns[3], selected),                   # City
+                      _takeCells(columns[4], selected),                   # State
+                      _takeCells(columns[6], selected),                   # County
+                      _takeCells(columns[5], selected),                   # Zip
+                      _takeCells(columns[15], selected),                  # Job Type
+                      _takeCells(columns[8], selected),                   # First Completed
+                      _takeCells(columns[11], selected),                  # Rush
+                      _takeCells(columns[12], selected),                  # Site Size
+                      _takeCells(columns[13], selected),                  # GLA
+                      _takeCells(columns[14], selected),                  # Appraised Value
+                      selectedFees.tolist(),                              # what the fee should be
+                      selectedAmounts.tolist(),                           # Difference between Xsite Fee and what fee should have been per schedule
+                      _takeCells(columns[16], selected),                  # Xsite Fee
+                      (selectedAmounts / selectedFees).tolist(),          # Percent change
+                      [ ", ".join(complexityDetails[code]) for code in noteCodes.take(selected).tolist() ], # complexity details (joined per order, like run())
+                      _takeCells(columns[19], selected) ]                 # Notes
+    spreadsheetArrayOne = [ titleRows[0] ] + list(map(list, zip(*reportColumns)))
+
+    # Rushes report
+    selected = numpy.flatnonzero(rushes == 1)
+    reportColumns = [ _takeCells(columns[0], selected), _takeCells(columns[3], selected), _takeCells(columns[4], selected), _takeCells(columns[6], selected), _takeCells(columns[5], selected) ]
+    spreadsheetArrayTwo = [ titleRows[1] ] + list(map(list, zip(*reportColumns)))
+
+    return [ spreadsheetArrayOne, spreadsheetArrayTwo ]
+
+# The property test for _calculateTierBatch() (it must agree with _calculateTier() on randomized spreadsheet text and on every threshold) is in
+# test_compute_custom_algorithm.py
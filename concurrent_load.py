@@ -0,0 +1,68 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: concurrent_load
+# Function: load_inputs(feeScheduleBranch, orderBranch, useProcess=1)
+# Parameters:
+#   - The fee schedule branch and the order list branch, each a (function, arguments) pair. The function reads its input and builds its
+#     data structure, and returns the data structure's package (for example main.py's _loadFeeSchedule() and _loadOrders())
+#   - 1 to run the fee schedule branch in a separate process (the default), 0 to run it in a thread
+#
+# Purpose: The fee schedule and the order list don't depend on each other until the orders are priced, but they used to be loaded one after
+#   the other, so startup took as long as both loads added together. This file loads them at the same time, so startup takes about as long
+#   as the slower of the two, and reports how long each branch took.
+#
+# Description: The fee schedule branch runs in a worker process while the order list branch runs in this thread, and load_inputs() returns
+#   as soon as both are done. The branches are split this way because of what each one returns: the fee schedule package is small and is
+#   cheap to send back from another process, while the order list's linked list holds every order and is built here so it never has to be
+#   copied between processes (reading the order workbooks already spreads their sheets across worker processes, see
+#   read_data_from_workbooks.py). Parsing spreadsheets keeps Python busy, so two threads would mostly take turns; useProcess=0 is there for
+#   a fee schedule function that can't be sent to another process. An error in either branch is raised here once both branches are done.
+#   It returns (fee schedule package, order list package, timings), where timings is { "fee schedule", "orders", "total" } in seconds.
+#
+# NOTE: The process re-imports the calling module, so the branch functions must be module level functions and load_inputs() must be called
+#   from under an "if __name__ == '__main__':" guard (main.py does) on operating systems that start processes fresh (Windows).
+#   The fee schedule package comes back pickled, and its hashmap puts every key again as it is loaded here, because Python's builtin hash (the
+#   compact hashmap's default) is different in each process (see the pickle functions in hashMap.py).
+#
+# Example Usage (put this in calling function):
+#   import concurrent_load
+#   hash_map_package, linked_list_package, timings = concurrent_load.load_inputs((loadFees, ("fees.xlsx",)), (loadOrders, ("orders.xlsx",)))
+#   print("fee schedule", timings["fee schedule"], "orders", timings["orders"])
+#
+#########################################################################################################
+import concurrent.futures # import process/thread pool module
+import time               # import time module, used for the branch timings
+
+# This function calls a branch's function and returns (its result, the seconds it took). It runs in the worker process for the fee schedule branch, so the
+#   time sending the package back isn't counted in the branch's time.
+def timed_call(function, arguments):
+    start = time.perf_counter()
+    result = function(*arguments)
+    return result, time.perf_counter() - start
+
+# This function runs the fee schedule branch and the order list branch at the same time and returns (fee schedule package, order list package, timings)
+def load_inputs(feeScheduleBranch, orderBranch, useProcess=1):
+    start = time.perf_counter()
+    if(useProcess == 1):
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+    else:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    with executor:
+        feeScheduleFuture = executor.submit(timed_call, feeScheduleBranch[0], feeScheduleBranch[1])   # the fee schedule loads in the background...
+        orderError = None
+        try:
+            orderPackage, orderSeconds = timed_call(orderBranch[0], orderBranch[1])                  # ...while the order list loads here
+        except BaseException as error:
+            orderError = error
+        feeSchedulePackage, feeScheduleSeconds = feeScheduleFuture.result()                          # wait for the fee schedule (raises its error, if any)
+    if(orderError != None):
+        raise orderError
+    timings = { "fee schedule" : feeScheduleSeconds, "orders" : orderSeconds, "total" : time.perf_counter() - start }
+    return feeSchedulePackage, orderPackage, timings
+
+# Test Code - uncomment lines below & run for testing (total should be close to the slower branch, not the sum of both)
+# import read_data_from_excel, create_hashMap, create_linkedList
+# def loadFees(): return create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+# def loadOrders(): return create_linkedList.prepare_data_structure(read_data_from_excel.get_excel_data("orderList.xlsx"))
+# if __name__ == '__main__':
+#     print(load_inputs((loadFees, ()), (loadOrders, ()))[2])
@@ -0,0 +1,42 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: create_columnarTable
+# Function: prepare_data_structure(valuesArray, numericColumns=None)
+# Parameters: An array of arrays that typically represent spreadsheet data
+#   - numericColumns (optional): { column index : function that cleans a cell into a number } for the columns that should also be
+#     stored as typed numeric arrays (for the order list this is compute_custom_algorithm.ORDER_NUMERIC_COLUMNS)
+#
+# Returns: An Object with two data members:
+#   1. A data structure (a columnarOrderTable)
+#   2. An array to reference the dictionary keys (the column titles, used as 'node[keys_dictionary[i]]' on the table's row views)
+#
+# Purpose: This is the columnar counterpart to 'create_linkedList.py'. Instead of turning every row into a dictionary and pushing it
+#   into a linked list, each column is stored once as a dictionary-encoded array (plus a typed array for numeric columns). This uses far
+#   less memory per order and allows whole-column (batch) computation. The returned package can be passed to compute_custom_algorithm.run()
+#   in place of the linked list package; each row is handed out as a row view that still supports 'node[keys_dictionary[i]]'.
+#
+# Note: The first array in the array of arrays is the title row. It becomes the column titles of the table and is NOT stored as a data
+#   row (the package's 'includes_title_row' member is 0, so run() does not skip the first row).
+#
+#########################################################################################################
+import columnarOrderTable      # import data structure class
+import data_structure_package  # import object container class
+
+# This function is responsible for inserting an array of arrays into a newly instantiated columnar table. The function returns a package that contains the table.
+def prepare_data_structure(valuesArray, numericColumns=None):
+
+    # Grab the first array inside of the valuesArray. The first array should contain the titles of each column.
+    titleRow = valuesArray[0]
+
+    # Declare the table, one array per column
+    table = columnarOrderTable.columnarOrderTable(titleRow, numericColumns)
+
+    # Loop through each sub-array in the valuesArray (aka each row from a spreadsheet), skipping the title row
+    for rowIndex in range(1, len(valuesArray)):
+        table.appendRow(valuesArray[rowIndex])
+
+    # Create a deliverable package to return to user. The title row is not a data row in the table.
+    ds = data_structure_package.ds_package(table, titleRow, includes_title_row=0)
+
+    # return to main function
+    return ds
@@ -0,0 +1,217 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: data_formats
+# Functions: register_format(name, extensions, magic=None, reader=None, writer=None, rowReader=None, appender=None), detect_format(filepath, forWriting=0),
+#   read_data(filepath, formatName=None, schema=None, useCache=0), iter_data(filepath, formatName=None, schema=None),
+#   write_data(filepath, payload, formatName=None), append_data(filepath, payload, formatName=None), can_append(formatName), get_format_names()
+# Parameters:
+#   - A path to a file, and optionally the name of its format (see FORMATS below) to skip detection
+#   - For read_data(), optionally a column schema (see 'columnSchema.py') and a cache flag (see 'parsed_input_cache.py')
+#   - For write_data(), an array of arrays (or any iterable/generator of row arrays). For append_data(), the same, its first row being the title row
+#
+# Purpose: Every read_data_from_* and write_data_to_* file handles one file type, so the calling code had to know which one to call for
+#   each file. This file is a registry of those readers and writers: read_data() and write_data() work out the format of a file and call
+#   the right reader or writer, so main.py (or any other program) can take input and give output in whichever format it is handed.
+#
+# Description: Each format is registered with a name, its file extensions, optionally the "magic bytes" its files start with, a reader
+#   function reader(filepath, schema) that returns an array of arrays, a writer function writer(filepath, rows), and optionally a row reader
+#   rowReader(filepath, schema) that yields the rows one at a time (iter_data() uses it to stream a file instead of reading it all at once,
+#   formats without one are read whole and then iterated), and optionally an appender appender(filepath, rows) that adds rows to the end of an
+#   existing file without reading it (append_data() uses it, formats without one can't be appended to). The formats below are registered when
+#   this file is imported:
+#       "xlsx"  - .xlsx workbooks (zip files)                read_data_from_excel / write_data_to_excel.write_xlsx_rows() (no appending)
+#       "xlsm"  - .xlsm macro workbooks (read only)          read_data_from_excel
+#       "xls"   - .xls workbooks (OLE2 files)                read_data_from_excel / write_data_to_excel.push_excel_data() (no appending)
+#       "csv"   - .csv text (.csv.gz is written compressed)  read_data_from_csv / write_data_to_csv.write_csv_rows() (appended in place)
+#       "rows"  - .rows binary row stream                    row_stream (the compact format for handing rows between programs, appended in place)
+#       "jsonl" - .jsonl JSON Lines, one JSON array per line row_stream (the text fallback for the binary row stream, appended in place)
+#   When reading, a file's first bytes are checked against each format's magic bytes first, so a workbook saved under the wrong extension
+#   is still read correctly. Formats without magic bytes (text formats) are detected by extension. When writing, the extension decides.
+#   The longest matching extension wins, so ".csv.gz" is matched before ".gz". A file whose format can't be worked out raises a ValueError,
+#   and so does writing a file whose extension isn't one of its format's extensions (or a format that has no writer).
+#
+# Example Usage (put this in calling function):
+#   import data_formats
+#   spreadsheetArray = data_formats.read_data("orderList.xlsx")
+#   data_formats.write_data("increases.rows", payload[0])
+#   data_formats.append_data("increases.csv", newPayload[0]) # add rows to the end of a report (the title row is only written to a new file)
+#   for rowArray in data_formats.iter_data("orderList.csv"): # stream the rows one at a time
+#       print(rowArray)
+#   data_formats.register_format("tsv", (".tsv",), reader=readTsv, writer=writeTsv) # add a format
+#
+#########################################################################################################
+import os # import os module, used to check for files
+import read_data_from_excel # import excel read function
+import read_data_from_csv   # import csv read function
+import write_data_to_excel  # import excel write functions
+import write_data_to_csv    # import csv write function
+import row_stream           # import binary row stream / JSON Lines read and write functions
+import parsed_input_cache   # import parsed input cache module (optional, skips re-parsing unchanged files)
+
+MAGIC_READ_SIZE = 16 # the most bytes checked for magic bytes
+FORMATS = {}         # format name -> { "extensions", "magic", "reader", "writer", "rowReader", "appender" }
+
+# This function adds a format to the registry (registering a name again replaces it). A format without a reader or writer can't be read or written.
+def register_format(name, extensions, magic=None, reader=None, writer=None, rowReader=None, appender=None):
+    FORMATS[name] = { "extensions" : tuple(extension.lower() for extension in extensions), "magic" : magic, "reader" : reader, "writer" : writer,
+                      "rowReader" : rowReader, "appender" : appender }
+
+# This function returns the names of the registered formats (forWriting=1 only returns the formats that can be written)
+def get_format_names(forWriting=0):
+    if(forWriting == 1):
+        return [ name for name in FORMATS if FORMATS[name]["writer"] != None ]
+    return list(FORMATS)
+
+# Helper function: return the name of the format with the longest extension matching the file name, or None
+def _formatByExtension(filepath):
+    filename = filepath.lower()
+    bestName = None
+    bestLength = 0
+    for name in FORMATS:
+        for extension in FORMATS[name]["extensions"]:
+            if(filename.endswith(extension) and len(extension) > bestLength):
+                bestName = name
+                bestLength = len(extension)
+    return bestName
+
+# Helper function: return the name of the format whose magic bytes the file starts with, or None
+def _formatByMagic(filepath):
+    try:
+        with open(filepath, "rb") as inputFile:
+            head = inputFile.read(MAGIC_READ_SIZE)
+    except OSError:
+        return None
+    for name in FORMATS:
+        magic = FORMATS[name]["magic"]
+        if(magic != None and head.startswith(magic)):
+            return name
+    return None
+
+# This function returns the name of a file's format. Existing files being read are recognized by their magic bytes, then by extension
+#   (forWriting=1 only looks at the extension). A file whose format can't be worked out raises a ValueError.
+def detect_format(filepath, forWriting=0):
+    name = None
+    if(forWriting == 0 and os.path.isfile(filepath)):
+        name = _formatByMagic(filepath)
+    if(name == None):
+        name = _formatByExtension(filepath)
+    if(name == None):
+        extensions = []
+        for formatName in FORMATS:
+            extensions.extend(FORMATS[formatName]["extensions"])
+        raise ValueError("Can't tell the format of '" + filepath + "', expected one of the extensions: " + ", ".join(extensions))
+    return name
+
+# Helper function: return a registered format by name (an unknown name raises a ValueError)
+def _getFormat(name):
+    if(name not in FORMATS):
+        raise ValueError("Unknown format '" + str(name) + "', expected one of: " + ", ".join(FORMATS))
+    return FORMATS[name]
+
+# This function reads a file in any registered format and returns an array of arrays. With useCache=1 the parsed rows are cached on disk
+#   and reused until the file changes (see parsed_input_cache.py).
+def read_data(filepath, formatName=None, schema=None, useCache=0):
+    if(formatName == None):
+        formatName = detect_format(filepath)
+    reader = _getFormat(formatName)["reader"]
+    if(reader == None):
+        raise ValueError("The '" + formatName + "' format can't be read")
+    if(useCache == 1):
+        variant = "format=" + formatName + ";schema=" + (schema.getCacheKey() if schema != None else "")
+        return parsed_input_cache.get_cached_rows(filepath, variant, lambda: reader(filepath, schema))
+    return reader(filepath, schema)
+
+# This function returns an iterator over the rows of a file in any registered format, one row array at a time. Formats with a row reader are
+#   streamed (only the current row is held in memory), any other format is read whole first.
+def iter_data(filepath, formatName=None, schema=None):
+    if(formatName == None):
+        formatName = detect_format(filepath)
+    fileFormat = _getFormat(formatName)
+    if(fileFormat["rowReader"] != None):
+        return fileFormat["rowReader"](filepath, schema)
+    if(fileFormat["reader"] == None):
+        raise ValueError("The '" + formatName + "' format can't be read")
+    return iter(fileFormat["reader"](filepath, schema))
+
+# Helper function: return the registered format a file is written in (a format that can't be written, or a file name that doesn't end in one of
+#   the format's extensions, raises a ValueError)
+def _getWritableFormat(filepath, formatName):
+    fileFormat = _getFormat(formatName)
+    if(fileFormat["writer"] == None):
+        raise ValueError("The '" + formatName + "' format can't be written")
+    if(not filepath.lower().endswith(fileFormat["extensions"])):     # the writers only accept their own extensions
+        raise ValueError("Can't write '" + filepath + "' as " + formatName + ", the file name must end in one of: " + ", ".join(fileFormat["extensions"]))
+    return fileFormat
+
+# This function writes an array of arrays (or any iterable of row arrays) to a file in any registered format
+def write_data(filepath, payload, formatName=None):
+    if(formatName == None):
+        formatName = detect_format(filepath, forWriting=1)
+    _getWritableFormat(filepath, formatName)["writer"](filepath, payload)
+
+# This function returns 1 if files of a format can be added to with append_data(), otherwise 0
+def can_append(formatName):
+    return int(_getFormat(formatName)["appender"] != None)
+
+# This function adds the rows of an array of arrays (whose first row is the title row) to the end of a file written by write_data(). If the file doesn't
+#   exist yet (or is empty) it is written whole, title row included. Only the new rows are written, the file is never read. A format without an appender
+#   (the workbooks: reading one back doesn't give the cells it was written with) raises a ValueError, write those files whole with write_data() instead.
+def append_data(filepath, payload, formatName=None):
+    if(formatName == None):
+        formatName = detect_format(filepath, forWriting=1)
+    fileFormat = _getWritableFormat(filepath, formatName)
+    if(not os.path.isfile(filepath) or os.path.getsize(filepath) == 0):
+        fileFormat["writer"](filepath, payload)
+        return
+    if(fileFormat["appender"] == None):
+        raise ValueError("Can't add rows to '" + filepath + "', the " + formatName + " format can't be appended to (write the whole file with write_data())")
+    rows = iter(payload)
+    next(rows, None)                                                 # the file already has its title row
+    fileFormat["appender"](filepath, rows)
+
+# Readers for the built in formats (every reader is called as reader(filepath, schema))
+def _readExcel(filepath, schema):
+    return read_data_from_excel.get_excel_data(filepath, schema=schema)
+
+def _readCsv(filepath, schema):
+    _checkCsvReadable(filepath)
+    return read_data_from_csv.get_csv_data(filepath, schema)
+
+# Row readers for the built in formats (every row reader is called as rowReader(filepath, schema) and yields row arrays)
+def _iterExcel(filepath, schema):
+    return read_data_from_excel.iter_excel_rows(filepath, schema=schema)
+
+def _iterCsv(filepath, schema):
+    _checkCsvReadable(filepath)
+    return read_data_from_csv.iter_csv_rows(filepath, schema)
+
+# Appenders for the built in formats (every appender is called as appender(filepath, rows) and adds the rows to the end of the file)
+def _appendCsv(filepath, rows):
+    write_data_to_csv.write_csv_rows(filepath, rows, append=1)
+
+def _appendJsonl(filepath, rows):
+    row_stream.write_jsonl_rows(filepath, rows, append=1)
+
+def _appendRowStream(filepath, rows):
+    row_stream.write_row_stream(filepath, rows, append=1)
+
+# Helper function: compressed csv files are only written, reading one raises a ValueError
+def _checkCsvReadable(filepath):
+    if(filepath.lower().endswith(".gz")):
+        raise ValueError("Compressed csv files can only be written, decompress '" + filepath + "' before reading it")
+
+# Register the built in formats
+register_format("xlsx", (".xlsx",), magic=b"PK\x03\x04", reader=_readExcel, writer=write_data_to_excel.write_xlsx_rows, rowReader=_iterExcel)
+register_format("xlsm", (".xlsm",), reader=_readExcel, rowReader=_iterExcel)   # macro workbooks are read like .xlsx files (their magic bytes are matched as "xlsx"), but can't be written
+register_format("xls", (".xls",), magic=b"\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1", reader=_readExcel, writer=write_data_to_excel.push_excel_data, rowReader=_iterExcel)
+register_format("csv", (".csv", ".csv.gz"), reader=_readCsv, writer=write_data_to_csv.write_csv_rows, rowReader=_iterCsv,
+                appender=_appendCsv)
+register_format("rows", (".rows",), magic=row_stream.MAGIC, reader=row_stream.get_row_stream_data, writer=row_stream.write_row_stream,
+                rowReader=row_stream.iter_row_stream, appender=_appendRowStream)
+register_format("jsonl", (".jsonl",), reader=row_stream.get_jsonl_data, writer=row_stream.write_jsonl_rows, rowReader=row_stream.iter_jsonl_rows,
+                appender=_appendJsonl)
+
+# Test Code - uncomment lines below & run for testing
+# payload = read_data("orderList.xlsx")
+# write_data("orderList.rows", payload)
+# print(detect_format("orderList.rows"), read_data("orderList.rows") == payload)   # rows True
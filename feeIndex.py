@@ -0,0 +1,113 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: feeIndex
+#
+# Overview: A fee index is a precompiled, integer-coded version of the fee schedule. The hashMap built by
+#   create_hashMap.py stores each territory row as a dictionary of column title -> cell text, which means pricing
+#   an order requires a string keyed dictionary lookup followed by int() on the base fee text every time. The fee
+#   index does that work once, up front:
+#     - every territory key (State + County + City) is "interned" into a small integer id (0, 1, 2, ...)
+#     - every product (Job Type column title) is interned into a small integer id (0, 1, 2, ...)
+#     - every base fee is parsed once and stored as a number in a dense 2-D array (a matrix) where the row is the
+#       territory id and the column is the product id. Visualization:
+#
+#                         product id:   0      1      2    ...
+#           territory id 0 (AL)      [ 573 ] [ 573 ] [ 698 ] ...
+#           territory id 1 (AK)      [ 552 ] [ 552 ] [ -1  ] ...   <- -1 is the QUOTE_FEE sentinel ('Quote' in the spreadsheet)
+#           ...
+#
+#   The matrix is stored row after row in a single array.array of machine integers (no per-cell Python objects), so a
+#   base fee lookup is simply fees[territoryId * productCount + productId]. Pricing an order becomes two integer
+#   lookups with no string parsing.
+#
+# Sentinels: QUOTE_FEE (-1) marks cells containing "Quote". MISSING_FEE (-2) marks cells that are blank or otherwise
+#   not a number, getBaseFee() raises a ValueError for these (the same as int() on the cell text would).
+#
+# Example Usage:
+#   index = feeIndex(titleRow, 3)                        # products start at the fourth column (after State, County, City)
+#   index.addTerritory("AL", rowArray[3:])               # add a territory and its fee cells
+#   territoryId = index.resolveTerritoryId(["ALJeffersonBirmingham", "ALJefferson", "AL"])
+#   baseFee = index.getBaseFee(territoryId, index.getProductId("Condo Appraisal (FNMA 1073)"))
+#
+#########################################################################################################
+import array # import array module, used for the dense fee matrix
+
+QUOTE_FEE = -1   # sentinel stored in the matrix for "Quote"
+MISSING_FEE = -2 # sentinel stored in the matrix for blank/non-numeric cells
+
+# Helper: convert a fee cell to the number stored in the matrix
+def _parseFee(cell):
+    if(isinstance(cell, int)):                 # already a number (for example when the spreadsheet was read with a typed schema)
+        return cell
+    if(isinstance(cell, float)):
+        return int(cell)
+    cell = str(cell)
+    if(cell.find("Quote") != -1):              # 'Quote' can be passed in from 'productFeesByState.xlsx' in certain states
+        return QUOTE_FEE
+    try : return int(cell)                     # the fee text is a whole number of dollars
+    except ValueError : return MISSING_FEE     # blank or otherwise not a number
+
+#########################################################################################################
+# feeIndex class: This class is the container for the interned territory/product ids and the fee matrix
+#########################################################################################################
+class feeIndex:
+    # Constructor to initialize class' local variables
+    # - titleRow: the title row of the fee schedule spreadsheet
+    # - productColumnStart: the column index of the first product (columns before it are the territory columns)
+    def __init__(self, titleRow, productColumnStart):
+        self.titleRow = list(titleRow)                            # the fee schedule's title row (territory column titles, then product names)
+        self.productColumnStart = productColumnStart
+        self.productNames = list(titleRow[productColumnStart:])   # product id -> product name
+        self.productIds = {}                                      # product name -> product id
+        for productId in range(len(self.productNames)):
+            self.productIds[self.productNames[productId]] = productId
+        self.productCount = len(self.productNames)
+        self.territoryKeys = []                                   # territory id -> territory key
+        self.territoryIds = {}                                    # territory key -> territory id
+        self.fees = array.array('l')                              # dense fee matrix, stored one territory row after another
+
+    # -> addTerritory Function:
+    # - intern a territory key and append its row of fee cells to the matrix. If the key was already added its row is
+    # overwritten, matching the hashMap (where the last put of a key wins).
+    def addTerritory(self, key, feeCells):
+        row = [ _parseFee(cell) for cell in feeCells[:self.productCount] ]
+        while(len(row) < self.productCount):                     # short rows are padded with the missing sentinel
+            row.append(MISSING_FEE)
+        territoryId = self.territoryIds.get(key)
+        if(territoryId == None):                                  # new territory, give it the next id and append its row
+            territoryId = len(self.territoryKeys)
+            self.territoryIds[key] = territoryId
+            self.territoryKeys.append(key)
+            self.fees.extend(row)
+        else:                                                     # existing territory, overwrite its row in place
+            start = territoryId * self.productCount
+            self.fees[start:start + self.productCount] = array.array('l', row)
+        return territoryId
+
+    # -> getTerritoryId Function: return the id for a territory key, or -1 if it is not in the index
+    def getTerritoryId(self, key):
+        return self.territoryIds.get(key, -1)
+
+    # -> resolveTerritoryId Function: return the id of the first candidate key found (most specific first), or -1 if none are found
+    def resolveTerritoryId(self, candidateKeys):
+        territoryIds = self.territoryIds
+        for key in candidateKeys:
+            territoryId = territoryIds.get(key)
+            if(territoryId != None):
+                return territoryId
+        return -1
+
+    # -> getProductId Function: return the id for a product name (Job Type), or -1 if it is not in the index
+    def getProductId(self, productName):
+        return self.productIds.get(productName, -1)
+
+    # -> getBaseFee Function: return the base fee for a territory id and product id. QUOTE_FEE is returned for 'Quote'.
+    def getBaseFee(self, territoryId, productId):
+        fee = self.fees[territoryId * self.productCount + productId]
+        if(fee == MISSING_FEE):
+            raise ValueError("No base fee for '" + self.productNames[productId] + "' in territory '" + self.territoryKeys[territoryId] + "'")
+        return fee
+
+    # -> getLength Function: return the number of territories in the index
+    def getLength(self):
+        return len(self.territoryKeys)
@@ -0,0 +1,126 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: feeMemo
+#
+# Overview: A fee memo remembers the fees that were already worked out, so orders that share the same pricing inputs don't
+#   work their fee out again. An order's commensurate fee (see compute_custom_algorithm._calculateFee()) only depends on:
+#     - the resolved territory key and the Job Type (which pick the base fee out of the fee schedule)
+#     - the tier (1, 2, 3 or "Q"), whether it was a rush, and how many complexities were found in its notes
+#   Thousands of orders share the same combination, so the memo stores key ( territory key, Job Type, tier, rush, complexity count ) -> fee
+#   and later orders with the same key get the stored fee instead of parsing the base fee and adding up the add-ons again.
+#
+# LRU bound: The memo holds at most 'maxSize' fees. It is kept in an OrderedDict in order of use (the least recently used fee first), a hit
+#   moves its fee to the back, and when a new fee doesn't fit the least recently used one is evicted. The hits, misses and evictions are
+#   counted (see getStats()) so the memo can be sized: a high eviction count with a low hit rate means maxSize is too small.
+#
+# Fee schedules: Territory keys and Job Types only mean something for the fee schedule they came from, so the memo is bound to one fee schedule
+#   package at a time. get() is handed the package the order is priced with, and a different package clears the memo before it is used.
+#
+# Disabling: setEnabled(0) turns the memo off (every get() is a miss that isn't counted and nothing is stored), so runs can be compared with
+#   and without it to check it never changes a fee.
+#
+# Example Usage:
+#   memo = feeMemo(4096)
+#   fee = memo.get(hash_map_package, key)           # MISSING if the fee for this key isn't known yet
+#   if(fee is MISSING):
+#       fee = _calculateFee(baseFee, tier, rush, complexityDetails)
+#       memo.put(key, fee)
+#   print(memo.getStats())                          # { "hits", "misses", "evictions", "size", "maxSize", "hitRate", "enabled" }
+#
+#########################################################################################################
+import collections # import collections module, used for the OrderedDict kept in order of use
+
+DEFAULT_MAX_SIZE = 4096 # the most fees held by default
+MISSING = object()      # returned by get() when the fee isn't in the memo (a fee can be 'Q', so None isn't used)
+
+#########################################################################################################
+# feeMemo class: This class is the container for the remembered fees and their counters
+#########################################################################################################
+class feeMemo:
+    # Constructor to initialize class' local variables
+    # - maxSize: the most fees held at once (at least 1)
+    def __init__(self, maxSize=DEFAULT_MAX_SIZE):
+        if(maxSize < 1):
+            raise ValueError("maxSize must be at least 1")
+        self.maxSize = maxSize
+        self.enabled = 1
+        self.entries = collections.OrderedDict()                  # key -> fee, least recently used first
+        self.owner = None                                         # the fee schedule package the fees were worked out with
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -> get Function:
+    # - return the fee remembered for a key (and mark it as the most recently used), or MISSING. The package is the fee schedule package the
+    # order is being priced with, a different package than the memo's fees were worked out with clears the memo first.
+    def get(self, hash_map_package, key):
+        if(self.enabled == 0):
+            return MISSING
+        if(hash_map_package is not self.owner):
+            self.entries.clear()
+            self.owner = hash_map_package
+        fee = self.entries.get(key, MISSING)
+        if(fee is MISSING):
+            self.misses += 1
+            return MISSING
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return fee
+
+    # -> put Function:
+    # - remember the fee for a key (call after get() returned MISSING), evicting the least recently used fee if the memo is full
+    def put(self, key, fee):
+        if(self.enabled == 0):
+            return
+        self.entries[key] = fee
+        if(len(self.entries) > self.maxSize):
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    # -> setEnabled Function:
+    # - turn the memo on (1) or off (0). Turning it off also forgets every fee.
+    def setEnabled(self, enabled):
+        self.enabled = int(enabled)
+        if(self.enabled == 0):
+            self.clear()
+
+    # -> setMaxSize Function:
+    # - change the most fees held, evicting the least recently used fees that no longer fit
+    def setMaxSize(self, maxSize):
+        if(maxSize < 1):
+            raise ValueError("maxSize must be at least 1")
+        self.maxSize = maxSize
+        while(len(self.entries) > self.maxSize):
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    # -> clear Function:
+    # - forget every fee (the counters are kept, see resetStats())
+    def clear(self):
+        self.entries.clear()
+        self.owner = None
+
+    # -> resetStats Function:
+    # - set the hit, miss and eviction counters back to zero
+    def resetStats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # -> getStats Function:
+    # - return the counters and settings: { "hits", "misses", "evictions", "size", "maxSize", "hitRate", "enabled" } (hitRate is hits / lookups, 0.0 before any lookup)
+    def getStats(self):
+        lookups = self.hits + self.misses
+        hitRate = 0.0
+        if(lookups > 0):
+            hitRate = self.hits / lookups
+        return { "hits" : self.hits, "misses" : self.misses, "evictions" : self.evictions, "size" : len(self.entries), "maxSize" : self.maxSize,
+                 "hitRate" : hitRate, "enabled" : self.enabled }
+
+## Test Code - uncomment lines below & run for testing (the oldest fee is evicted once the memo is full)
+# memo = feeMemo(2)
+# package = object()
+# for key in [ "a", "b", "a", "c", "b" ]:
+#     if(memo.get(package, key) is MISSING):
+#         memo.put(key, key.upper())
+# print(memo.getStats())   # 1 hit ("a"), 4 misses, 2 evictions ("b" then "a")
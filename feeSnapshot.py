@@ -0,0 +1,242 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: feeSnapshot
+#
+# Overview: A fee snapshot is a feeIndex (see 'feeIndex.py') written out to a flat binary file that can be memory-mapped. A feeIndex
+#   lives in one process's memory, so if the orders are split across several worker processes every worker would have to rebuild the
+#   index from the spreadsheet or be sent a pickled copy of it. A snapshot file is written once; every process then maps the same file
+#   read-only, and the operating system shares one physical copy of it between all of them. Lookups read straight from the mapping
+#   (through memoryviews), nothing is copied into the process or turned into Python objects up front.
+#
+# File Layout: every number is a native-order machine integer, sections start on 8 byte boundaries.
+#
+#       header          magic "FEESNAP1", version, byte order marker, product column start, title count, product count,
+#                       territory count, product slot count, territory slot count, then the byte offset of each section below
+#       title strings   the fee schedule's title row (territory column titles followed by product names), as a string table
+#       territory keys  every territory key (State + County + City), as a string table, in territory id order
+#       product slots   open addressing hash table of product name -> its position in the title row (int32 per slot, -1 is an empty slot)
+#       territory slots open addressing hash table of territory key -> territory id
+#       fees            the fee matrix, int32 per cell, one territory row after another (same layout and sentinels as feeIndex.fees)
+#
+#   A string table is an array of (count + 1) uint32 offsets followed by the utf-8 bytes of every string; string i is the bytes between
+#   offsets i and i + 1. The hash tables hash the key's utf-8 bytes with FNV-1a (hashMap.fnv1aHash, which is the same in every process,
+#   unlike Python's built in hash()) and probe linearly; a slot holds the id of a string, which is compared against the key to confirm a hit.
+#
+# Description: write_snapshot(fee_index, filepath) writes a snapshot of a feeIndex. mappedFeeIndex(filepath) maps a snapshot and has the
+#   same lookup API as feeIndex (getTerritoryId(), resolveTerritoryId(), getProductId(), getBaseFee(), getLength()), so it can be put in
+#   a data_structure_package in place of a feeIndex and used by compute_custom_algorithm.run(). A mappedFeeIndex pickles as just its file
+#   path, so sending one to a worker process sends a few bytes and the worker maps the same file.
+#
+# Example Usage:
+#   write_snapshot(hash_map_package.fee_index, "fees.snapshot")
+#   fee_index = mappedFeeIndex("fees.snapshot")
+#   baseFee = fee_index.getBaseFee(fee_index.resolveTerritoryId(["ALJeffersonBirmingham", "ALJefferson", "AL"]), fee_index.getProductId("Condo Appraisal (FNMA 1073)"))
+#
+#########################################################################################################
+import array   # import array module, used to build the sections of the file
+import mmap    # import memory map module
+import os      # import os module, used to replace the snapshot file in one step
+import struct  # import struct module, used to read/write the header
+import feeIndex # import fee index library module (for its sentinels)
+import hashMap  # import hashmap library module (for its FNV-1a hash function)
+
+SNAPSHOT_MAGIC = b"FEESNAP1"
+SNAPSHOT_VERSION = 1
+BYTE_ORDER_MARK = 0x01020304                      # reads back differently on a machine with the other byte order
+_HEADER = struct.Struct("=8s8I8Q")                # magic, 8 counts (7 used + padding), 8 section offsets
+_EMPTY_SLOT = -1
+
+# Helper: return the number of hash table slots for a number of keys (a power of two, at most half full)
+def _slotCount(keyCount):
+    slots = 8
+    while(slots < keyCount * 2):
+        slots = slots * 2
+    return slots
+
+# Helper: return a string table (uint32 offsets followed by utf-8 bytes) for an array of strings, as bytes
+def _stringTable(strings):
+    offsets = array.array('I', [0])
+    blob = bytearray()
+    for string in strings:
+        blob.extend(str(string).encode("utf-8"))
+        offsets.append(len(blob))
+    return offsets.tobytes() + bytes(blob)
+
+# Helper: return an open addressing hash table (int32 id per slot) for a dictionary of string -> id, as bytes
+def _hashTable(ids):
+    slotCount = _slotCount(len(ids))
+    mask = slotCount - 1
+    slots = array.array('i', [_EMPTY_SLOT]) * slotCount
+    for key in ids:
+        slot = hashMap.fnv1aHash(str(key)) & mask
+        while(slots[slot] != _EMPTY_SLOT):           # linear probing
+            slot = (slot + 1) & mask
+        slots[slot] = ids[key]
+    return slotCount, slots.tobytes()
+
+# Helper: pad a bytearray out to the next 8 byte boundary
+def _align(data):
+    while(len(data) % 8 != 0):
+        data.append(0)
+
+# This function writes a snapshot of a feeIndex to a file. The file is written to a temporary file first and then moved into place, so a
+#   process that already has the old snapshot mapped keeps reading the old file.
+def write_snapshot(fee_index, filepath):
+    titleRow = fee_index.titleRow
+    productTitleIds = {}                             # product names are looked up in the title row, so the product table holds title row positions
+    for productName in fee_index.productIds:
+        productTitleIds[productName] = fee_index.productIds[productName] + fee_index.productColumnStart
+    productSlotCount, productSlots = _hashTable(productTitleIds)
+    territorySlotCount, territorySlots = _hashTable(fee_index.territoryIds)
+    fees = array.array('i', fee_index.fees)          # the matrix is stored as int32 so every platform reads it the same size
+
+    body = bytearray()
+    offsets = []
+    for section in (_stringTable(titleRow), _stringTable(fee_index.territoryKeys), productSlots, territorySlots, fees.tobytes()):
+        offsets.append(_HEADER.size + len(body))
+        body.extend(section)
+        _align(body)
+    offsets.append(_HEADER.size + len(body))         # end of the file
+
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, BYTE_ORDER_MARK, fee_index.productColumnStart, len(titleRow),
+                          fee_index.productCount, len(fee_index.territoryKeys), productSlotCount, territorySlotCount,
+                          offsets[0], offsets[1], offsets[2], offsets[3], offsets[4], offsets[5], 0, 0)
+    temporaryFile = filepath + "." + str(os.getpid()) + ".tmp"
+    with open(temporaryFile, "wb") as outputFile:
+        outputFile.write(header)
+        outputFile.write(body)
+    os.replace(temporaryFile, filepath)
+
+#########################################################################################################
+# mappedFeeIndex class: This class maps a snapshot file read-only and looks fees up straight from the mapping
+#########################################################################################################
+class mappedFeeIndex:
+    # Constructor to initialize class' local variables (raises a ValueError if the file isn't a snapshot this version can read)
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self._open()
+
+    # -> _open Function (internal): map the file and set up memoryviews over each of its sections
+    def _open(self):
+        with open(self.filepath, "rb") as inputFile:
+            self._mapping = mmap.mmap(inputFile.fileno(), 0, access=mmap.ACCESS_READ)   # the mapping stays valid after the file is closed
+        self._view = memoryview(self._mapping)
+        fields = None
+        if(len(self._view) >= _HEADER.size):
+            fields = _HEADER.unpack_from(self._view, 0)
+        if(fields == None or fields[0] != SNAPSHOT_MAGIC or fields[1] != SNAPSHOT_VERSION):
+            self.close()
+            raise ValueError("'" + self.filepath + "' is not a version " + str(SNAPSHOT_VERSION) + " fee snapshot")
+        if(fields[2] != BYTE_ORDER_MARK):
+            self.close()
+            raise ValueError("'" + self.filepath + "' was written on a machine with a different byte order")
+        self.productColumnStart = fields[3]
+        self.titleCount = fields[4]
+        self.productCount = fields[5]
+        self.territoryCount = fields[6]
+        productSlotCount = fields[7]
+        territorySlotCount = fields[8]
+        titleStart, territoryKeyStart, productSlotStart, territorySlotStart, feeStart, end = fields[9:15]
+
+        # string tables: (offsets, utf-8 bytes)
+        self._titleOffsets, self._titleBytes = self._stringTableViews(titleStart, self.titleCount)
+        self._territoryOffsets, self._territoryBytes = self._stringTableViews(territoryKeyStart, self.territoryCount)
+        self._productSlots = self._view[productSlotStart:productSlotStart + productSlotCount * 4].cast('i')
+        self._territorySlots = self._view[territorySlotStart:territorySlotStart + territorySlotCount * 4].cast('i')
+        self.fees = self._view[feeStart:feeStart + self.territoryCount * self.productCount * 4].cast('i')
+
+    # -> _stringTableViews Function (internal): return (offsets view, bytes view) for the string table starting at a byte offset
+    def _stringTableViews(self, start, count):
+        offsets = self._view[start:start + (count + 1) * 4].cast('I')
+        blobStart = start + (count + 1) * 4
+        return offsets, self._view[blobStart:blobStart + offsets[count]]
+
+    # -> _find Function (internal): return the id of a key in one of the hash tables, or -1 if it isn't there
+    def _find(self, slots, offsets, strings, key):
+        keyBytes = key.encode("utf-8")
+        mask = len(slots) - 1
+        slot = hashMap.fnv1aHash(key) & mask
+        stringId = slots[slot]
+        while(stringId != _EMPTY_SLOT):
+            if(strings[offsets[stringId]:offsets[stringId + 1]] == keyBytes):   # compares the mapped bytes in place
+                return stringId
+            slot = (slot + 1) & mask
+            stringId = slots[slot]
+        return -1
+
+    # -> getTerritoryId Function: return the id for a territory key, or -1 if it is not in the snapshot
+    def getTerritoryId(self, key):
+        return self._find(self._territorySlots, self._territoryOffsets, self._territoryBytes, key)
+
+    # -> resolveTerritoryId Function: return the id of the first candidate key found (most specific first), or -1 if none are found
+    def resolveTerritoryId(self, candidateKeys):
+        for key in candidateKeys:
+            territoryId = self.getTerritoryId(key)
+            if(territoryId != -1):
+                return territoryId
+        return -1
+
+    # -> getProductId Function: return the id for a product name (Job Type), or -1 if it is not in the snapshot
+    def getProductId(self, productName):
+        titleId = self._find(self._productSlots, self._titleOffsets, self._titleBytes, productName)
+        if(titleId == -1):
+            return -1
+        return titleId - self.productColumnStart     # product names are stored as part of the title row
+
+    # -> getBaseFee Function: return the base fee for a territory id and product id. feeIndex.QUOTE_FEE is returned for 'Quote'.
+    def getBaseFee(self, territoryId, productId):
+        fee = self.fees[territoryId * self.productCount + productId]
+        if(fee == feeIndex.MISSING_FEE):
+            raise ValueError("No base fee for '" + self.getProductName(productId) + "' in territory '" + self.getTerritoryKey(territoryId) + "'")
+        return fee
+
+    # -> getLength Function: return the number of territories in the snapshot
+    def getLength(self):
+        return self.territoryCount
+
+    # -> getTerritoryKey / getProductName Functions: return the text of a territory key or product name by id
+    def getTerritoryKey(self, territoryId):
+        return bytes(self._territoryBytes[self._territoryOffsets[territoryId]:self._territoryOffsets[territoryId + 1]]).decode("utf-8")
+
+    def getProductName(self, productId):
+        titleId = self.productColumnStart + productId
+        return bytes(self._titleBytes[self._titleOffsets[titleId]:self._titleOffsets[titleId + 1]]).decode("utf-8")
+
+    # -> getTitleRow Function: return the fee schedule's title row (decoded, so this makes a copy)
+    def getTitleRow(self):
+        return [ bytes(self._titleBytes[self._titleOffsets[i]:self._titleOffsets[i + 1]]).decode("utf-8") for i in range(self.titleCount) ]
+
+    # -> close Function: release the memoryviews and unmap the file
+    def close(self):
+        for name in ("fees", "_territorySlots", "_productSlots", "_territoryBytes", "_territoryOffsets", "_titleBytes", "_titleOffsets", "_view"):
+            view = self.__dict__.pop(name, None)
+            if(view != None):
+                view.release()
+        if(self.__dict__.get("_mapping") != None):
+            self._mapping.close()
+            self._mapping = None
+
+    # -> Python context manager protocol: 'with mappedFeeIndex(path) as fee_index:' closes the mapping at the end of the block
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exceptionType, exception, traceback):
+        self.close()
+
+    # -> Python pickle protocol: only the file path is pickled, unpickling (e.g. in a worker process) maps the same file
+    def __getstate__(self):
+        return { "filepath" : self.filepath }
+
+    def __setstate__(self, state):
+        self.filepath = state["filepath"]
+        self._open()
+
+## Test Code - uncomment lines below & run for testing (the snapshot must give the same base fees as the feeIndex it was written from)
+# import read_data_from_excel, create_hashMap
+# fee_index = create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1).fee_index
+# write_snapshot(fee_index, "fees.snapshot")
+# with mappedFeeIndex("fees.snapshot") as mapped:
+#     for key in fee_index.territoryKeys:
+#         for productName in fee_index.productNames:
+#             assert mapped.fees[mapped.getTerritoryId(key) * mapped.productCount + mapped.getProductId(productName)] == fee_index.fees[fee_index.getTerritoryId(key) * fee_index.productCount + fee_index.getProductId(productName)]
+#     print("snapshot matches,", mapped.getLength(), "territories")
@@ -1,242 +1,676 @@
-##########################################################################################################
-# Author: Timothy Fye
-# Title: hashMap
-#
-# Overview: A hashmap is a data structure that stores key/value pairs. It leverages indexing to be very 
-#   efficient. First the size of the hashmap is provided. A hashmap will then be created with an equal number of 
-#   'compartments' as desired size. A hasmap can essentially be conceptualized as an array. A hashmap takes a 
-#   provided key, which for example could be a string of text, then runs the key through a hash function. 
-#   That hash function converts letters into digits. The digits is then divided by the size of the hashmap and
-#   the remainder is found (using the modulus function). Finding the modulus (or remainder) gaurantees that 
-#   the result will be somewhere between 0 and the size (as a remainder cannot be greater than the divisor). 
-#   The remainder becomes the "comparment" (better visualized as array index/element) where the 
-#   key/value node will be stored. There is a chance that two different keys result in the same comparment.   
-#   As a result, each "compartment" (or array element) is a linked list. If there are multiple nodes then they
-#   are simply chained together. This direct indexing approach allows for extremely efficient operations. 
-#   Note on asymptotic runtime complexity: This data structure generally has big-O complexity of O(1). Direct  
-#   indexing means there is no traversal, and you go straight to the node you want to evaluate. Granted, if there
-#   are alot of "collisions" (aka a ton of nodes share the same "compartment") then the O(n) property of linked 
-#   lists will decrease efficency. Good hash map data structures will re-size when they get too full to avoid this. 
-#   
-# Purpose: I use hashmaps for alot of different project. At the core they are a collection of nodes with two simple variables, 
-#   a key variable and a value variable. The primary use-case is to read data in from an excel spreadsheet and store each row 
-#   data as a dictionary of values in a node (I could also store columns as nodes if desired). Within the dictionary (which 
-#   itself will be stored in a node's 'value' variable), each column name is the key and the value is the cell for each row. 
-#   Don't forget dictionary are key-value pair structures themselves. Why not just use dictionaries? They are great for 
-#   simple maps, but more complex projects require slightly more complex data structures such as this. 
-# 
-# Description: Review the methods below to get a better understanding of this library's API. 
-#
-##########################################################################################################
-
-##########################################################################################################
-# Node class: This class is purposed for containing a key/value pair. (The value passed to this data 
-# structure can be either a single variable or an array. The node needs to be built with a next pointer, 
-# so we can create a singly linked list. If our hash key function yeilds a collision, we can add the node 
-# to the same index that is currently in use, but simply make the all nodes in that index a linked list. 
-##########################################################################################################
-class hashNode:
-    # Constructor function to hold & set the class' local variables
-    def __init__(self, input_key, input_value):
-            self.key = input_key
-            self.value = input_value # this can be any type of variable - such as a dictionary, string, int, or array of any of a type.  
-            self.nextPtr = None      # next pointer for node, initialzed to null. This may eventually point to another node to make a linked list.
-
-#########################################################################################################
-# hashMap class: This class is the container for the entire hashMap "Value Variable" data structure
-#########################################################################################################
-class hashMap:
-    # Constructor to initialize class' local variables 
-    def __init__(self, input_capacity):
-        self.table = [None] * input_capacity  # table/array that will contain the hashNodes, initialize the array with desired elements
-        self.size = 0                         # define the size of the hashMap
-        self.capacity = input_capacity        # define the capacity of the hashMap
-
-    # Hash function # 1
-    # - Convert a key string to an integer value, where we can then divide that by capacity 
-    # and place our node into the appropraite index. Retrieval will put the key through this 
-    # same function. This means the hash map data structure will operate in constant time O(1)
-    # during retreivals
-    def hashFunction1(self, key):
-        numeralKeyValue = 0                      # declare a variable and intialize to zero 
-        for char in key:                         # loop through each character in the provided key string 
-            numeralConvertion = ord(char)        # convert the numeral value to it's numeric representation using ord function
-            numeralKeyValue += numeralConvertion # keep adding each value to our numeral index so we have a single value that will determine our index
-        return numeralKeyValue                   # return the aggregated numeral value for handling by calling function
-
-    # Hash function # 2
-    # - This function can be used in lieu of hashFunction1 (only use one of the two for any instantiated hash map, otherwise the retrievals wont work) 
-    # - This option has a more complicated hash function index, in theory this function will have less collisions than option number # 1        
-    def hashFunction2(self, key):
-        numeralKeyValue = 0                      # declare a variable and intialize to zero 
-        for char in key:                         # loop through each character in the provided key string 
-            numeralConvertion = ord(char)        # convert the numeral value to it's numeric representation using ord function
-            # keep adding each value to our numeral index so we have a single value that will determine our index. This time, 
-            # we take the numeral value of the character and multiply it by the numeral value of the character plus one. This way 
-            # we can have a more unique final value.
-            numeralKeyValue += numeralConvertion * (numeralConvertion + 1) 
-        return numeralKeyValue                   # return the aggregated numeral value for handling by calling function
-
-    # Hash Map Put Function
-    # - Enter (or update) a key/value pair   
-    def hashMapPut(self, key, value):
-
-        # check to see if we need to resize 
-        usage = self.size/self.capacity  # calculate the % of index slots used 
-
-        # resize the data structure if used slots exceed 70% of total data structure
-        if(usage > 0.70):
-            self.hashMapResize() #re-set the 'self' attribute to equal the newly returned hash map
-
-        # find the targeted index where we should drop the new Node
-        # - use the mudulo operator to find the remainder of dividing the resuls of the hash function 
-        # and the capacity of the hash map's table/array. We use mudulos operator to guarantee that 
-        # the index will not exceed capacity, as we will be bounded in capacity. 
-        index = self.hashFunction1(key) % self.capacity 
-
-        # create a variable that will serve as a pointer to the current node in the index (if there is one)
-        nodePtr = self.table[index]
-
-        # if there is no link currently in the index, we can just create a new node. The node constructor 
-        # will automatically initialize the list to point to null for us
-        if(nodePtr == None):
-            # since there is no "new" or "malloc" operator in python, dynamic memory operates differently.   
-            new = hashNode(key,value)  # Create a new linkedListNode object and pass the parameters through to the linkedListNode constructor.
-            self.table[index] = new      # Place the new object into my table at the empty index 
-        # else there is a link currently in the index, and we need to
-        # 1) check to see if the current key/value node is already in there while performing step two (if so, we aren't going to re-add it)
-        # 2) traverse the nodePtr all the way to the end of the list
-        # 3) join it to existing nodes so we have a linked list
-        else:
-            # create a variable (treated as a bool), that will be marked true if we find the key exists below. 
-            keyFoundBool = 0
-
-            # while loop will itereate the linked list that is in the particular index (visualization below)
-            # Table Index:    Contents of Index:
-            # _______________ _____________
-            # [             ] * -> * -> * 
-            # [current index] * -> *         <----- we are traversing this list in index "current index"
-            # [             ] None
-            while(nodePtr.nextPtr != None): # while the linked list's current pointer's next pointer is not null, keep iterating
-                # if the currentPtr's key (this is typically a 'string') is not equal to the key we are passing in, then the does not node exist already.         
-                if(nodePtr.key != key):
-                    # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linked list Node
-                    nodePtr = nodePtr.nextPtr
-                # Else the keys match and we found an existing value. Update the value instead of creating a new node.   
-                else:
-                    # set the bool variable to true, we found the key
-                    keyFoundBool = 1
-                    # update the found key's value to the new value
-                    nodePtr.value = value
-                    # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linkedListNode
-                    nodePtr = nodePtr.nextPtr
-            
-            # if the keyBoolFound is false (or 0), we need to add our Node to the end of the linked list
-            if(keyFoundBool == 0):
-                # since there is no "new" or "malloc" operator in python, dynamic memory operates differently.   
-                new = hashNode(key,value)  # Create a new linkedListNode object and pass the parameters through to the linkedListNode constructor.
-                nodePtr.nextPtr = new     # Set the currentPtr's nextPtr node (now at end of the list) to 'point to' (or contain) the new node.
-
-        # finally, update the hash map's size since we added a node 
-        self.size = self.size + 1
-
-    # Hash Map Get Function:   
-    # - return a value from a key/value pair     
-    def hashMapGet(self, key):
-        # find the targeted index where we should drop the new Node
-        # - use the mudulo operator to find the remainder of dividing the resuls of the hash function 
-        # and the capacity of the hash map's table/array. We use mudulos operator to guarantee that 
-        # the index will not exceed capacity, as we will be bounded in capacity. 
-        index = self.hashFunction1(key) % self.capacity 
-
-        # create a variable that will serve as a pointer to the current node in the index (if there is one)
-        nodePtr = self.table[index]
-
-        # while loop will itereate the linked list that is in the particular index (visualization below)
-        # Table Index:    Contents of Index:
-        # _______________ _____________
-        # [             ] * -> * -> * 
-        # [current index] * -> *         <----- we are traversing this list in index "current index"
-        # [             ] None
-        while(nodePtr != None): # while the linked list's current pointer is not null, keep iterating
-            # if the currentPtr's key (this is typically a 'string') is not equal to the key we are passing in, then the does not node exist already.         
-            if(nodePtr.key != key):
-                # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linked list Node
-                nodePtr = nodePtr.nextPtr
-            # Else the keys match and we found an existing value. Return the node's value  
-            else:
-                # return the value in current node
-                return nodePtr.value 
-        
-        # if we made it here, then we can return zero 
-        return 0
-
-    # Hash Map Contains Function:   
-    # - return a bool to show if a key/value pair is in the hash map    
-    def hashMapContains(self, key):
-        # find the targeted index where we should drop the new Node
-        # - use the mudulo operator to find the remainder of dividing the resuls of the hash function 
-        # and the capacity of the hash map's table/array. We use mudulos operator to guarantee that 
-        # the index will not exceed capacity, as we will be bounded in capacity. 
-        index = self.hashFunction1(key) % self.capacity 
-
-        # create a variable that will serve as a pointer to the current node in the index (if there is one)
-        nodePtr = self.table[index]
-
-        # while loop will itereate the linked list that is in the particular index (visualization below)
-        # Table Index:    Contents of Index:
-        # _______________ _____________
-        # [             ] * -> * -> * 
-        # [current index] * -> *         <----- we are traversing this list in index "current index"
-        # [             ] None
-        while(nodePtr != None): # while the linked list's current pointer is not null, keep iterating
-            # if the currentPtr's key (this is typically a 'string') is not equal to the key we are passing in, then the does not node exist already.         
-            if(nodePtr.key != key):
-                # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linked list Node
-                nodePtr = nodePtr.nextPtr
-            # Else the keys match and we found an existing value. Return the node's value  
-            else:
-                # return true
-                return 1 
-        # if we made it here, then we can return false
-        return 0
-
-    # Resize Table Function:   
-    # - resize the hash table. Otherwise it will get too full and we will have
-    # too many collisions. Collisions equal long linked lists per index, which 
-    # results in a longer retreival time than O(1).     
-    def hashMapResize(self):
-        # prepare an empty array 
-        tempArray = []
-
-        # copy all data contained in self.hashMap into our array
-        for index in self.table:                                  # go through the whole array/table in current hash map
-            nodePtr = index                                       # create a variable called nodePtr and set it to the node containted in the current index 
-            while(nodePtr != None):                               # traverse through the linked list that is in this index  
-                tempArray.append([nodePtr.key, nodePtr.value])    # append key/value pair sub-array in array                      
-                nodePtr = nodePtr.nextPtr                         # iterate to end of linked list 
- 
-        # re-initialize our dataStructure in preparation for re-build
-        self.table = [None] * (self.capacity * 2)  # double-sized table/array that will contain the hashNodes, initialize the array with desired elements 
-        self.size = 0                              # set size back to zero        
-        self.capacity = (self.capacity * 2)        # double our capacity
-
-        # now pass all data back into the newly sized & initialized data structure
-        for subarray_entry in tempArray:
-            self.hashMapPut(subarray_entry[0],subarray_entry[1]) # reference the sub array, send the saved key/value back to data structure using hasMapPut
-
-    # Print Map Function: Must be handled in calling script since we do not know what type of value was past in. 
-    # Remove function could be added here 
-
-
-
-# Test Code - uncomment lines below & run for testing 
-#Map = hashMap(4000) # Instantiate new hashmap 
-#orderOne = { "customer" : "John Smith", "product" : "samsung phone" , "tracking number" : "389175", "order date" : "10/18/2018", "cost" : 650 }   # Declare dictionary
-#orderTwo = { "customer" : "Tony Gonzales", "product" : "apple iphone" , "tracking number" : "21456", "order date" : "10/17/2018", "cost" : 1650 } # Declare dictionary
-#orderThree = { "customer" : "Jimmy Johnson", "product" : "flip phone" , "tracking number" : "11125", "order date" : "10/1/2018", "cost" : 1 }     # Declare dictionary
-#Map.hashMapPut("order_one",orderOne)     # Put record in map
-#Map.hashMapPut("order_two",orderTwo)     # Put record in map
-#Map.hashMapPut("order_three",orderThree) # Put record in map
-#value = Map.hashMapGet("order_two")      # Test retrieving a value  
-#print(value)                             # Print value               
\ No newline at end of file
+##########################################################################################################
+# Author: Timothy Fye
+# Title: hashMap
+#
+# Overview: A hashmap is a data structure that stores key/value pairs. It leverages indexing to be very 
+#   efficient. First the size of the hashmap is provided. A hashmap will then be created with an equal number of 
+#   'compartments' as desired size. A hasmap can essentially be conceptualized as an array. A hashmap takes a 
+#   provided key, which for example could be a string of text, then runs the key through a hash function. 
+#   That hash function converts letters into digits. The digits is then divided by the size of the hashmap and
+#   the remainder is found (using the modulus function). Finding the modulus (or remainder) gaurantees that 
+#   the result will be somewhere between 0 and the size (as a remainder cannot be greater than the divisor). 
+#   The remainder becomes the "comparment" (better visualized as array index/element) where the 
+#   key/value node will be stored. There is a chance that two different keys result in the same comparment.   
+#   As a result, each "compartment" (or array element) is a linked list. If there are multiple nodes then they
+#   are simply chained together. This direct indexing approach allows for extremely efficient operations. 
+#   Note on asymptotic runtime complexity: This data structure generally has big-O complexity of O(1). Direct  
+#   indexing means there is no traversal, and you go straight to the node you want to evaluate. Granted, if there
+#   are alot of "collisions" (aka a ton of nodes share the same "compartment") then the O(n) property of linked 
+#   lists will decrease efficency. Good hash map data structures will re-size when they get too full to avoid this. 
+#   
+# Purpose: I use hashmaps for alot of different project. At the core they are a collection of nodes with two simple variables, 
+#   a key variable and a value variable. The primary use-case is to read data in from an excel spreadsheet and store each row 
+#   data as a dictionary of values in a node (I could also store columns as nodes if desired). Within the dictionary (which 
+#   itself will be stored in a node's 'value' variable), each column name is the key and the value is the cell for each row. 
+#   Don't forget dictionary are key-value pair structures themselves. Why not just use dictionaries? They are great for 
+#   simple maps, but more complex projects require slightly more complex data structures such as this. 
+# 
+# Description: Review the methods below to get a better understanding of this library's API. 
+#   Two engines are provided with the same hashMapPut/hashMapGet/hashMapContains API:
+#     - hashMap: the original chained design (each compartment is a linked list of hashNodes)
+#     - compactHashMap: an array-backed, open addressing design with cached hashes and no per-entry node objects.
+#       This is the engine to use for lookups in hot loops (such as the fee schedule lookups in compute_custom_algorithm.run())
+#
+##########################################################################################################
+
+##########################################################################################################
+# Hash functions: The functions below can be selected when a hashMap or compactHashMap is constructed, either by
+#   passing the function itself or its name from HASH_FUNCTIONS (e.g. hashMap.compactHashMap(4000, "fnv1a")).
+#   Unlike hashFunction1/hashFunction2 (which sum character ordinals, so every anagram and many State+County+City
+#   concatenations land in the same compartment), these mix every byte of the key into the result. They return
+#   an integer, the hash map is responsible for reducing it to a compartment index.
+##########################################################################################################
+_MASK64 = 0xFFFFFFFFFFFFFFFF  # used to keep arithmetic within 64 bits, mimicking unsigned 64 bit integers in C
+
+# Helper: convert a key into bytes so the byte-oriented hash functions below can consume it
+def _keyBytes(key):
+    if(isinstance(key, bytes)):
+        return key
+    return str(key).encode("utf-8")
+
+# FNV-1a (64 bit): for every byte, xor it into the hash and then multiply by the FNV prime. Simple, fast and stable
+# across processes/runs (unlike Python's builtin hash, which is randomized per process for strings)
+def fnv1aHash(key):
+    keyHash = 0xcbf29ce484222325                 # FNV offset basis
+    for byte in _keyBytes(key):
+        keyHash = keyHash ^ byte                 # xor the byte into the bottom of the hash
+        keyHash = (keyHash * 0x100000001b3) & _MASK64 # multiply by the FNV prime, keep 64 bits
+    return keyHash
+
+# Helper: 64 bit left rotation used by SipHash
+def _rotateLeft64(value, bits):
+    return ((value << bits) | (value >> (64 - bits))) & _MASK64
+
+# SipHash-2-4: a keyed hash function. Given a secret 16 byte key the output cannot be predicted, so crafted input
+# cannot force collisions. It is slower than FNV-1a in pure Python but has the best distribution of the options here.
+def sipHash24(data, secretKey):
+    k0 = int.from_bytes(secretKey[0:8], "little")
+    k1 = int.from_bytes(secretKey[8:16], "little")
+    v0 = k0 ^ 0x736f6d6570736575
+    v1 = k1 ^ 0x646f72616e646f6d
+    v2 = k0 ^ 0x6c7967656e657261
+    v3 = k1 ^ 0x7465646279746573
+
+    length = len(data)
+    end = length - (length % 8)
+    # compress the message 8 bytes at a time (the 'rounds' loop runs 2 SipRounds per block, hence "2-4")
+    for blockStart in range(0, end + 8, 8):
+        if(blockStart < end):
+            block = int.from_bytes(data[blockStart:blockStart + 8], "little")
+        else: # the final block holds the remaining bytes and the message length in its top byte
+            block = ((length & 0xff) << 56) | int.from_bytes(data[end:], "little")
+        v3 = v3 ^ block
+        for rounds in range(2):
+            v0 = (v0 + v1) & _MASK64; v1 = _rotateLeft64(v1, 13); v1 = v1 ^ v0; v0 = _rotateLeft64(v0, 32)
+            v2 = (v2 + v3) & _MASK64; v3 = _rotateLeft64(v3, 16); v3 = v3 ^ v2
+            v0 = (v0 + v3) & _MASK64; v3 = _rotateLeft64(v3, 21); v3 = v3 ^ v0
+            v2 = (v2 + v1) & _MASK64; v1 = _rotateLeft64(v1, 17); v1 = v1 ^ v2; v2 = _rotateLeft64(v2, 32)
+        v0 = v0 ^ block
+
+    # finalization, 4 SipRounds
+    v2 = v2 ^ 0xff
+    for rounds in range(4):
+        v0 = (v0 + v1) & _MASK64; v1 = _rotateLeft64(v1, 13); v1 = v1 ^ v0; v0 = _rotateLeft64(v0, 32)
+        v2 = (v2 + v3) & _MASK64; v3 = _rotateLeft64(v3, 16); v3 = v3 ^ v2
+        v0 = (v0 + v3) & _MASK64; v3 = _rotateLeft64(v3, 21); v3 = v3 ^ v0
+        v2 = (v2 + v1) & _MASK64; v1 = _rotateLeft64(v1, 17); v1 = v1 ^ v2; v2 = _rotateLeft64(v2, 32)
+    return v0 ^ v1 ^ v2 ^ v3
+
+# Build a SipHash hash function bound to a secret key (for example makeSipHash(os.urandom(16)) for a per-run key)
+def makeSipHash(secretKey):
+    def sipHash(key):
+        return sipHash24(_keyBytes(key), secretKey)
+    return sipHash
+
+# Default SipHash, keyed with a fixed key so that results (and stats) are reproducible from run to run
+sipHash = makeSipHash(bytes(range(16)))
+
+# Names that can be passed to the hashMap/compactHashMap constructors in place of a function. "ordinal" and "ordinalSquare"
+# select the original hashFunction1 and hashFunction2 methods.
+HASH_FUNCTIONS = { "fnv1a" : fnv1aHash,
+                   "siphash" : sipHash,
+                   "builtin" : hash }
+
+# Helper: resolve the hashFunction constructor argument (None, a name, or a function) to the function a hash map should call
+def _resolveHashFunction(hash_map, hashFunction, default):
+    if(hashFunction == None):
+        return default
+    if(callable(hashFunction)):
+        return hashFunction
+    if(hashFunction == "ordinal"):
+        return hash_map.hashFunction1
+    if(hashFunction == "ordinalSquare"):
+        return hash_map.hashFunction2
+    if(hashFunction in HASH_FUNCTIONS):
+        return HASH_FUNCTIONS[hashFunction]
+    raise ValueError("Unknown hash function '" + str(hashFunction) + "'. Expected a function or one of: ordinal, ordinalSquare, " + ", ".join(HASH_FUNCTIONS))
+
+# Helper: the picklable form of a hash map's hash function, its name when it has one (the default SipHash is a closure and the ordinal
+# functions are methods of the map, so they are sent by name), otherwise the function itself (which must be a module level function)
+def _hashFunctionName(hash_map, hashFunction):
+    for name in HASH_FUNCTIONS:
+        if(HASH_FUNCTIONS[name] is hashFunction):
+            return name
+    if(hashFunction == hash_map.hashFunction1):
+        return "ordinal"
+    if(hashFunction == hash_map.hashFunction2):
+        return "ordinalSquare"
+    return hashFunction
+
+
+# Helper: build the (key, row dictionary) pairs for a hash map bulk load. Each row dictionary is built in one step by pairing the title row with
+# the row's cells (dict(zip(...))), rather than allocating a one-entry dictionary per cell and merging it in.
+def _rowRecords(valuesArray, keyFunction, skipTitleRow):
+    titleRow = valuesArray[0]
+    start = 0
+    if(skipTitleRow == 1):
+        start = 1
+    for rowIndex in range(start, len(valuesArray)):
+        rowArray = valuesArray[rowIndex]
+        yield keyFunction(rowArray), dict(zip(titleRow, rowArray))
+
+# Helper: the capacity a bulk load should start with so that 'rowCount' rows fit without any resize (resizes happen above 70% usage)
+def _presizedCapacity(rowCount):
+    return int(rowCount / 0.70) + 1
+
+##########################################################################################################
+# Node class: This class is purposed for containing a key/value pair. (The value passed to this data 
+# structure can be either a single variable or an array. The node needs to be built with a next pointer, 
+# so we can create a singly linked list. If our hash key function yeilds a collision, we can add the node 
+# to the same index that is currently in use, but simply make the all nodes in that index a linked list. 
+##########################################################################################################
+class hashNode:
+    # Constructor function to hold & set the class' local variables
+    def __init__(self, input_key, input_value):
+            self.key = input_key
+            self.value = input_value # this can be any type of variable - such as a dictionary, string, int, or array of any of a type.  
+            self.nextPtr = None      # next pointer for node, initialzed to null. This may eventually point to another node to make a linked list.
+
+#########################################################################################################
+# hashMap class: This class is the container for the entire hashMap "Value Variable" data structure
+#########################################################################################################
+class hashMap:
+    # Constructor to initialize class' local variables 
+    # - hashFunction (optional): a function or a name from HASH_FUNCTIONS, defaults to hashFunction1
+    def __init__(self, input_capacity, hashFunction=None):
+        self.table = [None] * input_capacity  # table/array that will contain the hashNodes, initialize the array with desired elements
+        self.size = 0                         # define the size of the hashMap
+        self.capacity = input_capacity        # define the capacity of the hashMap
+        self.hashFunction = _resolveHashFunction(self, hashFunction, self.hashFunction1) # hash function used for every put/get/contains
+
+    # -> from_rows Function (bulk constructor):
+    # - build a hash map from an array of arrays (spreadsheet rows, the first array being the title row). Each row is stored as a dictionary of
+    # column title -> cell, under the key returned by keyFunction(rowArray). The table is sized up front from the row count, so the load
+    # never triggers a chain of resizes. By default the title row itself is not stored (skipTitleRow=1).
+    # Example: hashMap.hashMap.from_rows(spreadsheetArray, lambda row: row[0] + row[1] + row[2])
+    @classmethod
+    def from_rows(cls, valuesArray, keyFunction, skipTitleRow=1, hashFunction=None):
+        hash_map = cls(_presizedCapacity(len(valuesArray)), hashFunction)
+        for key, row_values in _rowRecords(valuesArray, keyFunction, skipTitleRow):
+            hash_map.hashMapPut(key, row_values)
+        return hash_map
+
+    # Hash function # 1
+    # - Convert a key string to an integer value, where we can then divide that by capacity 
+    # and place our node into the appropraite index. Retrieval will put the key through this 
+    # same function. This means the hash map data structure will operate in constant time O(1)
+    # during retreivals
+    def hashFunction1(self, key):
+        numeralKeyValue = 0                      # declare a variable and intialize to zero 
+        for char in key:                         # loop through each character in the provided key string 
+            numeralConvertion = ord(char)        # convert the numeral value to it's numeric representation using ord function
+            numeralKeyValue += numeralConvertion # keep adding each value to our numeral index so we have a single value that will determine our index
+        return numeralKeyValue                   # return the aggregated numeral value for handling by calling function
+
+    # Hash function # 2
+    # - This function can be used in lieu of hashFunction1 (only use one of the two for any instantiated hash map, otherwise the retrievals wont work) 
+    # - This option has a more complicated hash function index, in theory this function will have less collisions than option number # 1        
+    def hashFunction2(self, key):
+        numeralKeyValue = 0                      # declare a variable and intialize to zero 
+        for char in key:                         # loop through each character in the provided key string 
+            numeralConvertion = ord(char)        # convert the numeral value to it's numeric representation using ord function
+            # keep adding each value to our numeral index so we have a single value that will determine our index. This time, 
+            # we take the numeral value of the character and multiply it by the numeral value of the character plus one. This way 
+            # we can have a more unique final value.
+            numeralKeyValue += numeralConvertion * (numeralConvertion + 1) 
+        return numeralKeyValue                   # return the aggregated numeral value for handling by calling function
+
+    # Hash Map Put Function
+    # - Enter (or update) a key/value pair   
+    def hashMapPut(self, key, value):
+
+        # check to see if we need to resize 
+        usage = self.size/self.capacity  # calculate the % of index slots used 
+
+        # resize the data structure if used slots exceed 70% of total data structure
+        if(usage > 0.70):
+            self.hashMapResize() #re-set the 'self' attribute to equal the newly returned hash map
+
+        # find the targeted index where we should drop the new Node
+        # - use the mudulo operator to find the remainder of dividing the resuls of the hash function 
+        # and the capacity of the hash map's table/array. We use mudulos operator to guarantee that 
+        # the index will not exceed capacity, as we will be bounded in capacity. 
+        index = self.hashFunction(key) % self.capacity 
+
+        # create a variable that will serve as a pointer to the current node in the index (if there is one)
+        nodePtr = self.table[index]
+
+        # if there is no link currently in the index, we can just create a new node. The node constructor 
+        # will automatically initialize the list to point to null for us
+        if(nodePtr == None):
+            # since there is no "new" or "malloc" operator in python, dynamic memory operates differently.   
+            new = hashNode(key,value)  # Create a new linkedListNode object and pass the parameters through to the linkedListNode constructor.
+            self.table[index] = new      # Place the new object into my table at the empty index
+            self.size = self.size + 1    # update the hash map's size since we added a node
+        # else there is a link currently in the index, and we need to
+        # 1) check to see if the current key/value node is already in there while performing step two (if so, we aren't going to re-add it)
+        # 2) traverse the nodePtr all the way to the end of the list
+        # 3) join it to existing nodes so we have a linked list
+        else:
+            # while loop will itereate the linked list that is in the particular index (visualization below). It stops early on the node holding our key,
+            # otherwise it stops on the last node of the chain (the last node's key is checked below, so a key stored at the tail is never added twice)
+            # Table Index:    Contents of Index:
+            # _______________ _____________
+            # [             ] * -> * -> *
+            # [current index] * -> *         <----- we are traversing this list in index "current index"
+            # [             ] None
+            while(nodePtr.nextPtr != None and nodePtr.key != key): # while there is a next node and we haven't found the key, keep iterating
+                # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linked list Node
+                nodePtr = nodePtr.nextPtr
+
+            # if the keys match we found an existing value. Update the value instead of creating a new node (the size does not change on an update)
+            if(nodePtr.key == key):
+                nodePtr.value = value
+            # else we are at the end of the linked list and need to add our Node to it
+            else:
+                # since there is no "new" or "malloc" operator in python, dynamic memory operates differently.
+                new = hashNode(key,value)  # Create a new linkedListNode object and pass the parameters through to the linkedListNode constructor.
+                nodePtr.nextPtr = new     # Set the currentPtr's nextPtr node (now at end of the list) to 'point to' (or contain) the new node.
+                self.size = self.size + 1 # update the hash map's size since we added a node
+
+    # Hash Map Get Function:   
+    # - return a value from a key/value pair     
+    def hashMapGet(self, key):
+        # find the targeted index where we should drop the new Node
+        # - use the mudulo operator to find the remainder of dividing the resuls of the hash function 
+        # and the capacity of the hash map's table/array. We use mudulos operator to guarantee that 
+        # the index will not exceed capacity, as we will be bounded in capacity. 
+        index = self.hashFunction(key) % self.capacity 
+
+        # create a variable that will serve as a pointer to the current node in the index (if there is one)
+        nodePtr = self.table[index]
+
+        # while loop will itereate the linked list that is in the particular index (visualization below)
+        # Table Index:    Contents of Index:
+        # _______________ _____________
+        # [             ] * -> * -> * 
+        # [current index] * -> *         <----- we are traversing this list in index "current index"
+        # [             ] None
+        while(nodePtr != None): # while the linked list's current pointer is not null, keep iterating
+            # if the currentPtr's key (this is typically a 'string') is not equal to the key we are passing in, then the does not node exist already.         
+            if(nodePtr.key != key):
+                # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linked list Node
+                nodePtr = nodePtr.nextPtr
+            # Else the keys match and we found an existing value. Return the node's value  
+            else:
+                # return the value in current node
+                return nodePtr.value 
+        
+        # if we made it here, then we can return zero 
+        return 0
+
+    # Hash Map Contains Function:   
+    # - return a bool to show if a key/value pair is in the hash map    
+    def hashMapContains(self, key):
+        # find the targeted index where we should drop the new Node
+        # - use the mudulo operator to find the remainder of dividing the resuls of the hash function 
+        # and the capacity of the hash map's table/array. We use mudulos operator to guarantee that 
+        # the index will not exceed capacity, as we will be bounded in capacity. 
+        index = self.hashFunction(key) % self.capacity 
+
+        # create a variable that will serve as a pointer to the current node in the index (if there is one)
+        nodePtr = self.table[index]
+
+        # while loop will itereate the linked list that is in the particular index (visualization below)
+        # Table Index:    Contents of Index:
+        # _______________ _____________
+        # [             ] * -> * -> * 
+        # [current index] * -> *         <----- we are traversing this list in index "current index"
+        # [             ] None
+        while(nodePtr != None): # while the linked list's current pointer is not null, keep iterating
+            # if the currentPtr's key (this is typically a 'string') is not equal to the key we are passing in, then the does not node exist already.         
+            if(nodePtr.key != key):
+                # iterate our currentPtr to the currentPtr's next nextPtr so we traverse to the next linked list Node
+                nodePtr = nodePtr.nextPtr
+            # Else the keys match and we found an existing value. Return the node's value  
+            else:
+                # return true
+                return 1 
+        # if we made it here, then we can return false
+        return 0
+
+    # Hash Map Get First Function:
+    # - given an ordered list of candidate keys (e.g. [state+county+city, state+county, state]), return the first candidate
+    # that is in the hash map along with its value, as a (key, value) pair. Each candidate is hashed and its chain walked once,
+    # instead of a hashMapContains() call per candidate followed by a hashMapGet() on the winner. Returns (None, 0) if no
+    # candidate is found.
+    def hashMapGetFirst(self, candidateKeys):
+        for key in candidateKeys:
+            nodePtr = self.table[self.hashFunction(key) % self.capacity]
+            while(nodePtr != None):          # walk the chain in this compartment
+                if(nodePtr.key == key):      # found it, return both the key and the value
+                    return (key, nodePtr.value)
+                nodePtr = nodePtr.nextPtr
+        return (None, 0)
+
+    # Hash Map Get First Batch Function:
+    # - resolve a whole list of candidate key lists (one per order) at once. Returns a list of (key, value) pairs in the same
+    # order, with (None, 0) for any order where no candidate was found.
+    def hashMapGetFirstBatch(self, candidateKeyLists):
+        getFirst = self.hashMapGetFirst
+        return [getFirst(candidateKeys) for candidateKeys in candidateKeyLists]
+
+    # Resize Table Function:   
+    # - resize the hash table. Otherwise it will get too full and we will have
+    # too many collisions. Collisions equal long linked lists per index, which 
+    # results in a longer retreival time than O(1).     
+    def hashMapResize(self):
+        # prepare an empty array 
+        tempArray = []
+
+        # copy all data contained in self.hashMap into our array
+        for index in self.table:                                  # go through the whole array/table in current hash map
+            nodePtr = index                                       # create a variable called nodePtr and set it to the node containted in the current index 
+            while(nodePtr != None):                               # traverse through the linked list that is in this index  
+                tempArray.append([nodePtr.key, nodePtr.value])    # append key/value pair sub-array in array                      
+                nodePtr = nodePtr.nextPtr                         # iterate to end of linked list 
+ 
+        # re-initialize our dataStructure in preparation for re-build
+        self.table = [None] * (self.capacity * 2)  # double-sized table/array that will contain the hashNodes, initialize the array with desired elements 
+        self.size = 0                              # set size back to zero        
+        self.capacity = (self.capacity * 2)        # double our capacity
+
+        # now pass all data back into the newly sized & initialized data structure
+        for subarray_entry in tempArray:
+            self.hashMapPut(subarray_entry[0],subarray_entry[1]) # reference the sub array, send the saved key/value back to data structure using hasMapPut
+
+    # Stats Function:
+    # - report how well the keys are distributed across the compartments so different hash functions can be compared:
+    #     load_factor            - size / capacity
+    #     chain_length_histogram - {chain length : number of compartments with a chain of that length}
+    #     longest_chain          - the longest chain in the table
+    #     average_probes         - average number of nodes compared by a successful hashMapGet/hashMapContains
+    #     average_probes_miss    - average number of nodes compared by an unsuccessful lookup
+    def stats(self):
+        histogram = {}
+        longestChain = 0
+        totalProbes = 0
+        for nodePtr in self.table:                      # go through the whole array/table
+            chainLength = 0
+            while(nodePtr != None):                     # count the nodes chained in this compartment
+                chainLength = chainLength + 1
+                totalProbes = totalProbes + chainLength # the n-th node of a chain takes n comparisons to find
+                nodePtr = nodePtr.nextPtr
+            histogram[chainLength] = histogram.get(chainLength, 0) + 1
+            if(chainLength > longestChain):
+                longestChain = chainLength
+
+        averageProbes = 0
+        if(self.size > 0):
+            averageProbes = totalProbes / self.size
+        return { "size" : self.size,
+                 "capacity" : self.capacity,
+                 "load_factor" : self.size / self.capacity,
+                 "chain_length_histogram" : dict(sorted(histogram.items())),
+                 "longest_chain" : longestChain,
+                 "average_probes" : averageProbes,
+                 "average_probes_miss" : self.size / self.capacity } # a miss walks the whole chain, which is the load factor on average
+
+    # Pickle Functions (__getstate__/__setstate__):
+    # - a hash map sent to another process (a parallel_run worker, or back from a concurrent_load branch) is pickled as its capacity, its hash
+    # function's name and its key/value pairs, and every key is put again on the other side. Python's builtin hash of a string is different in
+    # every process (unless PYTHONHASHSEED is set), so compartments picked in one process can't be trusted in a process started fresh (spawn).
+    def __getstate__(self):
+        entries = []
+        for nodePtr in self.table:
+            while(nodePtr != None):
+                entries.append((nodePtr.key, nodePtr.value))
+                nodePtr = nodePtr.nextPtr
+        return { "capacity" : self.capacity, "hashFunction" : _hashFunctionName(self, self.hashFunction), "entries" : entries }
+
+    def __setstate__(self, state):
+        self.__init__(state["capacity"], state["hashFunction"])
+        for key, value in state["entries"]:
+            self.hashMapPut(key, value)
+
+    # Print Map Function: Must be handled in calling script since we do not know what type of value was past in. 
+    # Remove function could be added here 
+
+#########################################################################################################
+# compactHashMap class: An alternate, array-backed engine with the same hashMapPut/hashMapGet/hashMapContains
+#   API as hashMap above. Instead of allocating a hashNode object per entry and chaining them together, this
+#   engine keeps three parallel arrays (keys, cached hashes, and values) and uses open addressing. When two keys
+#   land in the same compartment the second key simply walks forward (linear probing) to the next empty
+#   compartment. Visualization:
+#
+#       index:    [  0  ] [  1  ] [  2  ] [  3  ] ...
+#       keys:     [ None] [ "AL"] [ "AK"] [ None] ...
+#       hashes:   [  0  ] [ h(AL)] [h(AK)] [  0  ] ...   <- hash is computed once on put and cached for resizes/probes
+#       values:   [ None] [ {..} ] [ {..}] [ None] ...
+#
+#   The capacity is always a power of two so the compartment can be found with a bitwise 'and' instead of a modulus,
+#   the table is resized once it is more than 70% full, and 'size' only counts distinct keys (an update of an
+#   existing key does not grow the map). Keys can be any hashable value other than None (None marks an empty slot).
+#   Note on memory: there is no per-entry object, just three list slots, which matters when the map holds thousands of rows.
+#########################################################################################################
+class compactHashMap:
+    # Constructor to initialize class' local variables
+    # - hashFunction (optional): a function or a name from HASH_FUNCTIONS, defaults to Python's builtin hash (implemented
+    #   in C and it mixes every character of the key, so it is both faster and better distributed than summing ordinals)
+    def __init__(self, input_capacity, hashFunction=None):
+        capacity = 8                          # start from a small power of two...
+        while(capacity < input_capacity):     # ...and keep doubling until we can hold the requested capacity
+            capacity = capacity * 2
+        self.keys = [None] * capacity         # array of keys, 'None' means the compartment is empty
+        self.hashes = [0] * capacity          # array of cached hash values for each key
+        self.values = [None] * capacity       # array of values for each key
+        self.size = 0                         # define the size of the hashMap (number of distinct keys stored)
+        self.capacity = capacity              # define the capacity of the hashMap
+        self.mask = capacity - 1              # bit mask used in place of the modulus operator (capacity is a power of two)
+        self.hashFunction = _resolveHashFunction(self, hashFunction, hash) # hash function used for every put/get/contains
+
+    # -> from_rows Function (bulk constructor):
+    # - build a hash map from an array of arrays (spreadsheet rows, the first array being the title row). Each row is stored as a dictionary of
+    # column title -> cell, under the key returned by keyFunction(rowArray). The table is sized up front from the row count, so the load
+    # never triggers a chain of resizes. By default the title row itself is not stored (skipTitleRow=1).
+    # Example: hashMap.compactHashMap.from_rows(spreadsheetArray, lambda row: row[0] + row[1] + row[2])
+    @classmethod
+    def from_rows(cls, valuesArray, keyFunction, skipTitleRow=1, hashFunction=None):
+        hash_map = cls(_presizedCapacity(len(valuesArray)), hashFunction)
+        for key, row_values in _rowRecords(valuesArray, keyFunction, skipTitleRow):
+            hash_map.hashMapPut(key, row_values)
+        return hash_map
+
+    # Hash function # 1 & # 2 - same as hashMap's, kept so either engine can be built with "ordinal"/"ordinalSquare" for comparison
+    def hashFunction1(self, key):
+        return hashMap.hashFunction1(self, key)
+
+    def hashFunction2(self, key):
+        return hashMap.hashFunction2(self, key)
+
+    # Find Slot Function (internal):
+    # - walk the probe sequence for a key and return the index of the compartment holding it, or the index of
+    # the first empty compartment if the key is not in the map
+    def _findSlot(self, key, keyHash):
+        keys = self.keys                      # local references avoid repeated attribute lookups while probing
+        hashes = self.hashes
+        mask = self.mask
+        index = keyHash & mask                # starting compartment
+        slotKey = keys[index]
+        while(slotKey != None):               # keep probing until we reach an empty compartment
+            # compare the cached hash first, the (more expensive) key comparison only runs when the hashes match
+            if(hashes[index] == keyHash and (slotKey is key or slotKey == key)):
+                return index
+            index = (index + 1) & mask        # move to the next compartment, wrapping around at the end of the table
+            slotKey = keys[index]
+        return index
+
+    # Hash Map Put Function
+    # - Enter (or update) a key/value pair
+    def hashMapPut(self, key, value):
+        keyHash = self.hashFunction(key)      # the hash is computed exactly once per put
+        index = self._findSlot(key, keyHash)
+        if(self.keys[index] != None):         # the key already exists, update its value (size does not change)
+            self.values[index] = value
+            return
+        self.keys[index] = key                # otherwise claim the empty compartment for the new key
+        self.hashes[index] = keyHash
+        self.values[index] = value
+        self.size = self.size + 1
+
+        # resize the data structure if used slots exceed 70% of total data structure
+        if(self.size * 10 > self.capacity * 7):
+            self.hashMapResize()
+
+    # Hash Map Get Function:
+    # - return a value from a key/value pair (returns 0 if the key is not found, same as hashMap)
+    def hashMapGet(self, key):
+        index = self._findSlot(key, self.hashFunction(key))
+        if(self.keys[index] != None):
+            return self.values[index]
+        return 0
+
+    # Hash Map Contains Function:
+    # - return a bool to show if a key/value pair is in the hash map
+    def hashMapContains(self, key):
+        index = self._findSlot(key, self.hashFunction(key))
+        if(self.keys[index] != None):
+            return 1
+        return 0
+
+    # Hash Map Get First Function:
+    # - given an ordered list of candidate keys (e.g. [state+county+city, state+county, state]), return the first candidate
+    # that is in the hash map along with its value, as a (key, value) pair. Each candidate is hashed exactly once. Returns
+    # (None, 0) if no candidate is found.
+    def hashMapGetFirst(self, candidateKeys):
+        hashFunction = self.hashFunction
+        findSlot = self._findSlot
+        keys = self.keys
+        for key in candidateKeys:
+            index = findSlot(key, hashFunction(key))
+            if(keys[index] != None):
+                return (key, self.values[index])
+        return (None, 0)
+
+    # Hash Map Get First Batch Function:
+    # - resolve a whole list of candidate key lists (one per order) at once. Returns a list of (key, value) pairs in the same
+    # order, with (None, 0) for any order where no candidate was found. Candidate keys repeat heavily across orders (most
+    # orders fall back to a handful of state keys), so each distinct key is only hashed and probed once per batch.
+    def hashMapGetFirstBatch(self, candidateKeyLists):
+        hashFunction = self.hashFunction
+        findSlot = self._findSlot
+        keys = self.keys
+        values = self.values
+        slotCache = {}                        # key -> index of its compartment (or of the empty compartment that proves it is missing)
+        results = []
+        for candidateKeys in candidateKeyLists:
+            result = (None, 0)
+            for key in candidateKeys:
+                index = slotCache.get(key)
+                if(index == None):
+                    index = findSlot(key, hashFunction(key))
+                    slotCache[key] = index
+                if(keys[index] != None):
+                    result = (key, values[index])
+                    break
+            results.append(result)
+        return results
+
+    # Resize Table Function:
+    # - double the table and re-insert every entry. The cached hashes are re-used so no key is hashed again.
+    def hashMapResize(self):
+        oldKeys = self.keys
+        oldHashes = self.hashes
+        oldValues = self.values
+
+        capacity = self.capacity * 2          # double our capacity
+        mask = capacity - 1
+        keys = [None] * capacity
+        hashes = [0] * capacity
+        values = [None] * capacity
+
+        # every key is already known to be unique, so we only need to find an empty compartment for each one
+        for oldIndex in range(self.capacity):
+            key = oldKeys[oldIndex]
+            if(key != None):
+                keyHash = oldHashes[oldIndex]
+                index = keyHash & mask
+                while(keys[index] != None):
+                    index = (index + 1) & mask
+                keys[index] = key
+                hashes[index] = keyHash
+                values[index] = oldValues[oldIndex]
+
+        self.keys = keys
+        self.hashes = hashes
+        self.values = values
+        self.capacity = capacity
+        self.mask = mask
+
+    # Stats Function:
+    # - report how well the keys are distributed so different hash functions can be compared. With open addressing the
+    #   "chain" of a key is its probe sequence: the compartments walked from its home compartment to where it is stored.
+    #     load_factor            - size / capacity
+    #     chain_length_histogram - {probes needed to find a key : number of keys}
+    #     longest_chain          - the longest probe sequence of any stored key
+    #     average_probes         - average number of compartments compared by a successful hashMapGet/hashMapContains
+    #     average_probes_miss    - average number of compartments compared by an unsuccessful lookup
+    def stats(self):
+        histogram = {}
+        longestChain = 0
+        totalProbes = 0
+        for index in range(self.capacity):
+            if(self.keys[index] != None):
+                probes = ((index - (self.hashes[index] & self.mask)) & self.mask) + 1 # distance from the home compartment, plus one
+                histogram[probes] = histogram.get(probes, 0) + 1
+                totalProbes = totalProbes + probes
+                if(probes > longestChain):
+                    longestChain = probes
+
+        # a miss that starts on an occupied compartment walks to the end of its run of occupied compartments, plus the empty one.
+        # Walk the table backwards once, tracking the distance to the next empty compartment.
+        totalMissProbes = 0
+        distance = 0
+        if(self.size < self.capacity):
+            start = self.keys.index(None) # start from an empty compartment so the wrap-around is handled
+            for step in range(self.capacity):
+                index = (start - step) & self.mask
+                if(self.keys[index] == None):
+                    distance = 0
+                else:
+                    distance = distance + 1
+                totalMissProbes = totalMissProbes + distance + 1
+
+        averageProbes = 0
+        if(self.size > 0):
+            averageProbes = totalProbes / self.size
+        return { "size" : self.size,
+                 "capacity" : self.capacity,
+                 "load_factor" : self.size / self.capacity,
+                 "chain_length_histogram" : dict(sorted(histogram.items())),
+                 "longest_chain" : longestChain,
+                 "average_probes" : averageProbes,
+                 "average_probes_miss" : totalMissProbes / self.capacity }
+
+    # Pickle Functions (__getstate__/__setstate__):
+    # - the cached hashes are left out of the pickle and every key is hashed again when the map is loaded, see hashMap's pickle functions above
+    # (the default builtin hash is different in every process, so the cached hashes would send every lookup to the wrong compartment)
+    def __getstate__(self):
+        entries = [ (self.keys[index], self.values[index]) for index in range(self.capacity) if self.keys[index] != None ]
+        return { "capacity" : self.capacity, "hashFunction" : _hashFunctionName(self, self.hashFunction), "entries" : entries }
+
+    def __setstate__(self, state):
+        self.__init__(state["capacity"], state["hashFunction"])
+        for key, value in state["entries"]:
+            self.hashMapPut(key, value)
+
+
+
+# Test Code - uncomment lines below & run for testing 
+#Map = hashMap(4000) # Instantiate new hashmap 
+#orderOne = { "customer" : "John Smith", "product" : "samsung phone" , "tracking number" : "389175", "order date" : "10/18/2018", "cost" : 650 }   # Declare dictionary
+#orderTwo = { "customer" : "Tony Gonzales", "product" : "apple iphone" , "tracking number" : "21456", "order date" : "10/17/2018", "cost" : 1650 } # Declare dictionary
+#orderThree = { "customer" : "Jimmy Johnson", "product" : "flip phone" , "tracking number" : "11125", "order date" : "10/1/2018", "cost" : 1 }     # Declare dictionary
+#Map.hashMapPut("order_one",orderOne)     # Put record in map
+#Map.hashMapPut("order_two",orderTwo)     # Put record in map
+#Map.hashMapPut("order_three",orderThree) # Put record in map
+#value = Map.hashMapGet("order_two")      # Test retrieving a value  
+#print(value)                             # Print value               
+
+# Test Code - uncomment lines below & run to compare how the fee schedule keys distribute under each hash function
+#import read_data_from_excel
+#import create_hashMap
+#spreadsheetArray = read_data_from_excel.get_excel_data("productFeesByState.xlsx")
+#for name in ["ordinal", "ordinalSquare", "fnv1a", "siphash", "builtin"]:
+#    package = create_hashMap.prepare_data_structure(spreadsheetArray, 0, name)
+#    print(name, package.data_structure.stats())
\ No newline at end of file
@@ -0,0 +1,253 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: incremental_run
+# Function: run_incremental(hash_map_package, linked_list_package, statePath, increasesFile, rushesFile, feeScheduleFingerprint="", outputFormat=None)
+# Parameters:
+#   - The fee schedule package and order list package, the same as compute_custom_algorithm.run()
+#   - A path to the state file kept between runs (it is created on the first run, with its report rows journal next to it)
+#   - The increases and rushes report files to keep up to date (any format registered in data_formats.py, see outputFormat)
+#   - A fingerprint of the fee schedule (for example its sha256, see parsed_input_cache.file_fingerprint()). If the fee schedule changes,
+#     every order has to be re-priced, so a different fingerprint throws the saved state away.
+#   - The output format name (optional, detected from the report file names when left as None)
+#
+# Purpose: The order list is a cumulative export, so every run of main.py contains all of the orders priced by the previous run plus a
+#   few new ones. Incremental mode remembers which orders it has already processed and only prices the orders that are new (or have changed
+#   since they were priced), so the run time grows with the number of new orders instead of with the whole history.
+#
+# Description: The state file holds:
+#     - the watermark: the highest "First Completed" date of every order processed so far
+#     - the key (Reference ID) of every processed order
+#     - for the orders completed on the watermark date, a cheap change key: the order's "Fee Charged" and "First Completed" cells
+#     - the fee schedule fingerprint the orders were priced with, and the name and size of the report rows journal
+#   The journal (a file next to the state file) holds the report rows (increases row and rushes row, or None) every processed order produced.
+#   Each run that prices new orders adds their rows to the end of the journal as one pickle, so the journal is never read or written again
+#   in full unless the reports have to be rebuilt.
+#   An order that was processed before and was completed before the watermark is skipped without looking at any more of its cells. An order
+#   processed before that is at or past the watermark is compared by its change key, and priced again if the key is different (or if it
+#   moved past the watermark). Every other order is new and is priced. The reports are then brought up to date in the cheapest way that
+#   leaves them holding what run() would return for the export:
+#     - "unchanged": nothing was priced and both reports exist, so neither is touched
+#     - "appended":  only new orders were priced and the output format can be appended to (csv, jsonl, rows), their rows are added to the
+#                    end of the reports (see data_formats.append_data())
+#     - "written":   the first run (or a new fee schedule), a changed order whose old rows have to be replaced, a missing report, or a
+#                    workbook format (xls/xlsx files can't be added to), the reports are written whole from the journal in export order
+#   The state file and journal are only written when something changed. A rewritten journal goes to a second file that the state file is then
+#   switched to, and the state file itself is written to a temporary file and moved into place, so a run that is interrupted leaves the last
+#   saved state and journal as they were.
+#
+# NOTE: Orders are keyed by Reference ID. When the same Reference ID appears more than once in an export, its rows are told apart by the
+#   order they appear in (first, second, ...), so those rows must keep their relative order from one export to the next.
+# NOTE: Changes to an order completed before the watermark aren't picked up, and appended rows go to the end of the reports, so a new order
+#   that appears in the middle of the export is reported after the older orders until the reports are next written whole. Only the fee
+#   schedule is fingerprinted: if the pricing rules in compute_custom_algorithm.py change, delete the state file so every order is priced again.
+#
+# Example Usage (put this in calling function):
+#   summary = incremental_run.run_incremental(hash_map_package, linked_list_package, "incremental_state.pickle", "increases.csv", "rushes.csv", feeFingerprint)
+#   print(summary["priced"], "orders priced, reports", summary["reports"])
+#
+#########################################################################################################
+import datetime # import datetime module (typed "First Completed" cells are datetimes)
+import io       # import io module, used to read the journal's pickles back one at a time
+import os       # import os module, used to replace the state file in one step
+import pickle   # import pickle module, used as the format of the state file and journal
+import compute_custom_algorithm # import the pricing algorithm
+import data_formats             # import the format registry, used to write the reports
+
+STATE_VERSION = 3
+REFERENCE_ID_COLUMN = 0  # column index of the order list's "Reference ID #" column
+COMPLETED_COLUMN = 8     # column index of the order list's "First Completed" column
+FEE_CHARGED_COLUMN = 16  # column index of the order list's "Fee Charged" column
+JOURNAL_SUFFIXES = (".journal-a", ".journal-b") # the journal's file name is the state file's plus one of these, a rewritten journal goes to the other one
+
+# This function returns a new, empty state
+def _newState(feeScheduleFingerprint):
+    return { "version" : STATE_VERSION, "fee_schedule" : feeScheduleFingerprint, "watermark" : None, "processed" : set(), "at_watermark" : {},
+             "journal" : JOURNAL_SUFFIXES[0], "journal_size" : 0 }
+
+# This function loads the state file, or returns a new, empty state if there is no usable state file (or it was made with a different fee schedule,
+#   or its journal is missing or shorter than the state file says)
+def load_state(statePath, feeScheduleFingerprint=""):
+    try:
+        with open(statePath, "rb") as inputFile:
+            state = pickle.load(inputFile)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return _newState(feeScheduleFingerprint)
+    if(not isinstance(state, dict) or state.get("version") != STATE_VERSION or state.get("fee_schedule") != feeScheduleFingerprint):
+        return _newState(feeScheduleFingerprint)
+    try : journalSize = os.path.getsize(statePath + state["journal"])
+    except OSError : journalSize = -1
+    if(journalSize < state["journal_size"]):
+        return _newState(feeScheduleFingerprint)
+    return state
+
+# This function saves the state file
+def save_state(state, statePath):
+    temporaryFile = statePath + "." + str(os.getpid()) + ".tmp"
+    with open(temporaryFile, "wb") as outputFile:
+        pickle.dump(state, outputFile, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporaryFile, statePath)
+
+# Helper function: add { order key : (increases row, rushes row) } to the end of the journal and return its new size. Anything past the saved size
+#   (left by a run that was interrupted before it saved the state) is cut off first.
+def _appendJournal(journalPath, journalSize, rows):
+    with open(journalPath, "ab") as outputFile:
+        outputFile.truncate(journalSize)
+        outputFile.seek(journalSize)
+        pickle.dump(rows, outputFile, protocol=pickle.HIGHEST_PROTOCOL)
+        return outputFile.tell()
+
+# Helper function: write a new journal holding { order key : (increases row, rushes row) } and return its size
+def _writeJournal(journalPath, rows):
+    with open(journalPath, "wb") as outputFile:
+        pickle.dump(rows, outputFile, protocol=pickle.HIGHEST_PROTOCOL)
+        return outputFile.tell()
+
+# Helper function: return every order's report rows from the journal { order key : (increases row, rushes row) } (a later pickle replaces an earlier one's rows)
+def _loadJournal(journalPath, journalSize):
+    rows = {}
+    with open(journalPath, "rb") as inputFile:
+        data = io.BytesIO(inputFile.read(journalSize))
+    while(data.tell() < journalSize):
+        rows.update(pickle.load(data))
+    return rows
+
+# Helper function: return the reports' payload for the orders of the export, in export order, from { order key : (increases row, rushes row) }
+def _reportPayload(rows, orderKeys):
+    titleRows = compute_custom_algorithm.reportTitleRows()
+    spreadsheetArrayOne = [ titleRows[0] ]
+    spreadsheetArrayTwo = [ titleRows[1] ]
+    for key in orderKeys:
+        increaseRow, rushRow = rows.get(key, (None, None))
+        if(increaseRow != None):
+            spreadsheetArrayOne.append(increaseRow)
+        if(rushRow != None):
+            spreadsheetArrayTwo.append(rushRow)
+    return [ spreadsheetArrayOne, spreadsheetArrayTwo ]
+
+# Helper function: return a "First Completed" cell as a number that can be compared (the excel serial date), or None if the cell isn't a date
+def _completedValue(cell):
+    if(isinstance(cell, datetime.datetime)):
+        return (cell - datetime.datetime(1899, 12, 30)).total_seconds() / 86400
+    try : return float(cell)
+    except (ValueError, TypeError) : return None
+
+# This function prices the orders of the order list that are new or changed since the last run, skips the others, brings the reports up to date and saves
+#   the state. It returns a summary dictionary of counts { "orders", "priced", "skipped", "new", "changed", "after_watermark" }, how the reports were
+#   updated ("reports": "unchanged", "appended" or "written"), and the watermark before and after the run.
+def run_incremental(hash_map_package, linked_list_package, statePath, increasesFile, rushesFile, feeScheduleFingerprint="", outputFormat=None):
+    state = load_state(statePath, feeScheduleFingerprint)
+    processed = state["processed"]
+    atWatermark = state["at_watermark"]
+    watermark = state["watermark"]
+    firstRun = int(len(processed) == 0)
+    keys_dictionary = linked_list_package.keys_dictionary
+    referenceTitle = keys_dictionary[REFERENCE_ID_COLUMN]
+    completedTitle = keys_dictionary[COMPLETED_COLUMN]
+    feeChargedTitle = keys_dictionary[FEE_CHARGED_COLUMN]
+
+    orderKeys = []                   # the key of every order of the export, in export order
+    pricedRows = {}                  # order key -> (increases row, rushes row) of every order priced by this run
+    occurrences = {}                 # Reference ID -> number of times it has been seen so far in this export
+    completedValues = {}             # "First Completed" cell -> its value (most orders share a handful of dates)
+    recent = []                      # (key, completed value, change key) of every order at or past the watermark, the new at_watermark is picked from them
+    summary = { "orders" : 0, "priced" : 0, "skipped" : 0, "new" : 0, "changed" : 0, "after_watermark" : 0, "previous_watermark" : watermark }
+    highestCompleted = watermark
+
+    counter = 0                      # skip the title row, the same as run()
+    if(linked_list_package.includes_title_row == 0):
+        counter = 1
+    for node in linked_list_package.data_structure:
+        if(counter == 0):
+            counter = 1
+            continue
+        summary["orders"] = summary["orders"] + 1
+        referenceId = node[referenceTitle]
+        occurrence = occurrences.get(referenceId, 0)
+        occurrences[referenceId] = occurrence + 1
+        key = (referenceId, occurrence)
+        orderKeys.append(key)
+
+        completedCell = node[completedTitle]
+        if(completedCell in completedValues):
+            completed = completedValues[completedCell]
+        else:
+            completed = completedValues[completedCell] = _completedValue(completedCell)
+
+        if(key in processed and (completed == None or (watermark != None and completed < watermark))):   # processed before the watermark, skip it
+            summary["skipped"] = summary["skipped"] + 1
+            continue
+
+        if(completed != None):
+            if(watermark == None or completed > watermark):
+                summary["after_watermark"] = summary["after_watermark"] + 1
+            if(highestCompleted == None or completed > highestCompleted):
+                highestCompleted = completed
+        changeKey = (node[feeChargedTitle], completedCell)
+        recent.append((key, completed, changeKey))
+
+        if(key in processed):
+            if(atWatermark.get(key) == changeKey):                     # processed on the watermark date and unchanged, skip it
+                summary["skipped"] = summary["skipped"] + 1
+                continue
+            summary["changed"] = summary["changed"] + 1
+        else:
+            processed.add(key)
+            summary["new"] = summary["new"] + 1
+
+        pricedRows[key] = compute_custom_algorithm.price_order(hash_map_package, linked_list_package, node)
+        summary["priced"] = summary["priced"] + 1
+
+    # Bring the journal and the reports up to date (see the Description above for when the reports are appended to or written whole)
+    if(outputFormat == None):
+        outputFormat = data_formats.detect_format(increasesFile, forWriting=1)
+    reportFiles = [ increasesFile, rushesFile ]
+    reportsExist = os.path.isfile(increasesFile) and os.path.isfile(rushesFile)
+    journalPath = statePath + state["journal"]
+    oldJournalPath = None
+    if(firstRun == 1):
+        state["journal_size"] = _writeJournal(journalPath, pricedRows)
+        summary["reports"] = "written"
+        payload = _reportPayload(pricedRows, orderKeys)
+    elif(summary["priced"] == 0 and reportsExist):
+        summary["reports"] = "unchanged"
+        payload = None
+    elif(summary["changed"] == 0 and reportsExist and data_formats.can_append(outputFormat) == 1):
+        state["journal_size"] = _appendJournal(journalPath, state["journal_size"], pricedRows)
+        summary["reports"] = "appended"
+        payload = _reportPayload(pricedRows, orderKeys)
+    else:
+        rows = _loadJournal(journalPath, state["journal_size"])
+        if(summary["changed"] != 0):                                   # replace the changed orders' rows in a new journal
+            rows.update(pricedRows)
+            oldJournalPath = journalPath
+            state["journal"] = JOURNAL_SUFFIXES[1 - JOURNAL_SUFFIXES.index(state["journal"])]
+            state["journal_size"] = _writeJournal(statePath + state["journal"], rows)
+        elif(summary["priced"] != 0):
+            rows.update(pricedRows)
+            state["journal_size"] = _appendJournal(journalPath, state["journal_size"], pricedRows)
+        summary["reports"] = "written"
+        payload = _reportPayload(rows, orderKeys)
+
+    for reportIndex in range(len(reportFiles)):
+        if(summary["reports"] == "written"):
+            data_formats.write_data(reportFiles[reportIndex], payload[reportIndex], outputFormat)
+        elif(summary["reports"] == "appended" and len(payload[reportIndex]) > 1):   # a report with no new rows is left alone
+            data_formats.append_data(reportFiles[reportIndex], payload[reportIndex], outputFormat)
+
+    newAtWatermark = { key : changeKey for key, completed, changeKey in recent if completed != None and completed >= highestCompleted }
+    if(firstRun == 1 or summary["priced"] != 0 or highestCompleted != watermark or newAtWatermark != atWatermark):   # nothing to save when nothing changed
+        state["watermark"] = highestCompleted
+        state["at_watermark"] = newAtWatermark
+        save_state(state, statePath)
+    if(oldJournalPath != None):                                        # the state file now points at the new journal
+        try : os.remove(oldJournalPath)
+        except OSError : pass
+    summary["watermark"] = highestCompleted
+    return summary
+
+# Test Code - uncomment lines below & run for testing (the second run should skip every order and leave the reports unchanged)
+# import read_data_from_excel, create_hashMap, create_linkedList
+# hash_map_package = create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+# linked_list_package = create_linkedList.prepare_data_structure(read_data_from_excel.get_excel_data("orderList.xlsx"))
+# for attempt in range(2):
+#     print(run_incremental(hash_map_package, linked_list_package, "incremental_state.pickle", "increases.csv", "rushes.csv"))
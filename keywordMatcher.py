@@ -0,0 +1,93 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: keywordMatcher
+#
+# Overview: A keyword matcher finds which of many keywords appear in a piece of text using a single pass over
+#   the text. Searching a text once per keyword (text.find("rural"), text.find("remote"), text.find("waterfront"),
+#   ...) re-reads the whole text for every keyword. Instead, the matcher compiles every keyword into one combined
+#   regular expression when it is built, then scans each text once.
+#
+# Description: The matcher is built from a keyword -> category table, an array of [keyword, category] pairs. Several
+#   keywords can share a category (for example "waterfront", "riverfront" and "ocean front" all mean "waterfront").
+#   match(text) returns the categories found in the text, in the order the categories first appear in the table (so
+#   the result does not depend on where in the text each keyword was found). Matching is case sensitive, the same as
+#   str.find(). Example:
+#
+#       matcher = keywordMatcher([ ["rural", "rural/remote"], ["remote", "rural/remote"], ["golf", "golf course"] ])
+#       matcher.match("remote lot on a golf course")   # returns ["rural/remote", "golf course"]
+#
+# Note: The combined expression is a lookahead (?=(kw1|kw2|...)) tried at every position of the text, with longer
+#   keywords listed first. Keywords that overlap or sit inside each other are still all found: a keyword that is
+#   part of a longer keyword also reports its category whenever the longer keyword is matched.
+#
+# Many texts: matchMany(texts) returns the same results as calling match() on each text, but joins the texts and scans
+#   them all in a single pass of the expression (used by compute_custom_algorithm.run_vectorized() on a whole column of notes).
+#
+#########################################################################################################
+import bisect # import bisect module, used by matchMany() to find which text a match is in
+import itertools # import itertools module, used by matchMany() to add up text positions
+import re # import regular expression module
+
+#########################################################################################################
+# keywordMatcher class: This class holds the compiled expression and the keyword -> categories lookup
+#########################################################################################################
+class keywordMatcher:
+    # Constructor to initialize class' local variables (compiles the table once)
+    def __init__(self, keywordTable):
+        self.categories = []                                 # every category, in the order it first appears in the table
+        keywordCategories = {}                               # keyword -> categories listed for it in the table
+        for keyword, category in keywordTable:
+            if(category not in self.categories):
+                self.categories.append(category)
+            keywordCategories.setdefault(keyword, set()).add(category)
+
+        # a matched keyword also reports the categories of every keyword contained inside it (e.g. if the table held both "water front"
+        # and "front", a match on "water front" proves "front" is in the text too)
+        self.keywordCategories = {}
+        for keyword in keywordCategories:
+            categories = set()
+            for otherKeyword in keywordCategories:
+                if(keyword.find(otherKeyword) != -1):
+                    categories.update(keywordCategories[otherKeyword])
+            self.keywordCategories[keyword] = categories
+
+        # longest keywords first, so the alternation prefers a longer keyword when two start at the same position
+        keywords = sorted(keywordCategories, key=len, reverse=True)
+        self.pattern = None                                  # an empty table never matches anything
+        if(len(keywords) > 0):
+            self.pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))")
+
+    # -> match Function:
+    # - scan the text once and return the array of categories found, in table order. The scan stops early once every category has been found.
+    def match(self, text):
+        if(self.pattern == None):
+            return []
+        found = set()
+        categoryCount = len(self.categories)
+        keywordCategories = self.keywordCategories
+        for result in self.pattern.finditer(text):
+            found.update(keywordCategories[result.group(1)])
+            if(len(found) == categoryCount):
+                break
+        return [ category for category in self.categories if category in found ]
+
+    # -> matchMany Function:
+    # - return match(text) for every text of an array, scanning all of the texts together in one pass: the texts are joined with a separator no keyword
+    # contains, the combined expression runs over the joined text once, and each keyword found is credited to the text it was found in.
+    def matchMany(self, texts):
+        texts = list(texts)
+        if(self.pattern == None):
+            return [ [] for text in texts ]
+        separator = "\x00"
+        if(any(separator in keyword for keyword in self.keywordCategories) or not all(isinstance(text, str) for text in texts)):
+            return [ self.match(text) for text in texts ]     # can't join these texts safely, match them one at a time (non-text raises the usual error)
+        starts = [ 0 ] + list(itertools.accumulate(len(text) + 1 for text in texts))   # position of every text in the joined text
+        found = {}                                            # text index -> categories found
+        keywordCategories = self.keywordCategories
+        for result in self.pattern.finditer(separator.join(texts)):
+            textIndex = bisect.bisect_right(starts, result.start()) - 1
+            found.setdefault(textIndex, set()).update(keywordCategories[result.group(1)])
+        matches = [ [] for text in texts ]                    # texts without any keyword
+        for textIndex in found:
+            matches[textIndex] = [ category for category in self.categories if category in found[textIndex] ]
+        return matches
@@ -1,35 +1,145 @@
-#########################################################################################################
-# Author: Timothy Fye
-# Title: Main file
-#########################################################################################################
-import read_data_from_excel # import get_orders
-import read_data_from_csv   # import get_orders
-import create_hashMap
-import create_linkedList
-import compute_custom_algorithm
-import write_data_to_excel
-# Shouldnt need these, have separate functions/files that will import these
-# import doublyLinkedList # import data structure executable
-# import hashMap # import hasmap module
-
-def main():
-
-    # Fee Schedule Prep
-    spreadsheetArray = read_data_from_excel.get_excel_data("productFeesByState.xlsx")   # Call function that reads data from provided excel file and returns an array containing arrays of row data
-    hash_map_package = create_hashMap.prepare_data_structure(spreadsheetArray)          # Call a function that accepts an array of arrays, inserts it into a hashmap, then returns an object with the data structure and a dictionarykey array
-
-    # Order Data Prep
-    spreadsheetArray = read_data_from_excel.get_excel_data("orderList.xlsx") # Call function that reads data from provided excel file and returns an array containing arrays of row data
-    linked_list_package = create_linkedList.prepare_data_structure(spreadsheetArray)    # Call a function that accepts an array of arrays, inserts it into a linkedlist, then returns an object with the data structure and a dictionarykey array
-
-    # Compute Algorithm
-    payload = compute_custom_algorithm.run(hash_map_package,linked_list_package)
-
-    # Write Computed Data in Array Payload to Output File
-    write_data_to_excel.push_excel_data("output_file_increases.xls", payload[0])
-
-    # Write Computed Data in Array Payload to Output File
-    write_data_to_excel.push_excel_data("output_file_rushes.xls", payload[1])
-
-if __name__ == '__main__':
-    main()
+#########################################################################################################
+# Author: Timothy Fye
+# Title: Main file
+#########################################################################################################
+import read_data_from_excel # import get_orders
+import read_data_from_csv   # import get_orders
+import read_data_from_workbooks # import multi-workbook/multi-sheet order reading
+import create_hashMap
+import create_linkedList
+import compute_custom_algorithm
+import write_data_to_excel
+import incremental_run      # import incremental (only price new/changed orders) mode
+import parallel_run         # import process pool pricing (shards the orders across worker processes)
+import streaming_pipeline   # import streaming mode (orders flow through read -> price -> write a batch at a time)
+import concurrent_load      # import concurrent loading of the fee schedule and order list
+import parsed_input_cache   # import file fingerprinting (used to tell if the fee schedule changed)
+import data_formats         # import format registry (reads/writes excel, csv, binary row stream and JSON Lines files by format)
+import feeMemo              # import fee memo (its default size, see compute_custom_algorithm.configureFeeMemo())
+import argparse             # import command line argument parsing
+import os                   # import os module, used to tell directories of workbooks apart from files
+# Shouldnt need these, have separate functions/files that will import these
+# import doublyLinkedList # import data structure executable
+# import hashMap # import hasmap module
+
+FEE_SCHEDULE_FILE = "productFeesByState.xlsx"
+ORDER_LIST_FILE = "orderList.xlsx"
+INCREASES_OUTPUT_NAME = "output_file_increases"  # output file names, the output format's extension is added
+RUSHES_OUTPUT_NAME = "output_file_rushes"
+
+# Parse the command line options
+def _parseArguments(argv):
+    parser = argparse.ArgumentParser(description="Compare the fees charged for orders against the fee schedule and report increases and rushes.")
+    parser.add_argument("--incremental", metavar="STATE_FILE", default=None,
+                        help="only price orders that are new or changed since the last run that used this state file (it is created if it doesn't exist, "
+                             "with a journal of the report rows next to it), and only add to or rewrite the output files when something changed "
+                             "(can't be combined with --pricing-workers)")
+    parser.add_argument("--orders", metavar="PATH", nargs="+", default=[ ORDER_LIST_FILE ],
+                        help="order workbooks and/or directories of workbooks to read (every sheet is read and merged), default: " + ORDER_LIST_FILE)
+    parser.add_argument("--workers", type=int, default=None, help="number of processes used to parse order sheets (default: one per CPU)")
+    parser.add_argument("--pricing-workers", type=int, default=None,
+                        help="price the orders across this many worker processes (default: price them in this process)")
+    parser.add_argument("--shard-by", choices=parallel_run.SHARD_TYPES, default="range",
+                        help="how the orders are split between pricing workers: contiguous ranges of orders or one shard per state (default: range)")
+    parser.add_argument("--streaming", action="store_true",
+                        help="stream the orders through read -> price -> write a batch at a time, so memory use doesn't grow with the number of orders "
+                             "(reads the first sheet of a single order file, can't be combined with --incremental or --pricing-workers)")
+    parser.add_argument("--fee-memo-size", type=int, default=None,
+                        help="the most fees the fee memo remembers (default: " + str(feeMemo.DEFAULT_MAX_SIZE) + ")")
+    parser.add_argument("--no-fee-memo", action="store_true", help="work out every order's fee from scratch (to compare results with and without the fee memo)")
+    parser.add_argument("--cache", action="store_true",
+                        help="keep the parsed rows of every input file in a '" + parsed_input_cache.CACHE_DIRECTORY_NAME + "' folder next to it and reuse them while the "
+                             "file is unchanged (off by default). The cache files are pickles and are trusted when loaded, only use it on folders you control")
+    parser.add_argument("--fee-schedule", metavar="PATH", default=FEE_SCHEDULE_FILE, help="fee schedule file to read, default: " + FEE_SCHEDULE_FILE)
+    parser.add_argument("--input-format", choices=data_formats.get_format_names(), default=None,
+                        help="format of the input files (default: detected from each file's first bytes or extension)")
+    parser.add_argument("--output-format", choices=data_formats.get_format_names(forWriting=1), default="xls",
+                        help="format of the output files (default: xls). 'rows' (binary row stream) and 'jsonl' can be read back without excel parsing")
+    return parser.parse_args(argv)
+
+# Read the order list. Excel workbooks (and directories of them) are read by read_data_from_workbooks (every sheet, in parallel),
+#   a file in any other format (csv, row stream, JSON Lines) is read through the format registry
+def _readOrders(arguments):
+    excelPaths = 1
+    for path in arguments.orders:
+        if(not os.path.isdir(path) and (arguments.input_format or data_formats.detect_format(path)) not in ("xlsx", "xlsm", "xls")):
+            excelPaths = 0
+    if(excelPaths == 1):
+        return read_data_from_workbooks.get_workbooks_data(arguments.orders, arguments.workers, useCache=int(arguments.cache))
+    if(len(arguments.orders) != 1):
+        print("Error: only excel workbooks can be merged, pass a single order file when it isn't an excel workbook")
+        exit()
+    return data_formats.read_data(arguments.orders[0], arguments.input_format, useCache=int(arguments.cache))
+
+# Fee schedule branch: read the fee schedule and build its hashmap (runs in its own process while the order list loads, so it only takes the values it needs)
+def _loadFeeSchedule(feeSchedulePath, inputFormat, useCache):
+    spreadsheetArray = data_formats.read_data(feeSchedulePath, inputFormat, useCache=useCache)         # Call function that reads data from provided file (excel by default) and returns an array containing arrays of row data
+    return create_hashMap.prepare_data_structure(spreadsheetArray, buildFeeIndex=1)              # Call a function that accepts an array of arrays, inserts it into a hashmap (and a precompiled fee index), then returns an object with the data structure and a dictionarykey array
+
+# Order list branch: read the orders and build their linked list
+def _loadOrders(arguments):
+    spreadsheetArray = _readOrders(arguments)                                # Call function that reads every sheet of the provided excel files (in parallel), or another format's file, and returns an array containing arrays of row data
+    return create_linkedList.prepare_data_structure(spreadsheetArray)        # Call a function that accepts an array of arrays, inserts it into a linkedlist, then returns an object with the data structure and a dictionarykey array
+
+# Print the fee memo's counters, so its size can be tuned (the pricing workers of --pricing-workers each keep their own memo, so there is nothing to print then)
+def _printFeeMemoStats(arguments):
+    if(arguments.no_fee_memo):
+        return
+    stats = compute_custom_algorithm.getFeeMemoStats()
+    print("Fee memo:", stats["hits"], "hits,", stats["misses"], "misses,", stats["evictions"], "evictions (", round(stats["hitRate"] * 100, 1), "% hit rate,",
+          stats["size"], "of", stats["maxSize"], "fees held )")
+
+def main(argv=None):
+
+    # Command line options
+    arguments = _parseArguments(argv)
+    compute_custom_algorithm.configureFeeMemo(1 - int(arguments.no_fee_memo), arguments.fee_memo_size)
+
+    # Streaming mode: the orders are never held in memory all at once, they are read, priced and written out a batch at a time (only the fee schedule is loaded up front)
+    extension = data_formats.FORMATS[arguments.output_format]["extensions"][0]
+    if(arguments.streaming):
+        if(arguments.incremental != None or arguments.pricing_workers != None or len(arguments.orders) != 1 or os.path.isdir(arguments.orders[0])):
+            print("Error: --streaming reads a single order file and can't be combined with --incremental or --pricing-workers")
+            exit()
+        hash_map_package = _loadFeeSchedule(arguments.fee_schedule, arguments.input_format, int(arguments.cache))
+        summary = streaming_pipeline.run_streaming(hash_map_package, arguments.orders[0], INCREASES_OUTPUT_NAME + extension, RUSHES_OUTPUT_NAME + extension,
+                                                   arguments.input_format, arguments.output_format)
+        print("Streaming run:", summary["orders"], "orders priced,", summary["increases"], "increases,", summary["rushes"], "rushes")
+        _printFeeMemoStats(arguments)
+        return
+
+    # Incremental mode prices the new and changed orders in this process, so it can't be given pricing workers
+    if(arguments.incremental != None and arguments.pricing_workers != None):
+        print("Error: --incremental prices its orders in this process and can't be combined with --pricing-workers")
+        exit()
+
+    # Fee Schedule Prep & Order Data Prep: the two don't depend on each other, so they are loaded at the same time (the fee schedule in its own process)
+    hash_map_package, linked_list_package, timings = concurrent_load.load_inputs((_loadFeeSchedule, (arguments.fee_schedule, arguments.input_format, int(arguments.cache))),
+                                                                                 (_loadOrders, (arguments,)))
+    print("Loaded fee schedule in", round(timings["fee schedule"], 3), "s and orders in", round(timings["orders"], 3), "s (", round(timings["total"], 3), "s total )")
+
+    # Incremental mode: orders that were already priced by a previous run are skipped, and the output files are only added to (or written) when something changed
+    if(arguments.incremental != None):
+        feeScheduleFingerprint = parsed_input_cache.file_fingerprint(arguments.fee_schedule)["sha256"]
+        summary = incremental_run.run_incremental(hash_map_package, linked_list_package, arguments.incremental, INCREASES_OUTPUT_NAME + extension,
+                                                  RUSHES_OUTPUT_NAME + extension, feeScheduleFingerprint, arguments.output_format)
+        print("Incremental run:", summary["priced"], "orders priced (", summary["new"], "new,", summary["changed"], "changed ),", summary["skipped"], "skipped, output files",
+              summary["reports"])
+        _printFeeMemoStats(arguments)
+        return
+
+    # Compute Algorithm (with pricing workers the orders are priced across a process pool)
+    if(arguments.pricing_workers != None):
+        payload = parallel_run.run_parallel(hash_map_package, linked_list_package, arguments.pricing_workers, arguments.shard_by)
+    else:
+        payload = compute_custom_algorithm.run(hash_map_package,linked_list_package)
+        _printFeeMemoStats(arguments)
+
+    # Write Computed Data in Array Payload to Output File (in the chosen output format)
+    data_formats.write_data(INCREASES_OUTPUT_NAME + extension, payload[0], arguments.output_format)
+
+    # Write Computed Data in Array Payload to Output File
+    data_formats.write_data(RUSHES_OUTPUT_NAME + extension, payload[1], arguments.output_format)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: parallel_run
+# Function: run_parallel(hash_map_package, linked_list_package, workers=None, shardBy="range", shardCount=None)
+# Parameters:
+#   - The fee schedule package and order list package, the same as compute_custom_algorithm.run()
+#   - The number of worker processes (optional, defaults to the number of CPUs, 1 simply calls run())
+#   - How the order list is split into shards (pieces priced by one worker at a time):
+#       "range" - contiguous ranges of orders of about the same size (the default, spreads the work evenly)
+#       "state" - one shard per State, so every order of a state is priced by the same worker
+#   - The number of range shards (optional, defaults to 4 per worker so a slow shard doesn't hold up the others)
+#
+# Purpose: Every order is priced on its own against a fee schedule that never changes while it is read, so pricing can be spread
+#   across every core of the machine instead of running on one. Month-end and year-end reprocessing of a whole order history then
+#   scales with the number of cores.
+#
+# Description: The fee schedule is handed to each worker process once, when the worker starts (the pool's initializer), not with
+#   every shard. When the package has a feeIndex only the index is sent (a mapped snapshot from feeSnapshot.py is sent as just its
+#   file path and re-opened by each worker). Each shard is sent as the order indexes it covers and its rows (arrays of cells, the
+#   column titles are also sent once per worker). A worker prices its orders with compute_custom_algorithm.price_order() and sends
+#   back the report rows it produced, each tagged with its order index. The shards' rows are then merged back into the original order
+#   of the order list, so the payload is the same as run()'s no matter how the orders were sharded or which shard finished first.
+#
+# NOTE: Worker processes re-import this module, so a program calling run_parallel() with workers > 1 must do so from under an
+#   "if __name__ == '__main__':" guard (main.py does) on operating systems that start processes fresh (Windows).
+#
+# Example Usage (put this in calling function):
+#   import parallel_run
+#   payload = parallel_run.run_parallel(hash_map_package, linked_list_package, workers=8)
+#
+#########################################################################################################
+import concurrent.futures # import process pool module
+import heapq              # import heap queue module, used to merge the shards' rows back into order
+import operator           # import operator module, used to read the cells of every order
+import os                 # import os module, used for the CPU count
+import compute_custom_algorithm # import the pricing algorithm
+import data_structure_package   # import object container class
+
+STATE_COLUMN = 4            # column index of the order list's "State" column (used by shardBy="state")
+SHARDS_PER_WORKER = 4       # default number of range shards per worker
+SHARD_TYPES = ("range", "state")
+
+# The fee schedule package and order list column titles of a worker process (set once per worker by _initializeWorker())
+_workerFeeSchedule = None
+_workerTitleRow = None
+
+# This function is the process pool's initializer. It runs once in each worker process and keeps the fee schedule and column titles for every shard the worker prices.
+#   Each worker keeps its own fee memo, set up the same way as this process's (see compute_custom_algorithm.configureFeeMemo()).
+def _initializeWorker(feeSchedule, titleRow, feeMemoStats):
+    global _workerFeeSchedule, _workerTitleRow
+    _workerFeeSchedule = feeSchedule
+    _workerTitleRow = titleRow
+    compute_custom_algorithm.configureFeeMemo(feeMemoStats["enabled"], feeMemoStats["maxSize"])
+
+# This function prices one shard (called in a worker process). A shard is (order indexes, rows). It returns (increases, rushes), each an array of (order index, report row).
+def _priceShard(shard):
+    orderIndexes, rows = shard
+    titleRow = _workerTitleRow
+    linked_list_package = data_structure_package.ds_package(None, titleRow, includes_title_row=0)   # only the column titles are used to price a single order
+    increases = []
+    rushes = []
+    for orderIndex, rowArray in zip(orderIndexes, rows):
+        node = dict(zip(titleRow, rowArray))                       # the same dictionary create_linkedList.py builds for a row
+        increaseRow, rushRow = compute_custom_algorithm.price_order(_workerFeeSchedule, linked_list_package, node)
+        if(increaseRow != None):
+            increases.append((orderIndex, increaseRow))
+        if(rushRow != None):
+            rushes.append((orderIndex, rushRow))
+    return increases, rushes
+
+# Helper function: return the part of the fee schedule package the workers need. With a feeIndex the hashmap isn't used to price orders, so only the index is sent.
+#   Without one the whole package is sent, and each worker re-hashes the hashmap's keys as it is loaded (see the pickle functions in hashMap.py).
+def _workerPackage(hash_map_package):
+    if(hash_map_package.fee_index != None):
+        return data_structure_package.ds_package(None, hash_map_package.keys_dictionary, hash_map_package.fee_index)
+    return hash_map_package
+
+# Helper function: return every order of the order list package as an array of cells (in column title order), title row skipped
+def _orderRows(linked_list_package):
+    nodes = iter(linked_list_package.data_structure)
+    if(linked_list_package.includes_title_row == 1):               # the first node holds the title row, skip it (the same as run())
+        next(nodes, None)
+    getCells = operator.itemgetter(*linked_list_package.keys_dictionary)
+    return [ getCells(node) for node in nodes ]
+
+# This function splits the orders into shards. It returns an array of (order indexes, rows).
+def make_shards(rows, shardBy="range", shardCount=1):
+    if(shardBy == "range"):
+        shardCount = max(1, min(shardCount, len(rows)))
+        shards = []
+        for shardIndex in range(shardCount):
+            start = len(rows) * shardIndex // shardCount
+            end = len(rows) * (shardIndex + 1) // shardCount
+            shards.append((range(start, end), rows[start:end]))
+        return shards
+    if(shardBy == "state"):
+        states = {}                                                # State -> (order indexes, rows), in order of first appearance
+        for orderIndex in range(len(rows)):
+            shard = states.setdefault(rows[orderIndex][STATE_COLUMN], ([], []))
+            shard[0].append(orderIndex)
+            shard[1].append(rows[orderIndex])
+        return list(states.values())
+    raise ValueError("Unknown shard type '" + str(shardBy) + "', expected one of: " + ", ".join(SHARD_TYPES))
+
+# This function prices every order in the order list across a pool of worker processes and returns the same payload as compute_custom_algorithm.run()
+def run_parallel(hash_map_package, linked_list_package, workers=None, shardBy="range", shardCount=None):
+    if(shardBy not in SHARD_TYPES):
+        raise ValueError("Unknown shard type '" + str(shardBy) + "', expected one of: " + ", ".join(SHARD_TYPES))
+    if(workers == None):
+        workers = os.cpu_count() or 1
+    if(workers <= 1):                                              # nothing to spread out, price the orders in this process
+        return compute_custom_algorithm.run(hash_map_package, linked_list_package)
+    if(shardCount == None):
+        shardCount = workers * SHARDS_PER_WORKER
+
+    titleRow = list(linked_list_package.keys_dictionary)
+    shards = make_shards(_orderRows(linked_list_package), shardBy, shardCount)
+
+    # Price the shards. The fee schedule and column titles are sent to each worker once, by the initializer.
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(workers, max(1, len(shards))), initializer=_initializeWorker,
+                                                initargs=(_workerPackage(hash_map_package), titleRow, compute_custom_algorithm.getFeeMemoStats())) as executor:
+        results = list(executor.map(_priceShard, shards))
+
+    # Merge the shards' rows back into the original order (each shard's rows are already in order, so the shards only have to be merged, not sorted)
+    titleRows = compute_custom_algorithm.reportTitleRows()
+    spreadsheetArrayOne = [ titleRows[0] ]
+    spreadsheetArrayTwo = [ titleRows[1] ]
+    byOrderIndex = operator.itemgetter(0)
+    for orderIndex, rowArray in heapq.merge(*[ result[0] for result in results ], key=byOrderIndex):
+        spreadsheetArrayOne.append(rowArray)
+    for orderIndex, rowArray in heapq.merge(*[ result[1] for result in results ], key=byOrderIndex):
+        spreadsheetArrayTwo.append(rowArray)
+    return [ spreadsheetArrayOne, spreadsheetArrayTwo ]
+
+# Test Code - uncomment lines below & run for testing (the parallel payload must be the same as run()'s)
+# if __name__ == '__main__':
+#     import read_data_from_excel, create_hashMap, create_linkedList
+#     hash_map_package = create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+#     linked_list_package = create_linkedList.prepare_data_structure(read_data_from_excel.get_excel_data("orderList.xlsx"))
+#     print(run_parallel(hash_map_package, linked_list_package, workers=4, shardBy="state") == compute_custom_algorithm.run(hash_map_package, linked_list_package))
@@ -0,0 +1,135 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: parsed_input_cache
+# Function: get_cached_rows(filepath, variant, readFunction, cacheDirectory=None)
+# Parameters:
+#   - A path to an input file (a spreadsheet)
+#   - A variant string that says how the file was read (for example which sheet and which column schema), since the same file read
+#     two different ways gives two different results
+#   - A function that reads the file and returns its parsed rows (called only when there is no valid cache entry)
+#   - The directory cache files are kept in (optional, defaults to a '.parsed_cache' folder next to the input file)
+#
+# Purpose: Parsing a spreadsheet is the slowest part of a run, and the same input files are usually parsed over and over while analysis
+#   of a month is re-run. This cache stores the parsed rows of a file on disk in a compact binary format (pickle) the first time the file is
+#   read. Later reads of the same, unchanged file load the rows straight from the cache instead of parsing the spreadsheet again.
+#
+# Description: Each cache entry is keyed by the input file's path and the variant, and records the file's fingerprint when it was parsed:
+#   its size, its modification time and a sha256 hash of its contents. A cache entry is only used if the file still has the same fingerprint,
+#   so the cache invalidates itself automatically when the file changes:
+#     - if the size changed the file changed, the entry is thrown away without hashing anything
+#     - otherwise the file is hashed and compared, so an edit that kept the same size and modification time is still caught, and a file
+#       that was only touched (new modification time, same contents) keeps its cache entry
+#   A stale or unreadable entry is simply replaced by re-reading the file. Cache files are written to a temporary file first and then moved
+#   into place, so an interrupted run never leaves a half written entry behind.
+#
+# NOTE: The cache files are pickles, only point cacheDirectory at a folder you control (never at files from someone else).
+#
+# Example Usage (put this in calling function):
+#   import parsed_input_cache
+#   rows = parsed_input_cache.get_cached_rows("orderList.xlsx", "sheet=0", lambda: read_data_from_excel.get_excel_data("orderList.xlsx"))
+#
+#########################################################################################################
+import hashlib # import hash module, used for the content hash and cache file names
+import os      # import os module, used for file sizes/modification times and paths
+import pickle  # import pickle module, used as the compact binary format of cache files
+
+CACHE_VERSION = 1                   # bump when the layout of cache files changes, older entries are then ignored
+CACHE_DIRECTORY_NAME = ".parsed_cache"
+HASH_BLOCK_SIZE = 1048576           # bytes read at a time while hashing a file (1 MB)
+
+# This function returns the sha256 hash of a file's contents (as hex text)
+def _hashFile(filepath):
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as inputFile:
+        block = inputFile.read(HASH_BLOCK_SIZE)
+        while(block):
+            digest.update(block)
+            block = inputFile.read(HASH_BLOCK_SIZE)
+    return digest.hexdigest()
+
+# This function returns the path of the cache file for an input file and variant
+def _cacheFilePath(filepath, variant, cacheDirectory):
+    if(cacheDirectory == None):
+        cacheDirectory = os.path.join(os.path.dirname(filepath), CACHE_DIRECTORY_NAME)
+    name = hashlib.sha1((filepath + "\n" + variant).encode("utf-8")).hexdigest()
+    return os.path.join(cacheDirectory, os.path.basename(filepath) + "." + name[:16] + ".pickle")
+
+# This function returns the header of a cache file (its fingerprint), or None if there is no readable cache file. Only the header is read.
+def _readHeader(cacheFile):
+    try:
+        with open(cacheFile, "rb") as inputFile:
+            header = pickle.load(inputFile)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+    if(not isinstance(header, dict) or header.get("version") != CACHE_VERSION):
+        return None
+    return header
+
+# This function returns the rows stored in a cache file (after its header), or None if the file can't be read
+def _readRows(cacheFile):
+    try:
+        with open(cacheFile, "rb") as inputFile:
+            pickle.load(inputFile)          # skip the header
+            return pickle.load(inputFile)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        return None
+
+# This function writes a cache file: the header (fingerprint) followed by the rows, through a temporary file so the entry is replaced in one step
+def _writeCacheFile(cacheFile, header, rows):
+    os.makedirs(os.path.dirname(cacheFile), exist_ok=True)
+    temporaryFile = cacheFile + "." + str(os.getpid()) + ".tmp"
+    with open(temporaryFile, "wb") as outputFile:
+        pickle.dump(header, outputFile, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(rows, outputFile, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporaryFile, cacheFile)
+
+# This function returns the fingerprint of a file: { "path", "size", "mtime_ns", "sha256" }
+def file_fingerprint(filepath):
+    filepath = os.path.abspath(filepath)
+    status = os.stat(filepath)
+    return { "path" : filepath, "size" : status.st_size, "mtime_ns" : status.st_mtime_ns, "sha256" : _hashFile(filepath) }
+
+# This function returns the parsed rows of a file, from the cache if the file hasn't changed since it was cached, otherwise by calling readFunction()
+#   (and caching the result for next time)
+def get_cached_rows(filepath, variant, readFunction, cacheDirectory=None):
+    filepath = os.path.abspath(filepath)
+    cacheFile = _cacheFilePath(filepath, variant, cacheDirectory)
+    status = os.stat(filepath)
+
+    # Check the cache entry's fingerprint. A different size means the file changed, otherwise the contents are hashed and compared.
+    header = _readHeader(cacheFile)
+    contentHash = None
+    if(header != None and header.get("path") == filepath and header.get("variant") == variant and header.get("size") == status.st_size):
+        contentHash = _hashFile(filepath)
+        if(header.get("sha256") == contentHash):
+            rows = _readRows(cacheFile)
+            if(rows != None):
+                if(header.get("mtime_ns") != status.st_mtime_ns):     # the file was only touched, record its new modification time
+                    header["mtime_ns"] = status.st_mtime_ns
+                    _writeCacheFile(cacheFile, header, rows)
+                return rows
+
+    # Cache miss (no entry, a stale entry, or an unreadable one): read the file and cache the rows
+    rows = readFunction()
+    if(contentHash == None):
+        contentHash = _hashFile(filepath)
+    header = { "version" : CACHE_VERSION, "path" : filepath, "variant" : variant, "size" : status.st_size, "mtime_ns" : status.st_mtime_ns, "sha256" : contentHash }
+    _writeCacheFile(cacheFile, header, rows)
+    return rows
+
+# This function deletes every cache file in a cache directory (defaults to the '.parsed_cache' folder next to 'filepath')
+def clear_cache(filepath=".", cacheDirectory=None):
+    if(cacheDirectory == None):
+        cacheDirectory = os.path.join(os.path.dirname(os.path.abspath(filepath)), CACHE_DIRECTORY_NAME)
+    if(not os.path.isdir(cacheDirectory)):
+        return
+    for name in os.listdir(cacheDirectory):
+        if(name.endswith(".pickle") or name.endswith(".tmp")):
+            os.remove(os.path.join(cacheDirectory, name))
+
+# Test Code - uncomment lines below & run for testing (the second read should come from the cache)
+# import read_data_from_excel, time
+# for attempt in range(2):
+#     start = time.time()
+#     rows = get_cached_rows("orderList.xlsx", "sheet=0", lambda: read_data_from_excel.get_excel_data("orderList.xlsx"))
+#     print(len(rows), "rows in", time.time() - start, "seconds")
@@ -1,68 +1,136 @@
-#########################################################################################################
-# Author: Timothy Fye
-# Title: read_data_from_csv
-# Function: get_csv_data(filepath)
-# Parameters: A path to a file (if file is in same directory as source code simply put in name of file)
-#
-# Purpose: This function allows me to read data from any csv file regardless of column size or row 
-#   length. Before this file I had to write a single, all encompassing script to read data from a document straight into 
-#   a data structure. This was messy and caused me to have to re-write scripts from stratch for each project. This function 
-#   is now a black box. I call it and feed it a path to file. It returns spreadsheet data in a format of an array of arrays. 
-#   The returned array can then be passed to any handler function specifically built to push the array into a data structure as  
-#   project demands. The referenced handler function will instantiate the proper datastructure and also account for the amount of columns/rows
-#   for the project at hand (as the input file will be known to me at that time). This function can be reused for all projects, 
-#   aids in keeping duties encapsulated within their own methods, and mitigates the amount of code that has to be modified  
-#   everytime I need to start a new project.
-#
-# Description: This function opens a csv file and returns an array of arrays to the calling function.
-#   The array of arrays is in the syntax below. Notice that the cell values of each row are contained in each 
-#   sub-array. Anotherwards, the outer array contains arrays of rows, which contains cell values from the left most 
-#   column to the right most column. Example for visualization: 
-#
-#       [ 
-#           [(row 1, column 1), (row 1, column 2), (row 1, column 3),...(row 1, column n)],  
-#           [(row 2, column 1), (row 2, column 2), (row 2, column 3),...(row 2, column n)],
-#           ............................................................                  ,
-#           [(row n, column 1), (row n, column 2), (row n, column 3),...(row n, column n)]
-#       ]    
-#
-# NOTE: CSV is comma-deliminated document. This means that if the text within cells have commas in them 
-#       then that cell will be read as two different cells in two different columns instead of one cell
-#       under one column. Any csv document with commas in the text will essentially return an unreliable array.
-#       Commas basically mean "new cell starts here". A doc with 15 columns that has text with no commas will 
-#       produce an array of 15 values. A doc with 15 columns, but one cell that has text: Tom Reynold, Sr.
-#       will produce 16 columns. This will put any algorithm that processes the returned array off-kilter.  
-#       Therefore, before using this function be sure to open a csv, select all, hit ctrl-f, and find/replace 
-#       all commas with either nothing or wiht a different delimantor (such as "|"). The other option is to ensure 
-#       that the values of all cells are surrounded by parenthesis. In this case commas in the cell text will
-#       be okay and not result in unrelabile output. Example: "Tom Reynolds, Sr." should be okay. 
-#
-# Example Usage (put this in calling function): 
-#   import read_data_from_csv
-#   spreadsheetArray = read_data_from_csv.get_csv_data("file.csv") # Call function that reads data from provided csv file and returns an array containing arrays of row data
-#
-#########################################################################################################
-import csv # import csv module 
-
-# This function is responsible for opening csv file, reading data from it, and returning an array or arrays that hold all spreadsheet data. 
-def get_csv_data(filepath):
-
-    # File name to be opened (must be saved in same directory as .py exe's or full path provided)
-    inputFile = filepath
-
-    # Read data from a csv file
-    with open(inputFile) as csvInputFile:                  # Open file, set doc alias to csvfile 
-        payload = csv.reader(csvInputFile, delimiter=",")  # Payload will contain the tokenized response from csv.reader function. Intuitively enough, delimiter for standard CSV is ",". 
-        values = []                                        # Initialize an array that will hold all values in the workbook         
-        for rowArray in payload:                           # Each "row" in payload consists of a string that is parsed into an arry, using the delimiter to determine values in each array element. (1st line may be: ['Dog ', 'Cat']. 2nd line may be:['Calvin ', 'Fluffy']. Row[1] = 'Cat') 
-            values.append(rowArray)                        # Append the row array of cell values to the values array
-
-    # close file
-    csvInputFile.close    
-
-    # return the data array to calling function 
-    return values
-
-# Test Code - unccomment lines below & run for testing
-# payload = get_csv_data("fees.csv") # use any csv file in the same directory as this program 
-# print(payload)
\ No newline at end of file
+#########################################################################################################
+# Author: Timothy Fye
+# Title: read_data_from_csv
+# Functions: get_csv_data(filepath, schema=None), iter_csv_rows(filepath, schema=None), iter_csv_batches(filepath, batchSize=10000, header=1, schema=None)
+# Parameters: A path to a file (if file is in same directory as source code simply put in name of file), and optionally a column schema
+#   (see 'columnSchema.py'). With a schema the columns it names are converted to numbers, dates or booleans as the file is read.
+#
+# Purpose: This function allows me to read data from any csv file regardless of column size or row 
+#   length. Before this file I had to write a single, all encompassing script to read data from a document straight into 
+#   a data structure. This was messy and caused me to have to re-write scripts from stratch for each project. This function 
+#   is now a black box. I call it and feed it a path to file. It returns spreadsheet data in a format of an array of arrays. 
+#   The returned array can then be passed to any handler function specifically built to push the array into a data structure as  
+#   project demands. The referenced handler function will instantiate the proper datastructure and also account for the amount of columns/rows
+#   for the project at hand (as the input file will be known to me at that time). This function can be reused for all projects, 
+#   aids in keeping duties encapsulated within their own methods, and mitigates the amount of code that has to be modified  
+#   everytime I need to start a new project.
+#
+# Description: This function opens a csv file and returns an array of arrays to the calling function.
+#   The array of arrays is in the syntax below. Notice that the cell values of each row are contained in each 
+#   sub-array. Anotherwards, the outer array contains arrays of rows, which contains cell values from the left most 
+#   column to the right most column. Example for visualization: 
+#
+#       [ 
+#           [(row 1, column 1), (row 1, column 2), (row 1, column 3),...(row 1, column n)],  
+#           [(row 2, column 1), (row 2, column 2), (row 2, column 3),...(row 2, column n)],
+#           ............................................................                  ,
+#           [(row n, column 1), (row n, column 2), (row n, column 3),...(row n, column n)]
+#       ]    
+#
+# NOTE: CSV is comma-deliminated document. This means that if the text within cells have commas in them 
+#       then that cell will be read as two different cells in two different columns instead of one cell
+#       under one column. Any csv document with commas in the text will essentially return an unreliable array.
+#       Commas basically mean "new cell starts here". A doc with 15 columns that has text with no commas will 
+#       produce an array of 15 values. A doc with 15 columns, but one cell that has text: Tom Reynold, Sr.
+#       will produce 16 columns. This will put any algorithm that processes the returned array off-kilter.  
+#       Therefore, before using this function be sure to open a csv, select all, hit ctrl-f, and find/replace 
+#       all commas with either nothing or wiht a different delimantor (such as "|"). The other option is to ensure 
+#       that the values of all cells are surrounded by parenthesis. In this case commas in the cell text will
+#       be okay and not result in unrelabile output. Example: "Tom Reynolds, Sr." should be okay. 
+#
+# Chunked reading: iter_csv_batches() reads the file a batch of rows at a time instead of returning every row at once. Its batches can be handed
+#   straight to compute_custom_algorithm.run_batch()/run_batches(), so order exports too large to hold in memory can still be processed.
+#   iter_csv_rows() is the row at a time version of get_csv_data(): it is a generator that yields the same rows (title row included) one at a time.
+#
+# Example Usage (put this in calling function): 
+#   import read_data_from_csv
+#   spreadsheetArray = read_data_from_csv.get_csv_data("file.csv") # Call function that reads data from provided csv file and returns an array containing arrays of row data
+#
+#########################################################################################################
+import csv # import csv module 
+import columnSchema # import column schema module (optional typed conversion of cells)
+
+# Default converter for columns a schema doesn't name: csv cells are already text, so they are returned as is
+def _keepText(value):
+    return value
+
+# This function is responsible for opening csv file, reading data from it, and returning an array or arrays that hold all spreadsheet data. 
+def get_csv_data(filepath, schema=None):
+
+    # File name to be opened (must be saved in same directory as .py exe's or full path provided)
+    inputFile = filepath
+
+    # Read data from a csv file
+    with open(inputFile) as csvInputFile:                  # Open file, set doc alias to csvfile 
+        payload = csv.reader(csvInputFile, delimiter=",")  # Payload will contain the tokenized response from csv.reader function. Intuitively enough, delimiter for standard CSV is ",". 
+        values = []                                        # Initialize an array that will hold all values in the workbook         
+        converters = None                                  # Converters compiled from the schema (once the title row has been read)
+        for rowArray in payload:                           # Each "row" in payload consists of a string that is parsed into an arry, using the delimiter to determine values in each array element. (1st line may be: ['Dog ', 'Cat']. 2nd line may be:['Calvin ', 'Fluffy']. Row[1] = 'Cat') 
+            if(converters != None):                        # Convert the typed columns of every row after the title row
+                rowArray = columnSchema.convertRow(converters, rowArray, values[0])
+            elif(schema != None):                          # The first row is the title row, compile the schema against it
+                converters = schema.compile(rowArray, _keepText)
+            values.append(rowArray)                        # Append the row array of cell values to the values array
+
+    # close file
+    csvInputFile.close    
+
+    # return the data array to calling function 
+    return values
+
+# This generator opens a csv file and yields its rows one row array at a time (cell values from the left most column to the right most column), so only one row
+#   has to be held in memory by the caller. With a schema the first row is the title row and the schema is compiled against it.
+def iter_csv_rows(filepath, schema=None):
+    with open(filepath, newline="") as csvInputFile:      # newline="" lets the csv module handle line breaks inside quoted cells
+        payload = csv.reader(csvInputFile, delimiter=",")
+        titleRow = None
+        converters = None                                  # Converters compiled from the schema (once the title row has been read)
+        for rowArray in payload:
+            if(converters != None):                        # Convert the typed columns of every row after the title row
+                rowArray = columnSchema.convertRow(converters, rowArray, titleRow)
+            elif(schema != None and titleRow == None):     # The first row is the title row, compile the schema against it
+                titleRow = rowArray
+                converters = schema.compile(rowArray, _keepText)
+            yield rowArray
+
+# This generator reads a csv file in chunks, yielding a batch of at most 'batchSize' rows at a time, so files of any size can be processed in constant memory
+#   (only the current batch is held). Each batch is yielded as a (titleRow, rows) pair, where rows is an array of row arrays that never includes the title row.
+#   Blank lines are skipped.
+#   - header: 1 if the first row of the file is the title row (the default), 0 if the file has no title row (titleRow is then None), or an array of column
+#     titles to use for a file that has no title row.
+#   - schema (optional): a columnSchema.columnSchema, applied to every row as it is read (see get_csv_data()). Columns can only be named by title if there are titles.
+# Example: for titleRow, rows in iter_csv_batches("orders.csv", 5000): compute_custom_algorithm.run_batch(hash_map_package, titleRow, rows)
+def iter_csv_batches(filepath, batchSize=10000, header=1, schema=None):
+    if(batchSize < 1):
+        raise ValueError("batchSize must be at least 1")
+    titleRow = None
+    if(isinstance(header, (list, tuple))):                 # titles were provided for a file without a title row
+        titleRow = list(header)
+    converters = None
+    with open(filepath, newline="") as csvInputFile:       # newline="" lets the csv module handle line breaks inside quoted cells
+        payload = csv.reader(csvInputFile, delimiter=",")
+        batch = []
+        for rowArray in payload:
+            if(len(rowArray) == 0):                        # skip blank lines
+                continue
+            if(header == 1 and titleRow == None):          # the first row is the title row
+                titleRow = rowArray
+                continue
+            if(schema != None and converters == None):     # compile the schema once, against the titles (or blank titles if the file has none)
+                converters = schema.compile(titleRow if titleRow != None else [ "" for value in rowArray ], _keepText)
+            if(converters != None):
+                rowArray = columnSchema.convertRow(converters, rowArray, titleRow)
+            batch.append(rowArray)
+            if(len(batch) == batchSize):                   # the batch is full, hand it to the caller and start a new one
+                yield titleRow, batch
+                batch = []
+        if(len(batch) > 0):                                # the last (partial) batch
+            yield titleRow, batch
+
+# Test Code - unccomment lines below & run for testing
+# payload = get_csv_data("fees.csv") # use any csv file in the same directory as this program 
+# print(payload)
+# for rowArray in iter_csv_rows("orders.csv"):
+#     print(rowArray)
+# for titleRow, rows in iter_csv_batches("orders.csv", 100):
+#     print(len(rows))
@@ -1,64 +1,170 @@
-#########################################################################################################
-# Author: Timothy Fye
-# Title: read_data_from_excel
-# Function: get_excel_data(filepath)
-# Parameters: A path to a file (if file is in same directory as source code simply put in name of file)
-#
-# Purpose: This function allows me to read data from any excel file regardless of column size or row 
-#   length. Before this file I had to write a single, all encompassing script to read data from a document straight into 
-#   a data structure. This was messy and caused me to have to re-write scripts from stratch for each project. This function 
-#   is now a black box. I call it and feed it a path to file. It returns spreadsheet data in a format of an array of arrays. 
-#   The returned array can then be passed to any handler function specifically built to push the array into a data structure as  
-#   project demands. The referenced handler function will instantiate the proper datastructure and also account for the amount of columns/rows
-#   for the project at hand (as the input file will be known to me at that time). This function can be reused for all projects, 
-#   aids in keeping duties encapsulated within their own methods, and mitigates the amount of code that has to be modified  
-#   everytime I need to start a new project.
-#
-# Description: This function opens an excel file and returns an array of arrays to the calling function.
-#   The array of arrays is in the syntax below. Notice that the cell values of each row are contained in each 
-#   sub-array. Anotherwards, the outer array contains arrays of rows, which contains cell values from the left most 
-#   column to the right most column. Example for visualization: 
-#
-#       [ 
-#           [(row 1, column 1), (row 1, column 2), (row 1, column 3),...(row 1, column n)],  
-#           [(row 2, column 1), (row 2, column 2), (row 2, column 3),...(row 2, column n)],
-#           ............................................................                  ,
-#           [(row n, column 1), (row n, column 2), (row n, column 3),...(row n, column n)]
-#       ]    
-# 
-# References: https://stackoverflow.com/questions/22169325/read-excel-file-in-python 
-#
-# NOTE: 'xlrd' module may need to be installed for this function to work. See instructions in line below.
-#
-# Example Usage (put this in calling function): :
-#   import read_data_from_excel 
-#   spreadsheetArray = read_data_from_excel.get_excel_data("fees.xlsx") # Call function that reads data from provided excel file and returns an array containing arrays of row data
-#
-#########################################################################################################
-import xlrd # import excel read module ---> [ *** Note: You may need to open the command line in the directory you are running this executable and install excel module with command 'pip install xlrd' *** ]
-
-# This function is responsible for opening excel file, reading data from it, and returning an array or arrays that hold all spreadsheet data. 
-def get_excel_data(filepath):
-
-    # File name to be opened (must be saved in same directory as .py exe's or full path provided)
-    inputFile = filepath
-
-    # Read data from an excel file
-    wb = xlrd.open_workbook(inputFile)                        # Open the file in question
-    for s in wb.sheets():                                     # For all sheets that exist in the workbook 
-        values = []                                           # Initialize an array that will hold all values in the workbook   
-        for row in range(s.nrows):                            # For each row on the current sheet in workbook
-            col_value = []                                    # Initialize an array that will hold all column values for specified row 
-            for col in range(s.ncols):                        # For each column that is in the current row 
-                value  = (s.cell(row,col).value)              # Find the value of the cell, the col reference will increment each loop 
-                try : value = str(int(value))                 # See if we can cast the value to an in within a string 
-                except : pass                                 # Include exception 
-                col_value.append(value)                       # Append the cell value to the column value array 
-            values.append(col_value)                          # Append the column value array 
-
-    # return the data array to calling function 
-    return values
-
-# Test Code - unccomment lines below & run for testing
-# payload = get_excel_data("orderList.xlsx") # use any csv file in the same directory as this program 
-# print(payload)
\ No newline at end of file
+#########################################################################################################
+# Author: Timothy Fye
+# Title: read_data_from_excel
+# Functions: get_excel_data(filepath, sheet=0, schema=None, useCache=0), iter_excel_rows(filepath, sheet=0, schema=None), get_sheet_names(filepath)
+# Parameters: A path to a file (if file is in same directory as source code simply put in name of file), and optionally which sheet
+#   to read (the sheet's position in the workbook starting at 0, or the sheet's name). The first sheet is read by default.
+#
+# Purpose: This function allows me to read data from any excel file regardless of column size or row 
+#   length. Before this file I had to write a single, all encompassing script to read data from a document straight into 
+#   a data structure. This was messy and caused me to have to re-write scripts from stratch for each project. This function 
+#   is now a black box. I call it and feed it a path to file. It returns spreadsheet data in a format of an array of arrays. 
+#   The returned array can then be passed to any handler function specifically built to push the array into a data structure as  
+#   project demands. The referenced handler function will instantiate the proper datastructure and also account for the amount of columns/rows
+#   for the project at hand (as the input file will be known to me at that time). This function can be reused for all projects, 
+#   aids in keeping duties encapsulated within their own methods, and mitigates the amount of code that has to be modified  
+#   everytime I need to start a new project.
+#
+# Description: This function opens an excel file and returns an array of arrays to the calling function.
+#   The array of arrays is in the syntax below. Notice that the cell values of each row are contained in each 
+#   sub-array. Anotherwards, the outer array contains arrays of rows, which contains cell values from the left most 
+#   column to the right most column. Example for visualization: 
+#
+#       [ 
+#           [(row 1, column 1), (row 1, column 2), (row 1, column 3),...(row 1, column n)],  
+#           [(row 2, column 1), (row 2, column 2), (row 2, column 3),...(row 2, column n)],
+#           ............................................................                  ,
+#           [(row n, column 1), (row n, column 2), (row n, column 3),...(row n, column n)]
+#       ]    
+# 
+#   iter_excel_rows() is the streaming version: it is a generator that yields one row array at a time instead of building
+#   the whole array of arrays, so only one row has to be held in memory by the caller. For .xlsx files it uses openpyxl's
+#   read-only mode, which parses the sheet as it is read instead of loading the whole workbook first, so peak memory stays
+#   bounded no matter how large the file is. .xls files (and .xlsx files when openpyxl isn't installed) are read with xlrd a
+#   row at a time. Both readers return the same cell values (dates are returned as excel serial numbers either way).
+#   get_excel_data() is simply list(iter_excel_rows()).
+#
+#   Both functions accept an optional column schema (see 'columnSchema.py'). With a schema, the columns it names are
+#   converted to native numbers, dates or booleans once, as the rows are read, instead of being returned as text.
+#
+#   get_excel_data(..., useCache=1) keeps the parsed rows in an on-disk cache (see 'parsed_input_cache.py'), so reading a file that hasn't
+#   changed since the last run loads the rows straight from the cache instead of parsing the spreadsheet again.
+#
+# References: https://stackoverflow.com/questions/22169325/read-excel-file-in-python 
+#
+# NOTE: 'xlrd' module may need to be installed for this function to work. See instructions in line below. 'openpyxl' is optional
+#   (pip install openpyxl), it is used to stream .xlsx files when it is installed.
+#
+# Example Usage (put this in calling function): :
+#   import read_data_from_excel 
+#   spreadsheetArray = read_data_from_excel.get_excel_data("fees.xlsx") # Call function that reads data from provided excel file and returns an array containing arrays of row data
+#   for rowArray in read_data_from_excel.iter_excel_rows("orders.xlsx"): # Or read the rows one at a time
+#       print(rowArray)
+#
+#########################################################################################################
+import datetime # import datetime module (openpyxl returns dates as datetime objects)
+import xlrd # import excel read module ---> [ *** Note: You may need to open the command line in the directory you are running this executable and install excel module with command 'pip install xlrd' *** ]
+try : import openpyxl # import streaming .xlsx read module (optional) ---> [ *** Note: install with command 'pip install openpyxl' *** ]
+except ImportError : openpyxl = None
+import columnSchema # import column schema module (optional typed conversion of cells)
+import parsed_input_cache # import parsed input cache module (optional, skips re-parsing unchanged files)
+
+# Helper function: convert a cell value the same way for every reader. Whole numbers are returned as strings ("5.0" -> "5"), everything else as is.
+def _convertCell(value):
+    if(value == None):                                              # openpyxl returns None for an empty cell, xlrd returns ""
+        return ""
+    if(isinstance(value, (datetime.datetime, datetime.date))):      # openpyxl returns dates as datetimes, xlrd returns the excel serial number
+        value = openpyxl.utils.datetime.to_excel(value)
+    try : value = str(int(value))                                   # See if we can cast the value to an in within a string 
+    except : pass                                                   # Include exception 
+    return value
+
+# Helper generator: convert raw rows of cell values as they are read. The first row is the title row and is always converted with _convertCell(). If a
+#   columnSchema was given it is compiled against the title row once, and every following row is converted with the compiled converters (typed columns
+#   arrive as numbers/dates/booleans). Without a schema every cell is converted with _convertCell(), the same as it always has been.
+def _convertRows(rawRows, schema, datemode):
+    titleRow = None
+    converters = None
+    for row in rawRows:
+        if(titleRow == None):
+            titleRow = [ _convertCell(value) for value in row ]
+            if(schema != None):
+                converters = schema.compile(titleRow, _convertCell, datemode)
+            yield titleRow
+        elif(converters == None):
+            yield [ _convertCell(value) for value in row ]
+        else:
+            yield columnSchema.convertRow(converters, row, titleRow)
+
+# Helper generator: yield the raw rows of an .xlsx sheet one at a time using openpyxl's read-only (streaming) mode
+def _iterXlsxRows(filepath, sheet):
+    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)  # read-only mode doesn't load the whole workbook into memory
+    try:
+        if(isinstance(sheet, int)):
+            s = wb.worksheets[sheet]
+        else:
+            s = wb[sheet]
+        columnCount = s.max_column                                         # pad short rows out to the width of the sheet (xlrd does this too)
+        emptyRows = 0                                                      # blank rows seen since the last row with data
+        for row in s.iter_rows(values_only=True):                          # For each row on the sheet, read as the file is parsed
+            rowArray = list(row)
+            while(columnCount != None and len(rowArray) < columnCount):
+                rowArray.append(None)
+            if(rowArray.count(None) + rowArray.count("") == len(rowArray)): # hold blank rows back, formatted but empty rows at the bottom of a sheet
+                emptyRows = emptyRows + 1                                  #   are dropped (xlrd ends the sheet at the last row with data)
+                continue
+            while(emptyRows > 0):                                          # blank rows in between rows with data are kept
+                yield [ None for value in rowArray ]
+                emptyRows = emptyRows - 1
+            yield rowArray
+    finally:
+        wb.close()                                                         # read-only workbooks keep the file open until closed
+
+# Helper generator: yield the raw rows of a sheet one at a time using xlrd (.xls files, or .xlsx when openpyxl isn't installed)
+def _iterXlrdRows(filepath, sheet, schema):
+    wb = xlrd.open_workbook(filepath, on_demand=True)                      # on_demand only loads the sheet that is asked for
+    try:
+        if(isinstance(sheet, int)):
+            s = wb.sheet_by_index(sheet)
+        else:
+            s = wb.sheet_by_name(sheet)
+        rawRows = ( s.row_values(row) for row in range(s.nrows) )          # row_values reads the whole row at once instead of cell by cell
+        for rowArray in _convertRows(rawRows, schema, wb.datemode):        # xlrd dates are serial numbers, the workbook's datemode says how to read them
+            yield rowArray
+    finally:
+        wb.release_resources()
+
+# This function returns the names of every sheet in an excel file, in workbook order
+def get_sheet_names(filepath):
+    if(filepath.lower().endswith((".xlsx", ".xlsm")) and openpyxl != None):
+        wb = openpyxl.load_workbook(filepath, read_only=True)   # read-only mode only reads the workbook's sheet list, not the sheets
+        try : return list(wb.sheetnames)
+        finally : wb.close()
+    wb = xlrd.open_workbook(filepath, on_demand=True)          # on_demand doesn't load any sheets
+    try : return wb.sheet_names()
+    finally : wb.release_resources()
+
+# This generator opens an excel file and yields the rows of one sheet, one row array at a time (cell values from the left most column to the right most column)
+# - schema (optional): a columnSchema.columnSchema, see columnSchema.py. The first row must be the title row when a schema is used.
+def iter_excel_rows(filepath, sheet=0, schema=None):
+    if(filepath.lower().endswith((".xlsx", ".xlsm")) and openpyxl != None):
+        return _convertRows(_iterXlsxRows(filepath, sheet), schema, 0)     # openpyxl already returns dates as datetimes
+    return _iterXlrdRows(filepath, sheet, schema)
+
+# This function is responsible for opening excel file, reading data from it, and returning an array or arrays that hold all spreadsheet data (for one sheet).
+# - useCache: 1 to load the rows from the parsed input cache when the file hasn't changed since it was last read (see parsed_input_cache.py)
+def get_excel_data(filepath, sheet=0, schema=None, useCache=0):
+
+    # File name to be opened (must be saved in same directory as .py exe's or full path provided)
+    inputFile = filepath
+
+    # Use the cached rows if the file is unchanged (the cache calls back into this function, without the cache, on a miss)
+    if(useCache == 1):
+        variant = "sheet=" + repr(sheet)
+        if(schema != None):
+            variant = variant + ";schema=" + schema.getCacheKey()
+        return parsed_input_cache.get_cached_rows(inputFile, variant, lambda: get_excel_data(inputFile, sheet, schema))
+
+    # Read every row of the sheet into the values array (converting typed columns as they are read, if a schema was given)
+    values = list(iter_excel_rows(inputFile, sheet, schema))
+
+    # return the data array to calling function 
+    return values
+
+# Test Code - unccomment lines below & run for testing
+# payload = get_excel_data("orderList.xlsx") # use any csv file in the same directory as this program 
+# print(payload)
+# payload = get_excel_data("orderList.xlsx", schema=columnSchema.columnSchema({ "GLA" : "int", "Rush" : "bool", "Order Date" : "date" }))
+# print(payload[1])
+# for rowArray in iter_excel_rows("orderList.xlsx"):
+#     print(rowArray)
\ No newline at end of file
@@ -0,0 +1,102 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: read_data_from_workbooks
+# Function: get_workbooks_data(paths, workers=None, schema=None, useCache=0)
+# Parameters:
+#   - An array of paths. Each path is an excel workbook, or a directory whose excel workbooks (.xlsx, .xlsm, .xls) should all be read
+#     (for example a directory of monthly order exports)
+#   - The number of worker processes to parse sheets with (optional, defaults to the number of CPUs, 1 parses everything in this process)
+#   - A column schema and cache flag, passed on to read_data_from_excel.get_excel_data() for every sheet
+#
+# Purpose: read_data_from_excel.get_excel_data() reads one sheet of one workbook. Orders are exported month by month, and a workbook can
+#   hold several sheets, so this function reads every sheet of every workbook it is given and merges them into a single array of arrays
+#   (one title row followed by every sheet's data rows), which can be handed to create_linkedList.py like any other spreadsheet array.
+#
+# Description: Parsing a spreadsheet is slow and every sheet can be parsed independently, so the sheets are parsed at the same time in a
+#   pool of worker processes. The merge order is always the same no matter which sheet finishes first: workbooks in the order given
+#   (a directory's workbooks sorted by file name), then sheets in workbook order, then rows in sheet order. Before merging, every sheet's
+#   title row is checked against the first sheet's title row (ignoring trailing spaces); sheets whose columns don't line up would put the
+#   wrong data under the wrong titles, so a mismatch raises a ValueError naming the workbook and sheet. Empty sheets are skipped.
+#
+# NOTE: Worker processes re-import this module, so a program calling this function with workers > 1 must do so from under an
+#   "if __name__ == '__main__':" guard (main.py does) on operating systems that start processes fresh (Windows).
+#
+# Example Usage (put this in calling function):
+#   import read_data_from_workbooks
+#   spreadsheetArray = read_data_from_workbooks.get_workbooks_data(["exports/2018", "orderList.xlsx"], workers=4)
+#
+#########################################################################################################
+import concurrent.futures # import process pool module
+import os                 # import os module, used to list directories
+import read_data_from_excel # import excel read function
+
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+# This function expands the paths into the array of workbooks to read: files are kept as they are, directories are replaced by the workbooks inside them (sorted by name)
+def _expandPaths(paths):
+    if(isinstance(paths, str)):
+        paths = [ paths ]
+    workbooks = []
+    for path in paths:
+        if(os.path.isdir(path)):
+            for name in sorted(os.listdir(path)):
+                if(name.lower().endswith(EXCEL_EXTENSIONS) and not name.startswith("~$")):   # "~$" files are excel's lock files for open workbooks
+                    workbooks.append(os.path.join(path, name))
+        else:
+            workbooks.append(path)
+    return workbooks
+
+# This function reads one sheet (called in a worker process). A task is (workbook path, sheet index, schema, useCache).
+def _readSheet(task):
+    filepath, sheet, schema, useCache = task
+    return read_data_from_excel.get_excel_data(filepath, sheet, schema, useCache)
+
+# Helper function: return a title row with trailing spaces removed, for comparing title rows
+def _normalizedTitles(titleRow):
+    return [ str(title).strip() for title in titleRow ]
+
+# This function reads every sheet of every workbook and returns them merged into one array of arrays (a single title row, then every data row)
+def get_workbooks_data(paths, workers=None, schema=None, useCache=0):
+    workbooks = _expandPaths(paths)
+    if(len(workbooks) == 0):
+        raise ValueError("No excel workbooks found in: " + ", ".join(paths if not isinstance(paths, str) else [ paths ]))
+
+    # Build one task per sheet, in merge order
+    tasks = []
+    for filepath in workbooks:
+        for sheet in range(len(read_data_from_excel.get_sheet_names(filepath))):
+            tasks.append((filepath, sheet, schema, useCache))
+
+    # Parse the sheets, in a process pool when there is more than one sheet and more than one worker. map() returns the results in task order.
+    if(workers == None):
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(tasks))
+    if(workers <= 1):
+        sheets = [ _readSheet(task) for task in tasks ]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            sheets = list(executor.map(_readSheet, tasks))
+
+    # Validate the title rows and merge
+    values = []
+    titles = None
+    titleSource = None
+    for taskIndex in range(len(tasks)):
+        sheetValues = sheets[taskIndex]
+        if(len(sheetValues) == 0):                                # empty sheet, nothing to merge
+            continue
+        if(titles == None):                                       # the first sheet's title row is the merged title row
+            titles = _normalizedTitles(sheetValues[0])
+            titleSource = "sheet " + str(tasks[taskIndex][1]) + " of '" + tasks[taskIndex][0] + "'"
+            values.append(sheetValues[0])
+        elif(_normalizedTitles(sheetValues[0]) != titles):
+            filepath, sheet = tasks[taskIndex][0], tasks[taskIndex][1]
+            raise ValueError("The title row of sheet " + str(sheet) + " of '" + filepath + "' doesn't match the title row of " + titleSource + ": "
+                             + str(_normalizedTitles(sheetValues[0])) + " != " + str(titles))
+        values.extend(sheetValues[1:])
+    return values
+
+# Test Code - uncomment lines below & run for testing
+# if __name__ == '__main__':
+#     spreadsheetArray = get_workbooks_data([ "orderList.xlsx", "orderList.xlsx" ], workers=2)
+#     print(len(spreadsheetArray))
@@ -0,0 +1,321 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: row_stream
+# Functions: write_row_stream(filepath, rows, append=0), iter_row_stream(filepath, schema=None), get_row_stream_data(filepath, schema=None),
+#   write_jsonl_rows(filepath, rows, append=0), iter_jsonl_rows(filepath, schema=None), get_jsonl_data(filepath, schema=None)
+# Parameters:
+#   - A path to a file (.rows for the binary row stream, .jsonl for JSON Lines)
+#   - An array of arrays (or any iterable/generator of row arrays) to write, or optionally a column schema (see 'columnSchema.py') to apply
+#     while reading. With a schema the first row is the title row, the same as read_data_from_csv.get_csv_data().
+#
+# Purpose: Handing rows from one program (or one stage of a run) to the next through excel or csv files means every cell is turned into
+#   text and tokenized again on the way back in, numbers and dates lose their types, and reading excel is slow. These two formats keep the
+#   array of arrays exactly as it was written, so downstream tools can consume results (or a stage can pick up where another left off)
+#   without any excel parsing.
+#
+# Description - binary row stream (.rows): The file starts with the 8 bytes MAGIC, followed by one record per row and an end marker:
+#       row      : varint (number of cells + 1), then each cell
+#       cell     : one tag byte, then the tag's value
+#       end      : varint 0 (a file without its end marker was cut short, and reading it raises a ValueError)
+#   Rows added to an existing file (append=1) are written as another segment after the end marker: MAGIC, the rows, and an end marker. Each
+#   segment numbers its text on its own (see below), so adding rows never reads or rewrites the rows already in the file.
+#   Tags and values:
+#       TAG_NONE (0)                         - no value
+#       TAG_FALSE (1) / TAG_TRUE (2)         - booleans
+#       TAG_INT (3)      zigzag varint       - whole numbers of any size
+#       TAG_FLOAT (4)    8 byte double       - decimal numbers (little endian)
+#       TAG_TEXT (5)     varint length, utf-8 bytes
+#       TAG_TEXT_REF (6) varint index        - the same text as an earlier TAG_TEXT cell (see below)
+#       TAG_DATETIME (7) zigzag varint       - microseconds since 1970-01-01 00:00:00
+#       TAG_DATE (8)     varint              - the date's ordinal (datetime.date.toordinal())
+#   A varint is a whole number written 7 bits per byte, low bits first, with the top bit set on every byte but the last. Zigzag varints
+#   also hold negative numbers (0, -1, 1, -2, ... are written as 0, 1, 2, 3, ...).
+#   Spreadsheets repeat the same short text over and over (states, counties, job types, "Yes"/"No"), so short text is written out in full
+#   only the first time it appears. Every TAG_TEXT cell of at most INTERN_MAX_LENGTH characters is numbered (while fewer than
+#   INTERN_MAX_COUNT have been numbered) and later cells with the same text are written as a TAG_TEXT_REF to that number. The reader numbers
+#   TAG_TEXT cells by the same rule, so no table has to be stored in the file. Any other cell value (for example a timezone aware datetime)
+#   is written as its text, the same as the csv writer does.
+#
+# Description - JSON Lines (.jsonl): the fallback when a tool can't read the binary format. Each line is one row, written as a JSON array.
+#   Dates and datetimes are written as ISO text ("2018-09-04T00:00:00"), which a "date" column schema turns back into datetimes.
+#
+# Both readers stream: iter_row_stream()/iter_jsonl_rows() yield one row at a time, so only the current row is held in memory.
+#
+# Example Usage (put this in calling function):
+#   import row_stream
+#   row_stream.write_row_stream("increases.rows", payload[0])
+#   for rowArray in row_stream.iter_row_stream("increases.rows"):
+#       print(rowArray)
+#
+#########################################################################################################
+import datetime # import datetime module (dates are one of the stored types)
+import json     # import json module, used for JSON Lines
+import struct   # import struct module, used to pack decimal numbers
+import columnSchema # import column schema module (optional typed conversion of cells)
+
+MAGIC = b"ROWSTRM1"          # first 8 bytes of every row stream file (also used by data_formats.py to recognize the format)
+TAG_NONE = 0
+TAG_FALSE = 1
+TAG_TRUE = 2
+TAG_INT = 3
+TAG_FLOAT = 4
+TAG_TEXT = 5
+TAG_TEXT_REF = 6
+TAG_DATETIME = 7
+TAG_DATE = 8
+INTERN_MAX_LENGTH = 64       # only text of at most this many characters is numbered for TAG_TEXT_REF
+INTERN_MAX_COUNT = 65536     # the most text values numbered per file (keeps the table's memory bounded)
+WRITE_BUFFER_SIZE = 1048576  # bytes buffered before each write to disk (1 MB)
+READ_BLOCK_SIZE = 1048576    # bytes read from disk at a time (1 MB)
+
+_DOUBLE = struct.Struct("<d")
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+# Default converter for columns a schema doesn't name: row stream and JSON Lines cells already have their types, so they are returned as is
+def _keepValue(value):
+    return value
+
+# Helper function: append a varint to a buffer
+def _writeVarint(buffer, value):
+    while(value > 0x7F):
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+# Helper function: append a zigzag varint (a whole number that may be negative) to a buffer
+def _writeSignedVarint(buffer, value):
+    if(value >= 0):
+        _writeVarint(buffer, value << 1)
+    else:
+        _writeVarint(buffer, ((-value) << 1) - 1)
+
+# Helper function: read a varint at a position. Returns (value, position after it). Raises an IndexError if the data ends first.
+def _readVarint(data, position):
+    byte = data[position]
+    position += 1
+    if(byte < 0x80):                     # one byte, the common case
+        return byte, position
+    value = byte & 0x7F
+    shift = 7
+    while(True):
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if(byte < 0x80):
+            return value, position
+        shift += 7
+
+# Helper function: read a zigzag varint at a position. Returns (value, position after it).
+def _readSignedVarint(data, position):
+    value, position = _readVarint(data, position)
+    if(value & 1):
+        return -((value + 1) >> 1), position
+    return value >> 1, position
+
+# Helper function: append a text cell, as a reference to an earlier cell with the same text when there is one
+def _writeText(buffer, text, strings):
+    index = strings.get(text)
+    if(index != None):
+        buffer.append(TAG_TEXT_REF)
+        _writeVarint(buffer, index)
+        return
+    encoded = text.encode("utf-8")
+    buffer.append(TAG_TEXT)
+    _writeVarint(buffer, len(encoded))
+    buffer += encoded
+    if(len(text) <= INTERN_MAX_LENGTH and len(strings) < INTERN_MAX_COUNT):
+        strings[text] = len(strings)
+
+# Helper function: append one row to a buffer ('strings' is the text -> number table of the file being written)
+def _encodeRow(buffer, row, strings):
+    _writeVarint(buffer, len(row) + 1)
+    for cell in row:
+        if(cell is None):
+            buffer.append(TAG_NONE)
+        elif(cell is True):
+            buffer.append(TAG_TRUE)
+        elif(cell is False):
+            buffer.append(TAG_FALSE)
+        elif(isinstance(cell, str)):
+            _writeText(buffer, cell, strings)
+        elif(isinstance(cell, int)):
+            buffer.append(TAG_INT)
+            _writeSignedVarint(buffer, int(cell))
+        elif(isinstance(cell, float)):
+            buffer.append(TAG_FLOAT)
+            buffer += _DOUBLE.pack(cell)
+        elif(isinstance(cell, datetime.datetime) and cell.tzinfo == None):
+            delta = cell - _EPOCH
+            buffer.append(TAG_DATETIME)
+            _writeSignedVarint(buffer, (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds)
+        elif(isinstance(cell, datetime.date) and not isinstance(cell, datetime.datetime)):
+            buffer.append(TAG_DATE)
+            _writeVarint(buffer, cell.toordinal())
+        else:                                                     # any other type is written as its text
+            _writeText(buffer, str(cell), strings)
+
+# Helper function: read one row at a position. Returns (row, position after it), or (None, position) at the end marker.
+#   Raises an IndexError or struct.error if the data ends in the middle of the row ('strings' is the number -> text table of the file being read).
+def _decodeRow(data, position, strings):
+    cellCount, position = _readVarint(data, position)
+    if(cellCount == 0):
+        return None, position
+    row = []
+    for cellIndex in range(cellCount - 1):
+        tag = data[position]
+        position += 1
+        if(tag == TAG_TEXT_REF):
+            index, position = _readVarint(data, position)
+            row.append(strings[index])
+        elif(tag == TAG_TEXT):
+            length, position = _readVarint(data, position)
+            end = position + length
+            if(end > len(data)):                                  # a slice wouldn't notice the data ended early
+                raise IndexError("row stream data ended inside a text cell")
+            text = data[position:end].decode("utf-8")
+            position = end
+            if(len(text) <= INTERN_MAX_LENGTH and len(strings) < INTERN_MAX_COUNT):
+                strings.append(text)
+            row.append(text)
+        elif(tag == TAG_INT):
+            value, position = _readSignedVarint(data, position)
+            row.append(value)
+        elif(tag == TAG_NONE):
+            row.append(None)
+        elif(tag == TAG_FLOAT):
+            row.append(_DOUBLE.unpack_from(data, position)[0])
+            position += 8
+        elif(tag == TAG_TRUE):
+            row.append(True)
+        elif(tag == TAG_FALSE):
+            row.append(False)
+        elif(tag == TAG_DATETIME):
+            value, position = _readSignedVarint(data, position)
+            row.append(_EPOCH + datetime.timedelta(microseconds=value))
+        elif(tag == TAG_DATE):
+            value, position = _readVarint(data, position)
+            row.append(datetime.date.fromordinal(value))
+        else:
+            raise ValueError("Unknown row stream cell tag " + str(tag))
+    return row, position
+
+# Helper generator: apply a column schema to rows (the first row is the title row and is passed through as is)
+def _applySchema(rows, schema):
+    if(schema == None):
+        yield from rows
+        return
+    converters = None
+    titleRow = None
+    for rowArray in rows:
+        if(converters == None):
+            titleRow = rowArray
+            converters = schema.compile(titleRow, _keepValue)
+        else:
+            rowArray = columnSchema.convertRow(converters, rowArray, titleRow)
+        yield rowArray
+
+# This function writes every row from an iterable of row arrays to a binary row stream file. append=1 adds the rows to the end of an existing file (as a new segment).
+def write_row_stream(filepath, rows, append=0):
+    strings = {}
+    buffer = bytearray()
+    mode = "wb"
+    if(append == 1):
+        mode = "ab"
+    with open(filepath, mode) as outputFile:
+        outputFile.write(MAGIC)
+        for row in rows:
+            _encodeRow(buffer, row, strings)
+            if(len(buffer) >= WRITE_BUFFER_SIZE):
+                outputFile.write(buffer)
+                buffer = bytearray()
+        _writeVarint(buffer, 0)                                   # end marker
+        outputFile.write(buffer)
+
+# Helper generator: yield the rows of a binary row stream file one at a time
+def _iterRowStream(filepath):
+    with open(filepath, "rb") as inputFile:
+        if(inputFile.read(len(MAGIC)) != MAGIC):
+            raise ValueError("'" + filepath + "' is not a row stream file")
+        strings = []
+        data = inputFile.read(READ_BLOCK_SIZE)
+        position = 0
+        while(True):
+            stringCount = len(strings)
+            try:
+                row, nextPosition = _decodeRow(data, position, strings)
+            except (IndexError, struct.error):                    # the row runs past the data read so far, read the next block and decode the row again
+                del strings[stringCount:]
+                block = inputFile.read(READ_BLOCK_SIZE)
+                if(not block):
+                    raise ValueError("'" + filepath + "' ends in the middle of a row (the file is incomplete)")
+                data = data[position:] + block
+                position = 0
+                continue
+            if(row == None):                                      # end marker, the end of the file or of a segment (another segment starts with MAGIC)
+                data = data[nextPosition:]
+                while(len(data) < len(MAGIC)):
+                    block = inputFile.read(READ_BLOCK_SIZE)
+                    if(not block):
+                        break
+                    data = data + block
+                if(len(data) == 0):
+                    return
+                if(data[:len(MAGIC)] != MAGIC):
+                    raise ValueError("'" + filepath + "' has data after its end marker that isn't a row stream segment")
+                strings = []                                      # every segment numbers its own text
+                position = len(MAGIC)
+                continue
+            position = nextPosition
+            yield row
+
+# This generator yields the rows of a binary row stream file one at a time (optionally converted with a column schema)
+def iter_row_stream(filepath, schema=None):
+    return _applySchema(_iterRowStream(filepath), schema)
+
+# This function returns every row of a binary row stream file as an array of arrays
+def get_row_stream_data(filepath, schema=None):
+    return list(iter_row_stream(filepath, schema))
+
+# Helper function: JSON text for the values json can't write itself (dates become ISO text, anything else its text)
+def _jsonDefault(value):
+    if(isinstance(value, (datetime.datetime, datetime.date))):
+        return value.isoformat()
+    return str(value)
+
+# This function writes every row from an iterable of row arrays to a JSON Lines file (one JSON array per line). append=1 adds the rows to the end of an existing file.
+def write_jsonl_rows(filepath, rows, append=0):
+    mode = "w"
+    if(append == 1):
+        mode = "a"
+    with open(filepath, mode, encoding="utf-8", newline="\n", buffering=WRITE_BUFFER_SIZE) as outputFile:
+        for row in rows:
+            outputFile.write(json.dumps(list(row), ensure_ascii=False, default=_jsonDefault))
+            outputFile.write("\n")
+
+# Helper generator: yield the rows of a JSON Lines file one at a time (blank lines are skipped)
+def _iterJsonlRows(filepath):
+    with open(filepath, encoding="utf-8") as inputFile:
+        lineNumber = 0
+        for line in inputFile:
+            lineNumber += 1
+            if(line.strip() == ""):
+                continue
+            row = json.loads(line)
+            if(not isinstance(row, list)):
+                raise ValueError("Line " + str(lineNumber) + " of '" + filepath + "' is not a JSON array")
+            yield row
+
+# This generator yields the rows of a JSON Lines file one at a time (optionally converted with a column schema)
+def iter_jsonl_rows(filepath, schema=None):
+    return _applySchema(_iterJsonlRows(filepath), schema)
+
+# This function returns every row of a JSON Lines file as an array of arrays
+def get_jsonl_data(filepath, schema=None):
+    return list(iter_jsonl_rows(filepath, schema))
+
+# Test Code - uncomment lines below & run for testing
+# spreadsheet = [ ["Name","Count","Date"], ["r1", 1, datetime.datetime(2018, 9, 4)], ["r2", -20, None], ["r1", 2.5, True] ]
+# write_row_stream("output.rows", spreadsheet)
+# print(get_row_stream_data("output.rows") == spreadsheet)   # True
+# write_jsonl_rows("output.jsonl", spreadsheet)
+# print(get_jsonl_data("output.jsonl", columnSchema.columnSchema({ "Date" : "date" })))
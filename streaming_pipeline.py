@@ -0,0 +1,172 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: streaming_pipeline
+# Function: run_streaming(hash_map_package, orderFile, increasesFile, rushesFile, inputFormat=None, outputFormat=None, batchSize=1000, queueBatches=4)
+# Parameters:
+#   - The fee schedule package (see create_hashMap.py)
+#   - The order file to read, and the increases and rushes report files to write (any format registered in data_formats.py)
+#   - The input and output format names (optional, detected from the files when left as None)
+#   - The number of orders handed between stages at a time, and the most batches each queue between stages holds (optional)
+#
+# Purpose: A normal run reads the whole order list into an array of arrays, copies it into a linked list of dictionaries, and builds both
+#   reports in full before anything is written, so several full copies of the orders are in memory at once. This file runs the same work as a
+#   pipeline instead: orders flow through read -> normalize -> price -> route to report -> write a batch at a time, so memory use doesn't grow
+#   with the number of orders and the first report rows are written while the order file is still being read.
+#
+# Description: The pipeline has four stages connected by bounded queues (a stage waits when the queue in front of it is full, so a fast stage
+#   can never run ahead of a slow one and fill up memory):
+#       reader thread  - streams the order file's rows (data_formats.iter_data()) and queues them in batches of 'batchSize' orders
+#       this thread    - pairs each batch's rows with the title row and prices them (compute_custom_algorithm.run_batch()), then routes the
+#                        batch's increases rows and rushes rows to the queue of their report
+#       2 writer threads - one per report, each writes its report's title row and then its rows as they arrive (data_formats.write_data()
+#                        is handed a generator that drains the queue)
+#   At most about (3 x queueBatches + 3) batches of orders are in memory at any time. If any stage fails the other stages are stopped and the
+#   error is raised here. The reports hold exactly the rows compute_custom_algorithm.run() would return, in the same order.
+#
+# NOTE: The csv, rows and jsonl writers (and the .xlsx writer's constant memory mode) write rows as they arrive. 'xlwt' keeps a whole .xls
+#   workbook in memory until it is saved, and xlrd reads a whole .xls file before returning its first row, so stream with other formats
+#   (such as a csv order export and csv/rows reports) when the order list is too large to hold in memory.
+#
+# Example Usage (put this in calling function):
+#   import streaming_pipeline
+#   summary = streaming_pipeline.run_streaming(hash_map_package, "orders.csv", "increases.csv", "rushes.csv")
+#   print(summary["orders"], "orders priced")
+#
+#########################################################################################################
+import queue     # import queue module, the bounded buffers between stages
+import threading # import threading module, the reader and writer stages run in their own threads
+import compute_custom_algorithm # import the pricing algorithm
+import data_formats             # import format registry (streams the order file, writes the reports)
+
+DEFAULT_BATCH_SIZE = 1000   # orders handed between stages at a time
+DEFAULT_QUEUE_BATCHES = 4   # the most batches waiting in each queue
+POLL_SECONDS = 0.1          # how often a waiting stage checks whether another stage failed
+
+# Helper function: put an item on a queue, waiting while the queue is full. Returns 1 once the item is queued, or 0 if the pipeline was stopped while waiting.
+def _put(itemQueue, item, stopEvent):
+    while(not stopEvent.is_set()):
+        try:
+            itemQueue.put(item, timeout=POLL_SECONDS)
+            return 1
+        except queue.Full:
+            continue
+    return 0
+
+# Helper function: take the next item off a queue, waiting while the queue is empty. Returns None if the pipeline was stopped while waiting.
+def _get(itemQueue, stopEvent):
+    while(not stopEvent.is_set()):
+        try:
+            return itemQueue.get(timeout=POLL_SECONDS)
+        except queue.Empty:
+            continue
+    return None
+
+# Helper function: record a stage's error and stop every other stage
+def _fail(error, errors, stopEvent):
+    errors.append(error)
+    stopEvent.set()
+
+# Reader stage (runs in its own thread): queue the rows in batches, then None to mark the end of the orders
+def _readBatches(rows, batchQueue, batchSize, stopEvent, errors):
+    try:
+        batch = []
+        for rowArray in rows:
+            batch.append(rowArray)
+            if(len(batch) == batchSize):
+                if(_put(batchQueue, batch, stopEvent) == 0):
+                    return
+                batch = []
+        if(len(batch) > 0 and _put(batchQueue, batch, stopEvent) == 0):
+            return
+        _put(batchQueue, None, stopEvent)
+    except BaseException as error:
+        _fail(error, errors, stopEvent)
+
+# Helper generator: yield a report's title row, then the rows of every batch on its queue until the end (None) is reached. reachedEnd[0] is set to 1
+#   once the end is taken off the queue (it stays 0 if the pipeline was stopped, or if the writer stopped pulling rows early).
+def _reportRows(titleRow, rowQueue, stopEvent, reachedEnd):
+    yield titleRow
+    while(True):
+        rows = _get(rowQueue, stopEvent)
+        if(rows == None):
+            if(not stopEvent.is_set()):
+                reachedEnd[0] = 1
+            return
+        yield from rows
+
+# Writer stage (runs in its own thread): write a report as its rows arrive. A writer that returns without writing every row (without raising) would leave
+#   the pricing stage waiting on a full queue forever, so that is treated as a failure too.
+def _writeReport(filepath, titleRow, rowQueue, outputFormat, stopEvent, errors):
+    reachedEnd = [0]
+    try:
+        data_formats.write_data(filepath, _reportRows(titleRow, rowQueue, stopEvent, reachedEnd), outputFormat)
+    except BaseException as error:
+        _fail(error, errors, stopEvent)
+        return
+    if(reachedEnd[0] == 0 and not stopEvent.is_set()):
+        _fail(RuntimeError("The writer for '" + filepath + "' returned before writing every row of the report"), errors, stopEvent)
+
+# This function prices every order in an order file and writes the increases and rushes reports, streaming the orders through the pipeline (see header).
+#   It returns a summary { "orders", "increases", "rushes" } of how many orders were priced and how many rows each report got (title rows not counted).
+def run_streaming(hash_map_package, orderFile, increasesFile, rushesFile, inputFormat=None, outputFormat=None, batchSize=DEFAULT_BATCH_SIZE, queueBatches=DEFAULT_QUEUE_BATCHES):
+    if(batchSize < 1 or queueBatches < 1):
+        raise ValueError("batchSize and queueBatches must be at least 1")
+
+    # The first row of the order file is the title row, every order is paired with it
+    rows = data_formats.iter_data(orderFile, inputFormat)
+    titleRow = next(rows, None)
+
+    summary = { "orders" : 0, "increases" : 0, "rushes" : 0 }
+    errors = []
+    stopEvent = threading.Event()
+    batchQueue = queue.Queue(maxsize=queueBatches)
+    increasesQueue = queue.Queue(maxsize=queueBatches)
+    rushesQueue = queue.Queue(maxsize=queueBatches)
+
+    # Start the writers first, so the report files are created (and their title rows written) straight away
+    reportTitleRows = compute_custom_algorithm.reportTitleRows()
+    writers = [ threading.Thread(target=_writeReport, args=(increasesFile, reportTitleRows[0], increasesQueue, outputFormat, stopEvent, errors)),
+                threading.Thread(target=_writeReport, args=(rushesFile, reportTitleRows[1], rushesQueue, outputFormat, stopEvent, errors)) ]
+    for writer in writers:
+        writer.start()
+
+    reader = None
+    try:
+        if(titleRow != None):                                      # an empty order file has no orders, only the title rows are written
+            reader = threading.Thread(target=_readBatches, args=(rows, batchQueue, batchSize, stopEvent, errors))
+            reader.start()
+
+            # Normalize, price and route every batch as it arrives
+            while(True):
+                batch = _get(batchQueue, stopEvent)
+                if(batch == None):
+                    break
+                batchPayload = compute_custom_algorithm.run_batch(hash_map_package, titleRow, batch)
+                summary["orders"] = summary["orders"] + len(batch)
+                summary["increases"] = summary["increases"] + len(batchPayload[0])
+                summary["rushes"] = summary["rushes"] + len(batchPayload[1])
+                if(len(batchPayload[0]) > 0 and _put(increasesQueue, batchPayload[0], stopEvent) == 0):
+                    break
+                if(len(batchPayload[1]) > 0 and _put(rushesQueue, batchPayload[1], stopEvent) == 0):
+                    break
+    except BaseException as error:
+        _fail(error, errors, stopEvent)
+    finally:
+        # Tell the writers the reports are complete, then wait for every stage to finish
+        _put(increasesQueue, None, stopEvent)
+        _put(rushesQueue, None, stopEvent)
+        for writer in writers:
+            writer.join()
+        if(reader != None):
+            reader.join()
+
+    if(len(errors) > 0):
+        raise errors[0]
+    return summary
+
+# Test Code - uncomment lines below & run for testing (the streamed reports hold the same rows as run()'s payload)
+# import read_data_from_excel, create_hashMap, create_linkedList
+# hash_map_package = create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+# print(run_streaming(hash_map_package, "orderList.xlsx", "increases.csv", "rushes.csv", batchSize=50))
+# payload = compute_custom_algorithm.run(hash_map_package, create_linkedList.prepare_data_structure(read_data_from_excel.get_excel_data("orderList.xlsx")))
+# print(data_formats.read_data("rushes.csv") == [ [ str(cell) for cell in rowArray ] for rowArray in payload[1] ])
@@ -0,0 +1,31 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_columnarOrderTable
+# Usage: python -m pytest test_columnarOrderTable.py
+#
+# Purpose: Checks that a columnar table gives back every cell exactly as it was appended, type included.
+#
+#########################################################################################################
+import columnarOrderTable
+
+# 0, 0.0 and False (and 1, 1.0 and True) are equal in python, but each must keep its own code so its type comes back out
+def test_equal_cells_of_different_types_keep_their_type():
+    table = columnarOrderTable.columnarOrderTable([ "a", "b" ])
+    rows = [ [ 0, True ], [ 0.0, 1 ], [ False, 1.0 ] ]
+    for rowArray in rows:
+        table.appendRow(rowArray)
+    for rowIndex in range(len(rows)):
+        cells = table.getRow(rowIndex).toArray()
+        assert cells == rows[rowIndex]
+        assert [ type(cell) for cell in cells ] == [ type(cell) for cell in rows[rowIndex] ]
+    assert table.getColumn(0) == [ 0, 0.0, False ]
+    assert len(table.getColumnCodes(0)[1]) == 3                     # three distinct (type, value) entries in the column's dictionary
+
+# Repeated cells of the same type still share one code
+def test_repeated_cells_share_a_code():
+    table = columnarOrderTable.columnarOrderTable([ "State" ])
+    for state in [ "AL", "AK", "AL", "AL" ]:
+        table.appendRow([ state ])
+    codes, dictionary = table.getColumnCodes(0)
+    assert list(codes) == [ 0, 1, 0, 0 ]
+    assert dictionary == [ "AL", "AK" ]
@@ -0,0 +1,110 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_compute_custom_algorithm
+# Usage: python -m pytest test_compute_custom_algorithm.py
+#
+# Purpose: Checks that the batch tier function (_calculateTierBatch()) agrees with _calculateTier() on randomized spreadsheet text, and on
+#   values sitting exactly on every threshold, with and without NumPy, and that run_vectorized() returns a payload that pickles byte for byte
+#   the same as run()'s for every order store and fee schedule.
+#
+#########################################################################################################
+import pickle
+import random
+import pytest
+import benchmark_pricing
+import columnSchema
+import compute_custom_algorithm
+import create_columnarTable
+import create_hashMap
+import create_linkedList
+import feeSnapshot
+import read_data_from_excel
+
+SITE_SIZE_EDGES = [ 1.9, 3.9, 8 ]                                              # acres
+SITE_SIZE_SQUARE_FEET_EDGES = [ 82764, 169884, 348480 ]                        # 1.9, 3.9 and 8 acres in square feet
+GLA_EDGES = [ 1999, 2000, 2999, 3000, 4999, 5000 ]
+APPRAISED_VALUE_EDGES = [ 1005000, 1005001, 2005000, 2005001, 4005000, 4005001 ]
+
+# Helper function: a random "Site Size" cell: "N/A"/blank, acres, or square feet (with or without thousands separators)
+def _randomSiteSize(generator):
+    choice = generator.randint(0, 4)
+    if(choice == 0):
+        return generator.choice([ "N/A", "" ])
+    if(choice == 1):
+        return str(generator.choice(SITE_SIZE_EDGES + [ round(generator.uniform(0, 12), 2) ])) + " ac"
+    return "{:,}".format(generator.choice(SITE_SIZE_SQUARE_FEET_EDGES + [ generator.randint(1000, 600000) ])) + generator.choice([ " sf", " sq. ft", " SF" ])
+
+# Helper function: a random "GLA"/"Appraised Value" cell: "N/A"/blank, or a number (often one of the edges) with or without thousands separators
+def _randomWholeNumber(generator, edges, high):
+    if(generator.randint(0, 3) == 0):
+        return generator.choice([ "N/A", "" ])
+    number = generator.choice([ generator.choice(edges), generator.randint(0, high) ])
+    return generator.choice([ "{:,}".format(number), str(number) ])
+
+# Helper function: assert the batch tiers of the cells match _calculateTier()
+def _assertTiersMatch(siteSizes, glas, appraisedValues):
+    batchTiers = compute_custom_algorithm._calculateTierBatch([ compute_custom_algorithm._normalizeSiteSize(cell) for cell in siteSizes ],
+                                                              [ compute_custom_algorithm._normalizeWholeNumber(cell) for cell in glas ],
+                                                              [ compute_custom_algorithm._normalizeWholeNumber(cell) for cell in appraisedValues ])
+    scalarTiers = [ compute_custom_algorithm._calculateTier(siteSizes[i], glas[i], appraisedValues[i]) for i in range(len(siteSizes)) ]
+    assert [ compute_custom_algorithm._codeToTier(code) for code in batchTiers ] == scalarTiers
+
+@pytest.fixture(params=[ "numpy", "no numpy" ])
+def withAndWithoutNumpy(request, monkeypatch):
+    if(request.param == "numpy"):
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(compute_custom_algorithm, "numpy", None)
+
+# Randomized spreadsheet text (fixed seed, so a failure can be reproduced)
+def test_batch_tiers_match_on_random_cells(withAndWithoutNumpy):
+    generator = random.Random(2018)
+    for trial in range(200):
+        count = generator.randint(1, 300)
+        _assertTiersMatch([ _randomSiteSize(generator) for i in range(count) ],
+                          [ _randomWholeNumber(generator, GLA_EDGES, 8000) for i in range(count) ],
+                          [ _randomWholeNumber(generator, APPRAISED_VALUE_EDGES, 6000000) for i in range(count) ])
+
+# Every threshold value of each column, with the other two columns in Tier 1 (a value exactly on a threshold stays in the lower tier)
+def test_batch_tiers_match_on_threshold_edges(withAndWithoutNumpy):
+    siteSizes = [ str(edge) + " ac" for edge in SITE_SIZE_EDGES ] + [ str(edge) + " ac" for edge in [ 1.91, 3.91, 8.01 ] ]
+    siteSizes = siteSizes + [ "{:,}".format(edge) + " sf" for edge in SITE_SIZE_SQUARE_FEET_EDGES ]
+    glas = [ str(edge) for edge in GLA_EDGES ]
+    appraisedValues = [ str(edge) for edge in APPRAISED_VALUE_EDGES ]
+    _assertTiersMatch(siteSizes + [ "N/A" ] * (len(glas) + len(appraisedValues)),
+                      [ "N/A" ] * len(siteSizes) + glas + [ "N/A" ] * len(appraisedValues),
+                      [ "N/A" ] * (len(siteSizes) + len(glas)) + appraisedValues)
+    assert [ compute_custom_algorithm._calculateTier("N/A", gla, "N/A") for gla in glas ] == [ 1, 2, 2, 3, 3, "Q" ]
+    assert [ compute_custom_algorithm._calculateTier("N/A", "N/A", value) for value in appraisedValues ] == [ 1, 2, 2, 3, 3, "Q" ]
+
+@pytest.fixture(scope="module")
+def feeSchedules(tmp_path_factory):
+    feeRows = read_data_from_excel.get_excel_data("productFeesByState.xlsx")
+    snapshotPath = str(tmp_path_factory.mktemp("snapshot") / "fees.snapshot")
+    feeSnapshot.write_snapshot(create_hashMap.prepare_data_structure(feeRows, buildFeeIndex=1).fee_index, snapshotPath)
+    return { "hashMap" : create_hashMap.prepare_data_structure(feeRows),
+             "feeIndex" : create_hashMap.prepare_data_structure(feeRows, buildFeeIndex=1),
+             "snapshot" : create_hashMap.prepare_data_structure_from_snapshot(snapshotPath) }
+
+@pytest.fixture(scope="module")
+def orderLists():
+    return { "text" : read_data_from_excel.get_excel_data("orderList.xlsx"),
+             "typed" : read_data_from_excel.get_excel_data("orderList.xlsx", schema=columnSchema.columnSchema(compute_custom_algorithm.ORDER_SCHEMA)),
+             "synthetic" : benchmark_pricing.make_orders(read_data_from_excel.get_excel_data("orderList.xlsx"), 5000) }
+
+ORDER_STORES = { "linked list" : lambda orders: create_linkedList.prepare_data_structure(orders),
+                 "unrolled list" : lambda orders: create_linkedList.prepare_data_structure(orders, unrolled=1),
+                 "columnar table" : lambda orders: create_columnarTable.prepare_data_structure(orders, compute_custom_algorithm.ORDER_NUMERIC_COLUMNS) }
+
+# run_vectorized() pickles byte for byte the same as run() (same rows, same cell values and types) for every order list, order store and fee schedule
+@pytest.mark.parametrize("feeSchedule", [ "hashMap", "feeIndex", "snapshot" ])
+@pytest.mark.parametrize("orderStore", list(ORDER_STORES))
+@pytest.mark.parametrize("orderList", [ "text", "typed", "synthetic" ])
+def test_run_vectorized_matches_run(feeSchedules, orderLists, feeSchedule, orderStore, orderList):
+    pytest.importorskip("numpy")
+    hash_map_package = feeSchedules[feeSchedule]
+    orders = orderLists[orderList]
+    expected = compute_custom_algorithm.run(hash_map_package, ORDER_STORES[orderStore](orders))
+    payload = compute_custom_algorithm.run_vectorized(hash_map_package, ORDER_STORES[orderStore](orders))
+    assert pickle.dumps(payload) == pickle.dumps(expected)
+    assert len(expected[0]) > 1 and len(expected[1]) > 1
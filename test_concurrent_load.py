@@ -0,0 +1,41 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_concurrent_load
+# Usage: python -m pytest test_concurrent_load.py
+#
+# Purpose: Checks that a fee schedule built in load_inputs()'s worker process finds every key once it is back in this process, when the
+#   worker is started fresh (spawn, the default on Windows and macOS) as well as forked.
+#
+#########################################################################################################
+import os
+import subprocess
+import sys
+import pytest
+
+REPO_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# load_inputs() with each start method, for both hash map engines and with and without a feeIndex (a script is used so the start method
+# isn't changed for the rest of the test run). The branch functions are the module level builders, so the spawned worker can import them.
+LOAD_SCRIPT = """
+import multiprocessing, sys
+import benchmark_pricing, compute_custom_algorithm, concurrent_load, create_hashMap, create_linkedList, read_data_from_excel
+if __name__ == '__main__':
+    multiprocessing.set_start_method(sys.argv[1])
+    feeRows = read_data_from_excel.get_excel_data("productFeesByState.xlsx")
+    orders = benchmark_pricing.make_orders(read_data_from_excel.get_excel_data("orderList.xlsx"), 1000)
+    keys = [ rowArray[0] + rowArray[1] + rowArray[2] for rowArray in feeRows[1:] ]
+    for compact in [ 1, 0 ]:
+        for buildFeeIndex in [ 0, 1 ]:
+            hash_map_package, linked_list_package, timings = concurrent_load.load_inputs((create_hashMap.prepare_data_structure, (feeRows, compact, None, buildFeeIndex)),
+                                                                                         (create_linkedList.prepare_data_structure, (orders,)))
+            assert [ hash_map_package.data_structure.hashMapContains(key) for key in keys ] == [ True ] * len(keys), (compact, buildFeeIndex)
+            expected = compute_custom_algorithm.run(create_hashMap.prepare_data_structure(feeRows, compact, None, buildFeeIndex), create_linkedList.prepare_data_structure(orders))
+            assert compute_custom_algorithm.run(hash_map_package, linked_list_package) == expected, (compact, buildFeeIndex)
+    print("OK")
+"""
+
+@pytest.mark.parametrize("startMethod", [ "spawn", "fork" ])
+def test_fee_schedule_from_worker_process(startMethod):
+    result = subprocess.run([ sys.executable, "-c", LOAD_SCRIPT, startMethod ], cwd=REPO_DIRECTORY, capture_output=True, text=True, timeout=600)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert result.stdout.strip().endswith("OK")
@@ -0,0 +1,85 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_data_formats
+# Usage: python -m pytest test_data_formats.py
+#
+# Purpose: Checks that the format registry writes and reads back every writable format, and that a file it can't write raises a
+#   ValueError instead of being skipped.
+#
+#########################################################################################################
+import os
+import pytest
+import data_formats
+
+ROWS = [ [ "Reference ID #", "State", "Notes" ], [ "1001", "AL", "rural, gated" ], [ "1002", "AK", "" ] ]
+
+# Every writable format reads back the rows it wrote (and is recognized again by its magic bytes or extension)
+@pytest.mark.parametrize("formatName", data_formats.get_format_names(forWriting=1))
+def test_round_trip(tmp_path, formatName):
+    if(formatName == "xlsx"):
+        pytest.importorskip("xlsxwriter")
+    filepath = str(tmp_path / ("rows" + data_formats.FORMATS[formatName]["extensions"][0]))
+    data_formats.write_data(filepath, ROWS, formatName)
+    assert data_formats.detect_format(filepath) == formatName
+    assert data_formats.read_data(filepath) == ROWS
+    assert list(data_formats.iter_data(filepath)) == ROWS
+
+# .xlsm workbooks are read only, writing one raises instead of printing an error and writing nothing
+def test_xlsm_is_not_writable(tmp_path):
+    assert "xlsm" not in data_formats.get_format_names(forWriting=1)
+    filepath = str(tmp_path / "rows.xlsm")
+    with pytest.raises(ValueError):
+        data_formats.write_data(filepath, ROWS)
+    with pytest.raises(ValueError):
+        data_formats.write_data(filepath, ROWS, "xlsx")
+    assert not os.path.exists(filepath)
+
+# A file name that doesn't end in one of its format's extensions is rejected
+def test_wrong_extension_raises(tmp_path):
+    with pytest.raises(ValueError):
+        data_formats.write_data(str(tmp_path / "rows.txt"), ROWS, "csv")
+    with pytest.raises(ValueError):
+        data_formats.write_data(str(tmp_path / "rows.unknown"), ROWS)
+
+# An .xlsm workbook (an .xlsx zip file) is read through its magic bytes
+def test_xlsm_is_readable(tmp_path):
+    pytest.importorskip("xlsxwriter")
+    xlsxPath = str(tmp_path / "rows.xlsx")
+    data_formats.write_data(xlsxPath, ROWS)
+    xlsmPath = str(tmp_path / "rows.xlsm")
+    os.rename(xlsxPath, xlsmPath)
+    assert data_formats.read_data(xlsmPath) == ROWS
+    assert data_formats.read_data(xlsmPath, "xlsm") == ROWS
+
+# append_data() writes a missing file whole and only adds the rows after the title row to an existing one
+@pytest.mark.parametrize("formatName", [ name for name in data_formats.get_format_names(forWriting=1) if data_formats.can_append(name) == 1 ])
+def test_append(tmp_path, formatName):
+    filepath = str(tmp_path / ("rows" + data_formats.FORMATS[formatName]["extensions"][0]))
+    data_formats.append_data(filepath, ROWS[:2])
+    data_formats.append_data(filepath, [ ROWS[0], ROWS[2] ])
+    assert data_formats.read_data(filepath) == ROWS
+
+# The workbooks can't be appended to (reading one back doesn't give the cells it was written with), so an existing workbook is left alone
+@pytest.mark.parametrize("formatName", [ "xls", "xlsx" ])
+def test_append_to_workbook_raises(tmp_path, formatName):
+    if(formatName == "xlsx"):
+        pytest.importorskip("xlsxwriter")
+    assert data_formats.can_append(formatName) == 0
+    filepath = str(tmp_path / ("rows" + data_formats.FORMATS[formatName]["extensions"][0]))
+    data_formats.write_data(filepath, [ [ "Name", "Fee", "Increase %" ], [ "x", 508, 0.2303 ] ])
+    written = open(filepath, "rb").read()
+    with pytest.raises(ValueError):
+        data_formats.append_data(filepath, [ [ "Name", "Fee", "Increase %" ], [ "y", 117, 0.5 ] ])
+    assert open(filepath, "rb").read() == written
+
+# Rows added to a row stream keep their types, and text repeated from an earlier segment is read back correctly
+def test_append_row_stream_keeps_types(tmp_path):
+    filepath = str(tmp_path / "rows.rows")
+    first = [ [ "Name", "Fee", "Increase %", "Rush" ], [ "AL", 508, 0.2303, True ] ]
+    second = [ [ "AL", 117, None, False ], [ "AK", 2 ** 70, -1.5, True ] ]
+    data_formats.write_data(filepath, first)
+    data_formats.append_data(filepath, [ first[0] ] + second)
+    data_formats.append_data(filepath, [ first[0], second[0] ])
+    rows = data_formats.read_data(filepath)
+    assert rows == first + second + [ second[0] ]
+    assert [ [ type(cell) for cell in rowArray ] for rowArray in rows ] == [ [ type(cell) for cell in rowArray ] for rowArray in first + second + [ second[0] ] ]
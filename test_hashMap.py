@@ -0,0 +1,87 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_hashMap
+# Usage: python -m pytest test_hashMap.py
+#
+# Purpose: Checks the selectable hash functions against their published test vectors, that both hash map engines store and find every
+#   fee schedule key whichever hash function they are built with, and that the fused lookups (hashMapGetFirst()/hashMapGetFirstBatch())
+#   return the same key and value as looking the candidates up one at a time.
+#
+#########################################################################################################
+import random
+import pytest
+import hashMap
+import read_data_from_excel
+
+SIPHASH_KEY = bytes(range(16))
+# SipHash-2-4 reference vectors (from the SipHash paper's vectors.h): key 00 01 .. 0f, message 00 01 .. (length - 1), as little endian integers
+SIPHASH_VECTORS = { 0 : 0x726fdb47dd0e0e31, 1 : 0x74f839c593dc67fd, 2 : 0x0d6c8009d9a94f5a, 3 : 0x85676696d7fb7e2d, 4 : 0xcf2794e0277187b7,
+                    5 : 0x18765564cd99a68d, 6 : 0xcbc9466e58fee3ce, 7 : 0xab0200f58b01d137, 8 : 0x93f5f5799a932462, 15 : 0xa129ca6149be45e5,
+                    63 : 0x958a324ceb064572 }
+# FNV-1a 64 bit reference values
+FNV1A_VECTORS = { "" : 0xcbf29ce484222325, "a" : 0xaf63dc4c8601ec8c, "foobar" : 0x85944171f73967e8 }
+ENGINES = [ hashMap.hashMap, hashMap.compactHashMap ]
+
+@pytest.fixture(scope="module")
+def feeRows():
+    return read_data_from_excel.get_excel_data("productFeesByState.xlsx")
+
+@pytest.mark.parametrize("length", sorted(SIPHASH_VECTORS))
+def test_siphash_vectors(length):
+    assert hashMap.sipHash24(bytes(range(length)), SIPHASH_KEY) == SIPHASH_VECTORS[length]
+
+# The default "siphash" function hashes a key's utf-8 bytes with the fixed key, and makeSipHash() binds another key
+def test_siphash_keys():
+    assert hashMap.HASH_FUNCTIONS["siphash"]("AL Jefferson") == hashMap.sipHash24("AL Jefferson".encode("utf-8"), SIPHASH_KEY)
+    assert hashMap.makeSipHash(SIPHASH_KEY)(bytes(range(15))) == SIPHASH_VECTORS[15]
+    assert hashMap.makeSipHash(bytes(16))("AL Jefferson") != hashMap.sipHash("AL Jefferson")
+
+@pytest.mark.parametrize("text", sorted(FNV1A_VECTORS))
+def test_fnv1a_vectors(text):
+    assert hashMap.fnv1aHash(text) == FNV1A_VECTORS[text]
+    assert hashMap.fnv1aHash(text.encode("utf-8")) == FNV1A_VECTORS[text]
+
+def test_unknown_hash_function_raises():
+    for engine in ENGINES:
+        with pytest.raises(ValueError):
+            engine(8, "md5")
+
+# Every engine finds every fee schedule key with every hash function, and its stats account for every key
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("hashFunction", [ "ordinal", "ordinalSquare" ] + list(hashMap.HASH_FUNCTIONS))
+def test_every_key_is_found(feeRows, engine, hashFunction):
+    hash_map = engine.from_rows(feeRows, lambda rowArray: rowArray[0] + rowArray[1] + rowArray[2], hashFunction=hashFunction)
+    keys = set(rowArray[0] + rowArray[1] + rowArray[2] for rowArray in feeRows[1:])
+    for key in keys:
+        assert hash_map.hashMapContains(key)
+    assert not hash_map.hashMapContains("not a territory")
+    stats = hash_map.stats()
+    assert stats["size"] == len(keys)
+    assert stats["average_probes"] >= 1 and stats["longest_chain"] >= 1
+
+# Helper function: the first candidate key found and its value, looked up one key at a time (what run() did before the fused lookup)
+def _getFirstOneAtATime(hash_map, candidateKeys):
+    for key in candidateKeys:
+        if(hash_map.hashMapContains(key)):
+            return (key, hash_map.hashMapGet(key))
+    return (None, 0)
+
+# hashMapGetFirst() and hashMapGetFirstBatch() agree with one-at-a-time lookups on city/county/state candidate lists, found and missing,
+#   including repeated candidate lists within a batch
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("hashFunction", [ None, "fnv1a" ])
+def test_get_first_matches_one_at_a_time(feeRows, engine, hashFunction):
+    hash_map = engine.from_rows(feeRows, lambda rowArray: rowArray[0] + rowArray[1] + rowArray[2], hashFunction=hashFunction)
+    generator = random.Random(2018)
+    territories = [ (rowArray[0], rowArray[1], rowArray[2]) for rowArray in feeRows[1:] ]
+    candidateKeyLists = []
+    for trial in range(500):
+        state, county, city = generator.choice(territories)
+        city = generator.choice([ city, "Nowhere" ])
+        county = generator.choice([ county, "No County" ])
+        candidateKeyLists.append([ state + county + city, state + county, generator.choice([ state, "ZZ" ]) ])
+    candidateKeyLists = candidateKeyLists + candidateKeyLists[:50]
+    expected = [ _getFirstOneAtATime(hash_map, candidateKeys) for candidateKeys in candidateKeyLists ]
+    assert [ hash_map.hashMapGetFirst(candidateKeys) for candidateKeys in candidateKeyLists ] == expected
+    assert hash_map.hashMapGetFirstBatch(candidateKeyLists) == expected
+    assert (None, 0) in expected and any(key != None for key, value in expected)
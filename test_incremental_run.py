@@ -0,0 +1,147 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_incremental_run
+# Usage: python -m pytest test_incremental_run.py
+#
+# Purpose: Checks that incremental mode prices every order on its first run, afterwards only prices the orders that are new (or changed at
+#   or past the watermark), and that after every run its reports hold exactly what run() would return for the export. The reports are
+#   compared cell for cell with reports written from run()'s payload (types included), never through a reader that converts the cells.
+#
+#########################################################################################################
+import os
+import pytest
+import benchmark_pricing
+import compute_custom_algorithm
+import create_hashMap
+import create_linkedList
+import data_formats
+import incremental_run
+import read_data_from_excel
+
+@pytest.fixture(scope="module")
+def feeSchedule():
+    return create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+
+@pytest.fixture(scope="module")
+def orders():
+    return benchmark_pricing.make_orders(read_data_from_excel.get_excel_data("orderList.xlsx"), 1200)   # the first 1000 orders are the first export
+
+# Helper function: the increases and rushes report paths of a test
+def _reportFiles(tmp_path, extension, name=""):
+    return [ str(tmp_path / (name + "increases" + extension)), str(tmp_path / (name + "rushes" + extension)) ]
+
+# Helper function: run incremental mode on an export (an array of arrays, title row first)
+def _runIncremental(feeSchedule, export, tmp_path, extension=".csv", feeScheduleFingerprint="fees"):
+    reportFiles = _reportFiles(tmp_path, extension)
+    return incremental_run.run_incremental(feeSchedule, create_linkedList.prepare_data_structure(export), str(tmp_path / "state.pickle"),
+                                           reportFiles[0], reportFiles[1], feeScheduleFingerprint)
+
+# Helper function: the cells of a report file exactly as they are stored (cell types included)
+def _storedCells(filepath):
+    if(filepath.endswith(".xls")):
+        xlrd = pytest.importorskip("xlrd")
+        workbook = xlrd.open_workbook(filepath)
+        return [ [ (sheet.row_types(rowIndex), sheet.row_values(rowIndex)) for rowIndex in range(sheet.nrows) ] for sheet in workbook.sheets() ]
+    if(filepath.endswith(".xlsx")):
+        openpyxl = pytest.importorskip("openpyxl")
+        workbook = openpyxl.load_workbook(filepath, read_only=True)
+        return [ [ [ (type(cell), cell) for cell in rowArray ] for rowArray in sheet.iter_rows(values_only=True) ] for sheet in workbook.worksheets ]
+    if(filepath.endswith(".rows")):
+        return [ [ (type(cell), cell) for cell in rowArray ] for rowArray in data_formats.read_data(filepath) ]
+    with open(filepath, "rb") as inputFile:                            # csv/jsonl: the text itself
+        return inputFile.read()
+
+# Helper function: assert the reports hold the same cells as reports written from run()'s payload for the export
+def _assertReportsMatchRun(feeSchedule, export, tmp_path, extension):
+    payload = compute_custom_algorithm.run(feeSchedule, create_linkedList.prepare_data_structure(export))
+    expectedFiles = _reportFiles(tmp_path, extension, "expected_")
+    for reportIndex, reportFile in enumerate(_reportFiles(tmp_path, extension)):
+        data_formats.write_data(expectedFiles[reportIndex], payload[reportIndex])
+        assert _storedCells(reportFile) == _storedCells(expectedFiles[reportIndex])
+        assert len(payload[reportIndex]) > 1
+
+# Helper function: the modification times of the reports, state file and journals
+def _fileTimes(tmp_path):
+    return { name : os.stat(str(tmp_path / name)).st_mtime_ns for name in os.listdir(str(tmp_path)) if not name.startswith("expected_") }
+
+# The first run writes both reports, a second run of the same export prices nothing and leaves every file alone
+def test_second_run_leaves_everything_alone(tmp_path, feeSchedule, orders):
+    summary = _runIncremental(feeSchedule, orders[:1001], tmp_path)
+    assert (summary["reports"], summary["priced"], summary["new"]) == ("written", 1000, 1000)
+    _assertReportsMatchRun(feeSchedule, orders[:1001], tmp_path, ".csv")
+
+    savedAt = _fileTimes(tmp_path)
+    summary = _runIncremental(feeSchedule, orders[:1001], tmp_path)
+    assert (summary["reports"], summary["priced"], summary["skipped"]) == ("unchanged", 0, 1000)
+    assert _fileTimes(tmp_path) == savedAt
+
+# New orders are the only ones priced, their rows are appended (csv, jsonl, rows) or the workbooks are written whole from the journal, and
+#   the reports always match run()'s with every cell keeping its type
+@pytest.mark.parametrize("extension, update", [ (".csv", "appended"), (".jsonl", "appended"), (".rows", "appended"), (".xls", "written"), (".xlsx", "written") ])
+def test_new_orders_update_the_reports(tmp_path, feeSchedule, orders, extension, update):
+    if(extension == ".xlsx"):
+        pytest.importorskip("xlsxwriter")
+    _runIncremental(feeSchedule, orders[:501], tmp_path, extension)
+    for export in [ orders[:1001], orders ]:
+        summary = _runIncremental(feeSchedule, export, tmp_path, extension)
+        assert (summary["reports"], summary["priced"], summary["new"], summary["changed"]) == (update, 500 if len(export) == 1001 else 200, 500 if len(export) == 1001 else 200, 0)
+        _assertReportsMatchRun(feeSchedule, export, tmp_path, extension)
+
+# An order changed on the watermark date (or moved past it) is priced again and its old rows are replaced, a change to an order before the
+#   watermark is not picked up
+def test_changed_orders_replace_their_rows(tmp_path, feeSchedule, orders):
+    export = [ list(rowArray) for rowArray in orders[:1001] ]
+    watermark = max(float(rowArray[8]) for rowArray in export[1:])
+    export[1][8] = export[2][8] = str(int(watermark))                  # at least two orders completed on the watermark date
+    summary = _runIncremental(feeSchedule, export, tmp_path)
+    assert summary["watermark"] == watermark
+    atWatermark = [ rowIndex for rowIndex in range(1, len(export)) if float(export[rowIndex][8]) == watermark ]
+    beforeWatermark = [ rowIndex for rowIndex in range(1, len(export)) if float(export[rowIndex][8]) < watermark ]
+
+    priced = [ list(rowArray) for rowArray in export ]                  # the export as incremental mode will have priced it
+    for rowArrays in [ export, priced ]:
+        rowArrays[atWatermark[0]][16] = "1"                             # Fee Charged changed on the watermark date
+        rowArrays[atWatermark[1]][8] = str(watermark + 1)               # completed date moved past the watermark
+    export[beforeWatermark[0]][16] = "1"                                # changed before the watermark (not picked up)
+    summary = _runIncremental(feeSchedule, export, tmp_path)
+    assert (summary["reports"], summary["priced"], summary["changed"], summary["new"], summary["after_watermark"]) == ("written", 2, 2, 0, 1)
+    assert summary["watermark"] == watermark + 1
+    _assertReportsMatchRun(feeSchedule, priced, tmp_path, ".csv")
+
+    summary = _runIncremental(feeSchedule, export, tmp_path)            # the new watermark's orders are remembered
+    assert (summary["reports"], summary["priced"], summary["skipped"]) == ("unchanged", 0, 1000)
+
+    summary = _runIncremental(feeSchedule, export + orders[1001:], tmp_path)   # the rewritten journal is added to again
+    assert (summary["reports"], summary["new"]) == ("appended", 200)
+    _assertReportsMatchRun(feeSchedule, priced + orders[1001:], tmp_path, ".csv")
+
+# Reports that were deleted, or asked for in another format, are written again from the journal without pricing anything
+def test_missing_reports_are_rebuilt(tmp_path, feeSchedule, orders):
+    _runIncremental(feeSchedule, orders[:1001], tmp_path)
+    _runIncremental(feeSchedule, orders, tmp_path)
+    for reportFile in _reportFiles(tmp_path, ".csv"):
+        os.remove(reportFile)
+    summary = _runIncremental(feeSchedule, orders, tmp_path)
+    assert (summary["reports"], summary["priced"]) == ("written", 0)
+    _assertReportsMatchRun(feeSchedule, orders, tmp_path, ".csv")
+
+    summary = _runIncremental(feeSchedule, orders, tmp_path, ".rows")
+    assert (summary["reports"], summary["priced"]) == ("written", 0)
+    _assertReportsMatchRun(feeSchedule, orders, tmp_path, ".rows")
+
+# A journal left longer than the state file says (a run interrupted before it saved its state) is cut back before new rows are added
+def test_interrupted_run_is_ignored(tmp_path, feeSchedule, orders):
+    _runIncremental(feeSchedule, orders[:1001], tmp_path)
+    journalFiles = [ name for name in os.listdir(str(tmp_path)) if ".journal" in name ]
+    with open(str(tmp_path / journalFiles[0]), "ab") as journalFile:
+        journalFile.write(b"\x80\x05 half a pickle")
+    summary = _runIncremental(feeSchedule, orders, tmp_path, ".xls")    # a new format, so the reports are written from the journal
+    assert (summary["reports"], summary["new"]) == ("written", 200)
+    _assertReportsMatchRun(feeSchedule, orders, tmp_path, ".xls")
+
+# A different fee schedule throws the state away, prices every order again and writes the reports whole
+def test_new_fee_schedule_prices_every_order(tmp_path, feeSchedule, orders):
+    _runIncremental(feeSchedule, orders[:1001], tmp_path)
+    summary = _runIncremental(feeSchedule, orders, tmp_path, ".csv", "new fees")
+    assert (summary["reports"], summary["priced"]) == ("written", 1200)
+    _assertReportsMatchRun(feeSchedule, orders, tmp_path, ".csv")
@@ -0,0 +1,70 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_parallel_run
+# Usage: python -m pytest test_parallel_run.py
+#
+# Purpose: Checks that a fee schedule sent to a process started fresh (spawn, the default on Windows and macOS) still finds every key, and
+#   that run_parallel() gives the same payload as run() when its workers are spawned.
+#
+#########################################################################################################
+import concurrent.futures
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import pytest
+import create_hashMap
+import read_data_from_excel
+
+REPO_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+# run_parallel() under spawn, for both shard types and with and without a feeIndex (a script is used so the start method isn't changed for
+# the rest of the test run)
+SPAWN_SCRIPT = """
+import multiprocessing
+import benchmark_pricing, compute_custom_algorithm, create_hashMap, create_linkedList, parallel_run, read_data_from_excel
+if __name__ == '__main__':
+    multiprocessing.set_start_method("spawn")
+    feeRows = read_data_from_excel.get_excel_data("productFeesByState.xlsx")
+    orders = benchmark_pricing.make_orders(read_data_from_excel.get_excel_data("orderList.xlsx"), 2000)
+    for buildFeeIndex in [ 0, 1 ]:
+        hash_map_package = create_hashMap.prepare_data_structure(feeRows, buildFeeIndex=buildFeeIndex)
+        expected = compute_custom_algorithm.run(hash_map_package, create_linkedList.prepare_data_structure(orders))
+        for shardBy in [ "range", "state" ]:
+            payload = parallel_run.run_parallel(hash_map_package, create_linkedList.prepare_data_structure(orders), workers=2, shardBy=shardBy)
+            assert payload == expected, (buildFeeIndex, shardBy)
+    print("OK")
+"""
+
+@pytest.fixture(scope="module")
+def feeRows():
+    return read_data_from_excel.get_excel_data(os.path.join(REPO_DIRECTORY, "productFeesByState.xlsx"))
+
+# Helper function (runs in the spawned process): look up every key of the hash map it was sent
+def _lookUpKeys(hash_map, keys):
+    return [ hash_map.hashMapGet(key) for key in keys ]
+
+# Every engine and hash function finds its keys after the map is sent to a spawned process (the builtin hash differs between processes)
+@pytest.mark.parametrize("compact, hashFunction", [ (1, None), (1, "builtin"), (1, "siphash"), (1, "ordinal"), (0, None), (0, "builtin"), (0, "fnv1a") ])
+def test_hash_map_survives_spawn(feeRows, compact, hashFunction):
+    hash_map = create_hashMap.prepare_data_structure(feeRows, compact, hashFunction).data_structure
+    keys = [ rowArray[0] + rowArray[1] + rowArray[2] for rowArray in feeRows[1:] ]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+        values = executor.submit(_lookUpKeys, hash_map, keys).result()
+    assert values == [ hash_map.hashMapGet(key) for key in keys ]
+    assert None not in values
+
+# A map that is pickled and loaded again keeps its size, capacity and hash function
+def test_hash_map_pickle_round_trip(feeRows):
+    hash_map = create_hashMap.prepare_data_structure(feeRows, 1, "ordinalSquare").data_structure
+    loaded = pickle.loads(pickle.dumps(hash_map))
+    assert (loaded.size, loaded.capacity) == (hash_map.size, hash_map.capacity)
+    assert loaded.hashFunction == loaded.hashFunction2
+    assert loaded.stats() == hash_map.stats()
+
+# run_parallel() with spawned workers gives the same payload as run() (see SPAWN_SCRIPT)
+def test_run_parallel_under_spawn():
+    result = subprocess.run([ sys.executable, "-c", SPAWN_SCRIPT ], cwd=REPO_DIRECTORY, capture_output=True, text=True, timeout=600)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("OK")
@@ -0,0 +1,83 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: test_streaming_pipeline
+# Usage: python -m pytest test_streaming_pipeline.py
+#
+# Purpose: Checks that the streaming pipeline writes byte-identical reports to a normal run, and that a failing (or quietly quitting)
+#   stage stops the pipeline with an error instead of leaving it waiting forever.
+#
+#########################################################################################################
+import threading
+import pytest
+import benchmark_pricing
+import compute_custom_algorithm
+import create_hashMap
+import create_linkedList
+import data_formats
+import read_data_from_excel
+import streaming_pipeline
+
+PIPELINE_TIMEOUT = 60 # seconds a pipeline gets to finish (or fail) before the test calls it hung
+
+@pytest.fixture(scope="module")
+def feeSchedule():
+    return create_hashMap.prepare_data_structure(read_data_from_excel.get_excel_data("productFeesByState.xlsx"), buildFeeIndex=1)
+
+@pytest.fixture(scope="module")
+def orders():
+    return benchmark_pricing.make_orders(read_data_from_excel.get_excel_data("orderList.xlsx"), 3000)
+
+# Helper function: run the pipeline in a thread and return its summary, or raise the error it raised. Fails the test if it doesn't finish in time.
+def _runWithTimeout(*arguments, **options):
+    result = {}
+    def target():
+        try : result["summary"] = streaming_pipeline.run_streaming(*arguments, **options)
+        except BaseException as error : result["error"] = error
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(PIPELINE_TIMEOUT)
+    assert not thread.is_alive(), "the pipeline hung"
+    if("error" in result):
+        raise result["error"]
+    return result["summary"]
+
+# The streamed reports are byte-identical to writing run()'s payload with the same writer
+@pytest.mark.parametrize("extension", [ ".csv", ".rows", ".jsonl" ])
+def test_reports_match_run(tmp_path, feeSchedule, orders, extension):
+    orderFile = str(tmp_path / "orders.rows")
+    data_formats.write_data(orderFile, orders)
+    summary = _runWithTimeout(feeSchedule, orderFile, str(tmp_path / ("increases" + extension)), str(tmp_path / ("rushes" + extension)), batchSize=64, queueBatches=2)
+
+    payload = compute_custom_algorithm.run(feeSchedule, create_linkedList.prepare_data_structure(orders))
+    data_formats.write_data(str(tmp_path / ("expected_increases" + extension)), payload[0])
+    data_formats.write_data(str(tmp_path / ("expected_rushes" + extension)), payload[1])
+    for name in [ "increases", "rushes" ]:
+        assert (tmp_path / (name + extension)).read_bytes() == (tmp_path / ("expected_" + name + extension)).read_bytes()
+    assert summary == { "orders" : len(orders) - 1, "increases" : len(payload[0]) - 1, "rushes" : len(payload[1]) - 1 }
+
+# A report file that can't be written raises instead of hanging
+def test_unwritable_report_raises(tmp_path, feeSchedule, orders):
+    orderFile = str(tmp_path / "orders.rows")
+    data_formats.write_data(orderFile, orders)
+    with pytest.raises(ValueError):
+        _runWithTimeout(feeSchedule, orderFile, str(tmp_path / "increases.xlsm"), str(tmp_path / "rushes.csv"), batchSize=5, queueBatches=2)
+
+# A writer that returns without reading its rows (and without raising) stops the pipeline with an error instead of hanging
+def test_writer_that_quits_early_raises(tmp_path, feeSchedule, orders):
+    orderFile = str(tmp_path / "orders.rows")
+    data_formats.write_data(orderFile, orders)
+    data_formats.register_format("quitter", (".quit",), writer=lambda filepath, rows: None)
+    try:
+        with pytest.raises(RuntimeError):
+            _runWithTimeout(feeSchedule, orderFile, str(tmp_path / "increases.quit"), str(tmp_path / "rushes.csv"), batchSize=5, queueBatches=2)
+    finally:
+        del data_formats.FORMATS["quitter"]
+
+# An order whose territory isn't in the fee schedule stops the pipeline with the same exit run() makes
+def test_pricing_error_is_raised(tmp_path, feeSchedule, orders):
+    badOrders = [ list(rowArray) for rowArray in orders[:200] ]
+    badOrders[150][4] = "ZZ"
+    orderFile = str(tmp_path / "orders.csv")
+    data_formats.write_data(orderFile, badOrders)
+    with pytest.raises(SystemExit):
+        _runWithTimeout(feeSchedule, orderFile, str(tmp_path / "increases.csv"), str(tmp_path / "rushes.csv"), batchSize=7, queueBatches=1)
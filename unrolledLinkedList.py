@@ -0,0 +1,279 @@
+#########################################################################################################
+# Author: Timothy Fye
+# Title: unrolledLinkedList
+#
+# Overview: An unrolled linked list is a linked list where each node (called a block here) holds many items instead
+#   of just one. The blocks are doubly linked together exactly like the nodes in 'doublyLinkedList.py', but since one
+#   block holds up to 'blockSize' items there are far fewer node objects and pointers. Visualization with a block size of 4:
+#
+#     None <- [item, item, item, item] -> <- [item, item, item, item] -> <- [item, item] -> None
+#             ^                                                             ^
+#           frontPtr                                                      backPtr
+#
+#   In the doubly linked list every pushed order costs a linkedListNode with its own pointer variables on top of the order's data.
+#   At hundreds of thousands of orders that overhead dominates memory. Here the per-order cost is one slot in a block's item array,
+#   and the block/pointer overhead is shared by 'blockSize' orders. Blocks use __slots__ so they do not carry a __dict__ either.
+#
+# Description: This class is a drop-in alternative to doublyLinkedList with the same API: push(), popFront(), popBack(), popCurrent(),
+#   getNext(), getPrevious(), getFront(), getBack(), getLength(), printList(), plus len(), 'for data in list:' and reversed(). The
+#   current position is a (block, index) pair instead of a node pointer, but it behaves the same way: a newly filled list starts
+#   "before" the first item so the first getNext() returns the first item, getNext() returns None at the back (and stays there),
+#   getPrevious() returns None at the front, and popCurrent() removes the item getNext()/getPrevious() last returned and moves the
+#   current position to the item after it. getMemoryFootprint() reports the structure's memory use so it can be compared with
+#   doublyLinkedList.getMemoryFootprint().
+#
+#########################################################################################################
+import sys # import sys module, used to measure memory footprint
+
+##########################################################################################################
+# unrolledListBlock class: This class is purposed for containing up to 'blockSize' data variables, plus the
+#   pointers to the next and previous blocks. __slots__ keeps the block from allocating a per-object __dict__.
+##########################################################################################################
+class unrolledListBlock:
+    __slots__ = ("items", "nextPtr", "previousPtr")
+
+    # Constructor function to hold & set the class' local variables
+    def __init__(self):
+        self.items = []            # the data variables held by this block, in list order
+        self.nextPtr = None        # next pointer for the block, initialized to null
+        self.previousPtr = None    # previous pointer for the block, initialized to null
+
+########################################################################################################
+# unrolledLinkedList class: This class is the container for the entire unrolled linked list data structure
+########################################################################################################
+class unrolledLinkedList:
+    # -> Constructor to initialize class' local variables
+    def __init__(self, blockSize=64):
+        self.blockSize = blockSize    # the maximum number of items held by one block
+        self.frontPtr = None          # front pointer (always points to the first block in the list)
+        self.backPtr = None           # back pointer (always points to the last block in the list)
+        self.currentBlock = None      # block holding the current item, None means the list is positioned "before" the first item
+        self.currentIndex = -1        # index of the current item within self.currentBlock
+        self.length = 0               # number of items in the list
+
+    # -> push Function:
+    # - Add an item to the back of the list. A new block is only created when the back block is full.
+    def push(self, data):
+        if(self.backPtr == None):                         # the list is empty, create the first block
+            block = unrolledListBlock()
+            self.frontPtr = block
+            self.backPtr = block
+            self.currentBlock = None                      # start "before" the first item so getNext() returns it first
+            self.currentIndex = -1
+        elif(len(self.backPtr.items) >= self.blockSize):  # the back block is full, link a new block after it
+            block = unrolledListBlock()
+            block.previousPtr = self.backPtr
+            self.backPtr.nextPtr = block
+            self.backPtr = block
+        self.backPtr.items.append(data)
+        self.length = self.length + 1
+
+    # -> extend Function:
+    # - Add every item of an iterable to the back of the list, in order (a bulk version of push() that fills whole blocks at a time)
+    def extend(self, iterable):
+        for data in iterable:
+            block = self.backPtr
+            if(block == None or len(block.items) >= self.blockSize):
+                self.push(data)                           # push() links a new block (and resets the position on an empty list)
+            else:
+                block.items.append(data)
+                self.length = self.length + 1
+
+    # -> from_iterable Function (bulk constructor):
+    # - Return a new list holding every item of an iterable, in order
+    @classmethod
+    def from_iterable(cls, iterable, blockSize=64):
+        linked_list = cls(blockSize)
+        linked_list.extend(iterable)
+        return linked_list
+
+    # -> _unlinkBlock Function (internal):
+    # - Remove an empty block from the chain of blocks and re-adjust the pointers accordingly
+    def _unlinkBlock(self, block):
+        if(block.previousPtr != None):
+            block.previousPtr.nextPtr = block.nextPtr
+        else:
+            self.frontPtr = block.nextPtr
+        if(block.nextPtr != None):
+            block.nextPtr.previousPtr = block.previousPtr
+        else:
+            self.backPtr = block.previousPtr
+        block.nextPtr = None
+        block.previousPtr = None
+
+    # -> _clear Function (internal): empty the list
+    def _clear(self):
+        self.frontPtr = None
+        self.backPtr = None
+        self.currentBlock = None
+        self.currentIndex = -1
+        self.length = 0
+
+    # -> popFront Function:
+    # - Remove the front-most item. If the current position was on it, the current position moves to the new front item.
+    def popFront(self):
+        if(self.frontPtr == None):
+            return
+        if(self.length == 1):
+            self._clear()
+            return
+        block = self.frontPtr
+        wasCurrent = (self.currentBlock == block and self.currentIndex == 0)
+        del block.items[0]
+        self.length = self.length - 1
+        if(self.currentBlock == block and self.currentIndex > 0):  # the current item shifted one slot to the left
+            self.currentIndex = self.currentIndex - 1
+        if(len(block.items) == 0):
+            self._unlinkBlock(block)
+        if(wasCurrent):
+            self.currentBlock = self.frontPtr
+            self.currentIndex = 0
+
+    # -> popBack Function:
+    # - Remove the back-most item. If the current position was on it, the current position moves to the new back item.
+    def popBack(self):
+        if(self.backPtr == None):
+            return
+        if(self.length == 1):
+            self._clear()
+            return
+        block = self.backPtr
+        wasCurrent = (self.currentBlock == block and self.currentIndex == len(block.items) - 1)
+        block.items.pop()
+        self.length = self.length - 1
+        if(len(block.items) == 0):
+            self._unlinkBlock(block)
+        if(wasCurrent):
+            self.currentBlock = self.backPtr
+            self.currentIndex = len(self.backPtr.items) - 1
+
+    # -> popCurrent Function:
+    # - Remove the current item. The current position moves to the item after it (or to the new front/back item, same as popFront()/popBack()).
+    def popCurrent(self):
+        if(self.frontPtr == None or self.currentBlock == None):
+            return
+        if(self.length == 1):
+            self._clear()
+            return
+        block = self.currentBlock
+        index = self.currentIndex
+        if(block == self.frontPtr and index == 0):                       # the current item is the front item
+            self.popFront()
+        elif(block == self.backPtr and index == len(block.items) - 1):   # the current item is the back item
+            self.popBack()
+        else:                                                            # the current item is somewhere in the middle of the list
+            del block.items[index]
+            self.length = self.length - 1
+            if(index >= len(block.items)):                               # it was the last item in its block, move to the next block's first item
+                nextBlock = block.nextPtr
+                if(len(block.items) == 0):
+                    self._unlinkBlock(block)
+                self.currentBlock = nextBlock
+                self.currentIndex = 0
+            # otherwise the next item slid into the current index, so the current position already points at it
+
+    # -> getNext Function:
+    # Return the next item in the list, or None at the back of the list (the current position stays on the back item)
+    def getNext(self):
+        block = self.currentBlock
+        if(block == None):                                  # "before" the first item
+            if(self.frontPtr == None):
+                return None
+            self.currentBlock = self.frontPtr
+            self.currentIndex = 0
+            return self.frontPtr.items[0]
+        if(self.currentIndex + 1 < len(block.items)):       # the next item is in the same block
+            self.currentIndex = self.currentIndex + 1
+            return block.items[self.currentIndex]
+        if(block.nextPtr != None):                          # the next item is the first item of the next block
+            self.currentBlock = block.nextPtr
+            self.currentIndex = 0
+            return self.currentBlock.items[0]
+        return None
+
+    # -> getPrevious Function:
+    # Return the previous item in the list, or None at the front of the list
+    def getPrevious(self):
+        block = self.currentBlock
+        if(block == None):
+            return None
+        if(self.currentIndex > 0):                          # the previous item is in the same block
+            self.currentIndex = self.currentIndex - 1
+            return block.items[self.currentIndex]
+        if(block.previousPtr != None):                      # the previous item is the last item of the previous block
+            self.currentBlock = block.previousPtr
+            self.currentIndex = len(self.currentBlock.items) - 1
+            return self.currentBlock.items[self.currentIndex]
+        return None
+
+    # -> getFront Function:
+    # Return the front item in the list (** NOTE: THIS RESETS THE CURRENT POSITION TO THE FRONT **)
+    def getFront(self):
+        if(self.frontPtr == None):
+            return None
+        self.currentBlock = self.frontPtr
+        self.currentIndex = 0
+        return self.frontPtr.items[0]
+
+    # -> getBack Function:
+    # Return the back item in the list (** NOTE: THIS RESETS THE CURRENT POSITION TO THE BACK **)
+    def getBack(self):
+        if(self.backPtr == None):
+            return None
+        self.currentBlock = self.backPtr
+        self.currentIndex = len(self.backPtr.items) - 1
+        return self.backPtr.items[self.currentIndex]
+
+    # -> getLength Function: return the number of items in the list
+    def getLength(self):
+        return self.length
+
+    # -> Python length protocol: len(list) is the same as getLength()
+    def __len__(self):
+        return self.length
+
+    # -> Python iteration protocol: 'for data in list:' walks the list front to back without moving the current position
+    def __iter__(self):
+        block = self.frontPtr
+        while(block != None):
+            for data in block.items:
+                yield data
+            block = block.nextPtr
+
+    # -> Python reverse iteration protocol: 'for data in reversed(list):' walks the list back to front without moving the current position
+    def __reversed__(self):
+        block = self.backPtr
+        while(block != None):
+            for data in reversed(block.items):
+                yield data
+            block = block.previousPtr
+
+    # -> printList Function:
+    # Traverse the list & print
+    def printList(self):
+        for data in self:
+            print(data)
+
+    # -> getMemoryFootprint Function:
+    # Return the number of bytes used by the list structure itself (the list object, its blocks and their item arrays). If includeData is 1
+    # the shallow size of every stored data variable is added as well (for a dictionary this is the dictionary object, not the strings in it).
+    def getMemoryFootprint(self, includeData=0):
+        total = sys.getsizeof(self) + sys.getsizeof(self.__dict__)
+        block = self.frontPtr
+        while(block != None):
+            total = total + sys.getsizeof(block) + sys.getsizeof(block.items)
+            if(includeData == 1):
+                for data in block.items:
+                    total = total + sys.getsizeof(data)
+            block = block.nextPtr
+        return total
+
+## Test Code - uncomment lines below & run for testing (compare the memory used by the two list backends)
+# import doublyLinkedList
+# unrolled = unrolledLinkedList()
+# doubly = doublyLinkedList.doublyLinkedList()
+# for orderNumber in range(100000):
+#     unrolled.push(orderNumber)
+#     doubly.push(orderNumber)
+# print("unrolledLinkedList bytes:", unrolled.getMemoryFootprint())
+# print("doublyLinkedList bytes:  ", doubly.getMemoryFootprint())
@@ -1,69 +1,201 @@
-#########################################################################################################
-# Author: Timothy Fye
-# Title: write_data_to_excel
-# Function: push_excel_data(filepath, payload)
-# Parameters: 
-#   - A path to a file (if file is in same directory as source code simply put in name of file) 
-#     - *** filepath must include extentions .xls - Example: "output.xls" or "../dir/output.xls" NOT "output" or "..dir/output" ***
-#   - An array of arrays containing spreadsheet data 
-#
-# Purpose: This function allows me to write data to an excel file regardless of column size or row 
-#   length. This function is a black box. I call it and feed it a file name in addition to an array of arrays. 
-#   The method takes the array of arrays, creates/opens a new file with the name provided, and feeds the array
-#   data into the file. This function can be reused for all projects, aids in keeping duties encapsulated within 
-#   their own methods, and mitigates the amount of code that has to be modified everytime I need to start a new project.
-#
-# Description: This function creates/opens an excel file and writes data contained into the spreadsheet from parameter
-#   consisting of an array of arrays. The input array of arrays needs to be in the syntax below. Notice that the 
-#   cell values of each row are contained in each sub-array. Anotherwards, the outer array contains arrays of rows,
-#   which contains cell values from the left most column to the right most column. Example for visualization: 
-#
-#       [ 
-#           [(row 1, column 1), (row 1, column 2), (row 1, column 3),...(row 1, column n)],  
-#           [(row 2, column 1), (row 2, column 2), (row 2, column 3),...(row 2, column n)],
-#           ............................................................                  ,
-#           [(row n, column 1), (row n, column 2), (row n, column 3),...(row n, column n)]
-#       ]    
-#
-# References: https://www.programering.com/a/MTMyQDNwATU.html (styling and adding formulas is possible)
-#
-# NOTE: 'xlwt' module may need to be installed for this function to work. See instructions in line below.
-#   - There are a few different modules to write different excel types - https://stackoverflow.com/questions/16560289/using-python-write-an-excel-file-with-columns-copied-from-another-excel-file
-#
-# NOTE: Currently I have built this to accept an array of array payload. It may be beneifical to update this program to 
-#       accept JSON input instead as this is more standardized than defining specific array syntax. Or perhaps 
-#       update program to include a parameter flag to indiciate the type of payload being passed in so it can handle
-#       both.
-#########################################################################################################
-import xlwt # import excel read module ---> [ *** Note: You may need to open the command line in the directory you are running this executable and install excel module with command 'pip install xlwt' *** ]
-
-# This function is responsible for creating/opening excel file, writing data to it, and closing the file. Note: "filepath" must include extention .xls
-def push_excel_data(filepath, payload):
-
-    # Check to ensure appropraite extention is included (only .xls is supported by 'xlwt' module - need to use 'xlsxwriter' or 'openpyxl' modules for .xlsx)
-    if ( filepath.find('.xlsx') != -1 or filepath.find('.xls') == -1):
-        print("Error: file parameter must have .xls extention. Example 'output.xls' ")
-        return 
-
-    # Set varible to file name w/ extention    
-    outputFile = filepath
-
-    # XLS: create a file for writing 
-    workbook = xlwt.Workbook(encoding = 'ascii')   # Create a new workbook
-    worksheet = workbook.add_sheet('Sheet 1')      # Add a sheet to the workbook
-    
-    # Write data from array into spreadsheet
-    rowIndex = 0                                            # Initialize row index to zero, this will be incremented as we step through sub-arrays in outer array
-    for row in payload:                                     # For each row in the payload array (aka outer array)...               
-        columnIndex = 0                                     # Initialize a column index to zero, this will be incremented as we step through current sub-array (aka current row)                    
-        for cell in row:                                    # For each item in the row array (aka cell)...
-            worksheet.write(rowIndex, columnIndex, cell)    # Write data relative the appropriate row and column index
-            columnIndex += 1                                # Increment the column index so we move to next column and prepare to write to next cell during next pass
-        rowIndex += 1                                       # Increment the row index so we move to next line as we prepare to write next row
-
-    # Save file for persistence of changes
-    workbook.save(outputFile)
-
-# Test Code - unccomment lines below & run for testing
-# spreadsheet = [ ["r1-c1","r1-c2","r1-c3"], ["r2-c1","r2-c2","r2-c3"], ["r3-c1","r3-c2","r3-c3"] ]
-# push_excel_data("output.xls",spreadsheet) 
\ No newline at end of file
+#########################################################################################################
+# Author: Timothy Fye
+# Title: write_data_to_excel
+# Functions: push_excel_data(filepath, payload), write_xlsx_rows(filepath, rows, columnFormats=None, sheetName="Sheet", titleRow=1)
+# Parameters: 
+#   - A path to a file (if file is in same directory as source code simply put in name of file) 
+#     - *** filepath must include extentions .xls or .xlsx - Example: "output.xls" or "../dir/output.xlsx" NOT "output" or "..dir/output" ***
+#   - An array of arrays containing spreadsheet data (or, for write_xlsx_rows(), any iterable/generator of row arrays)
+#
+# Purpose: This function allows me to write data to an excel file regardless of column size or row 
+#   length. This function is a black box. I call it and feed it a file name in addition to an array of arrays. 
+#   The method takes the array of arrays, creates/opens a new file with the name provided, and feeds the array
+#   data into the file. This function can be reused for all projects, aids in keeping duties encapsulated within 
+#   their own methods, and mitigates the amount of code that has to be modified everytime I need to start a new project.
+#
+# Description: This function creates/opens an excel file and writes data contained into the spreadsheet from parameter
+#   consisting of an array of arrays. The input array of arrays needs to be in the syntax below. Notice that the 
+#   cell values of each row are contained in each sub-array. Anotherwards, the outer array contains arrays of rows,
+#   which contains cell values from the left most column to the right most column. Example for visualization: 
+#
+#       [ 
+#           [(row 1, column 1), (row 1, column 2), (row 1, column 3),...(row 1, column n)],  
+#           [(row 2, column 1), (row 2, column 2), (row 2, column 3),...(row 2, column n)],
+#           ............................................................                  ,
+#           [(row n, column 1), (row n, column 2), (row n, column 3),...(row n, column n)]
+#       ]    
+#
+# .xlsx files: .xls files (written with 'xlwt') are limited to 65,536 rows per sheet and the whole payload is written cell by cell. For .xlsx
+#   filepaths push_excel_data() uses write_xlsx_rows() instead, which writes with 'xlsxwriter' in constant memory mode: each row is written to
+#   disk as soon as the next one starts, so rows can be streamed from a generator and memory use doesn't grow with the size of the report. When
+#   a sheet reaches the .xlsx row limit (1,048,576 rows) the writer rolls over to a new sheet ("Sheet", "Sheet (2)", "Sheet (3)", ...) and
+#   repeats the title row at the top of it. An optional column format spec sets the type and number format of columns, for example:
+#
+#       columnFormats = { "Increase Percentage" : "0.00%",                                   # a number format string
+#                         11 : { "type" : "number", "num_format" : "$#,##0" },              # convert numeric text to numbers, format as currency
+#                         "Zip" : { "type" : "string" },                                    # always write as text
+#                         "First Completed" : { "type" : "date", "num_format" : "mm/dd/yyyy" } }
+#
+#   Columns are named by index or by title (the first row). The "type" is "number" (numeric text is written as a number), "string" (every cell is
+#   written as text) or "date" (datetimes and excel serial numbers are shown as dates). Every other key is an xlsxwriter format property.
+#
+# References: https://www.programering.com/a/MTMyQDNwATU.html (styling and adding formulas is possible)
+#
+# NOTE: 'xlwt' module may need to be installed for this function to work. See instructions in line below. 'xlsxwriter' is needed for .xlsx files.
+#   - There are a few different modules to write different excel types - https://stackoverflow.com/questions/16560289/using-python-write-an-excel-file-with-columns-copied-from-another-excel-file
+#
+# NOTE: Currently I have built this to accept an array of array payload. It may be beneifical to update this program to 
+#       accept JSON input instead as this is more standardized than defining specific array syntax. Or perhaps 
+#       update program to include a parameter flag to indiciate the type of payload being passed in so it can handle
+#       both.
+#########################################################################################################
+import xlwt # import excel read module ---> [ *** Note: You may need to open the command line in the directory you are running this executable and install excel module with command 'pip install xlwt' *** ]
+try : import xlsxwriter # import .xlsx write module (optional) ---> [ *** Note: install with command 'pip install xlsxwriter' *** ]
+except ImportError : xlsxwriter = None
+
+XLSX_MAX_ROWS = 1048576 # the most rows an .xlsx sheet can hold
+
+# This function is responsible for creating/opening excel file, writing data to it, and closing the file. Note: "filepath" must include extention .xls (or .xlsx, see write_xlsx_rows())
+def push_excel_data(filepath, payload):
+
+    # .xlsx files are written by the streaming .xlsx writer below
+    if (filepath.lower().endswith('.xlsx')):
+        write_xlsx_rows(filepath, payload)
+        return
+
+    # Check to ensure appropraite extention is included (only .xls is supported by 'xlwt' module - .xlsx is written by write_xlsx_rows())
+    if ( filepath.find('.xlsx') != -1 or filepath.find('.xls') == -1):
+        raise ValueError("File parameter must have .xls or .xlsx extention. Example 'output.xls', got '" + filepath + "'")
+
+    # Set varible to file name w/ extention    
+    outputFile = filepath
+
+    # XLS: create a file for writing 
+    workbook = xlwt.Workbook(encoding = 'ascii')   # Create a new workbook
+    worksheet = workbook.add_sheet('Sheet 1')      # Add a sheet to the workbook
+    
+    # Write data from array into spreadsheet
+    rowIndex = 0                                            # Initialize row index to zero, this will be incremented as we step through sub-arrays in outer array
+    for row in payload:                                     # For each row in the payload array (aka outer array)...               
+        columnIndex = 0                                     # Initialize a column index to zero, this will be incremented as we step through current sub-array (aka current row)                    
+        for cell in row:                                    # For each item in the row array (aka cell)...
+            worksheet.write(rowIndex, columnIndex, cell)    # Write data relative the appropriate row and column index
+            columnIndex += 1                                # Increment the column index so we move to next column and prepare to write to next cell during next pass
+        rowIndex += 1                                       # Increment the row index so we move to next line as we prepare to write next row
+
+    # Save file for persistence of changes
+    workbook.save(outputFile)
+
+# Helper function: convert a cell of a "number" column. Numeric text ("2,261", "608950") becomes a number, anything else is written as is.
+def _toNumberCell(cell):
+    if(isinstance(cell, str)):
+        try : return float(cell.replace(",", ""))
+        except ValueError : return cell
+    return cell
+
+# Helper function: convert a cell of a "string" column. Every value is written as text.
+def _toStringCell(cell):
+    if(cell == None):
+        return None
+    if(isinstance(cell, str)):
+        return cell
+    return str(cell)
+
+# Helper function: compile a column format spec against the title row. Returns (column index -> format properties, [ (column index, converter), ... ]).
+def _compileColumnFormats(columnFormats, titleRow):
+    formats = {}
+    converters = []
+    for column in columnFormats:
+        if(isinstance(column, int)):
+            columnIndex = column
+        elif(titleRow != None and column in titleRow):
+            columnIndex = titleRow.index(column)
+        else:
+            raise KeyError("Column '" + str(column) + "' is not in the title row")
+        spec = columnFormats[column]
+        if(isinstance(spec, str)):                 # just a number format string
+            spec = { "num_format" : spec }
+        properties = dict(spec)
+        columnType = properties.pop("type", None)
+        if(columnType == "number"):
+            converters.append((columnIndex, _toNumberCell))
+        elif(columnType == "string"):
+            converters.append((columnIndex, _toStringCell))
+        elif(columnType == "date"):
+            properties.setdefault("num_format", "yyyy-mm-dd")
+        elif(columnType != None):
+            raise ValueError("Unknown column type '" + str(columnType) + "', expected 'number', 'string' or 'date'")
+        formats[columnIndex] = properties
+    return formats, converters
+
+# This function is responsible for creating/opening an .xlsx file, writing every row from an iterable of row arrays to it, and closing the file. The rows are written
+#   in constant memory, rolling over to a new sheet whenever a sheet is full (see header). Note: "filepath" must include extention .xlsx
+#   - columnFormats (optional): column format spec (see header)
+#   - sheetName: name of the first sheet, later sheets are named "<sheetName> (2)", "<sheetName> (3)", ...
+#   - titleRow: 1 if the first row is a title row (it is repeated at the top of every sheet), 0 if every row is data
+#   - maxRowsPerSheet: the number of rows (title row included) written to a sheet before rolling over to the next one
+def write_xlsx_rows(filepath, rows, columnFormats=None, sheetName="Sheet", titleRow=1, maxRowsPerSheet=XLSX_MAX_ROWS):
+
+    # Check to ensure appropraite extention is included and the .xlsx module is installed
+    if (not filepath.lower().endswith('.xlsx')):
+        raise ValueError("File parameter must have .xlsx extention. Example 'output.xlsx', got '" + filepath + "'")
+    if (xlsxwriter == None):
+        raise ImportError("Writing .xlsx files requires the 'xlsxwriter' module. Install it with command 'pip install xlsxwriter'")
+    if (maxRowsPerSheet < 1 + titleRow or maxRowsPerSheet > XLSX_MAX_ROWS):
+        raise ValueError("maxRowsPerSheet must be between " + str(1 + titleRow) + " and " + str(XLSX_MAX_ROWS))
+
+    # XLSX: create a file for writing. constant_memory writes each row out as soon as the next row is started.
+    workbook = xlsxwriter.Workbook(filepath, { "constant_memory" : True, "nan_inf_to_errors" : True })
+    rows = iter(rows)
+
+    # Grab the title row (if there is one) so columns can be formatted by title and the title row can be repeated on every sheet
+    titleValues = None
+    if(titleRow == 1):
+        titleValues = next(rows, None)
+        if(titleValues != None):
+            titleValues = list(titleValues)
+
+    # Compile the column format spec once
+    formats = {}
+    converters = []
+    if(columnFormats != None):
+        properties, converters = _compileColumnFormats(columnFormats, titleValues)
+        for columnIndex in properties:
+            formats[columnIndex] = workbook.add_format(properties[columnIndex])
+
+    # Helper: add the next sheet, apply the column formats and write the title row. Returns the sheet and the index of its first data row.
+    sheetCount = [0]
+    def addSheet():
+        sheetCount[0] = sheetCount[0] + 1
+        name = sheetName
+        if(sheetCount[0] > 1):
+            suffix = " (" + str(sheetCount[0]) + ")"
+            name = sheetName[:31 - len(suffix)] + suffix    # sheet names are limited to 31 characters
+        worksheet = workbook.add_worksheet(name)
+        for columnIndex in formats:                         # a column's format applies to every cell written in the column
+            worksheet.set_column(columnIndex, columnIndex, None, formats[columnIndex])
+        if(titleValues != None):
+            worksheet.write_row(0, 0, titleValues)
+            return worksheet, 1
+        return worksheet, 0
+
+    # Write data from the rows into the spreadsheet, a whole row at a time
+    worksheet, rowIndex = addSheet()
+    for row in rows:
+        if(rowIndex == maxRowsPerSheet):                    # the sheet is full, roll over to a new sheet
+            worksheet, rowIndex = addSheet()
+        if(len(converters) > 0):
+            row = list(row)
+            for columnIndex, converter in converters:
+                if(columnIndex < len(row)):
+                    row[columnIndex] = converter(row[columnIndex])
+        worksheet.write_row(rowIndex, 0, row)
+        rowIndex += 1
+
+    # Save file for persistence of changes
+    workbook.close()
+
+# Test Code - unccomment lines below & run for testing
+# spreadsheet = [ ["r1-c1","r1-c2","r1-c3"], ["r2-c1","r2-c2","r2-c3"], ["r3-c1","r3-c2","r3-c3"] ]
+# push_excel_data("output.xls",spreadsheet) 
+# write_xlsx_rows("output.xlsx", ( [ "row " + str(i), i, i / 7 ] for i in range(100000) ), { 2 : "0.00%" }, titleRow=0, maxRowsPerSheet=40000) # 3 sheets
\ No newline at end of file